@@ -0,0 +1,217 @@
+import importlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from matching import evaluate_solution, initial_team_assignment, solve
+from parameter import MatchingConfig
+from seeding import make_rng, spawn_seeds
+
+
+def _warm_worker():
+    """
+    워커 프로세스가 시작될 때 한 번만 실행되어, 작업을 받기 전에 탐색 엔진 모듈(numpy 포함)을 불러옴
+    (모듈 로딩은 워커 시작 시 한 번만 일어나고 첫 작업의 실행 시간에 섞이지 않음, 이미 불러온 모듈은 다시 불러오지 않음)
+    설정별 인덱스는 MatchingConfig 가 생성 시 계산해서 작업과 함께 전달되므로 워커에서 따로 캐시하지 않음
+    """
+    for module in ("matching", "tempering", "tabu", "genetic"):
+        importlib.import_module(module)
+
+
+def _estimate_cost(participant_list: list[dict], waggings: list[dict]) -> int:
+    """
+    매칭 작업의 상대적인 실행 시간 추정값 (문제 변환과 평가 비용은 참가자 수와 꼬리흔들기 수에 비례)
+    """
+    return len(participant_list) + len(waggings or [])
+
+
+def _run_job(
+    job_id: int,
+    seed: int,
+    participant_list: list[dict],
+    waggings: list[dict],
+    config: MatchingConfig,
+    initial_method: str,
+    solver: str,
+    options: dict,
+) -> dict:
+    """
+    워커 프로세스에서 매칭 작업 하나(초기 매칭 + solve)를 실행
+
+    return:
+        - result = {
+            "job": 0,
+            "seed": 1234,
+            "initial_score": -80.5,
+            "score": -126.1,
+            "elapsed": 0.42,
+            "stats": {...},  # solve 의 stats
+            "team_ids": [[1, 5, 9, ...], [], ...]  # 팀별 참가자 id
+        }
+    """
+    rng = make_rng(seed)
+    start = time.perf_counter()
+    initial_teams = initial_team_assignment(
+        participant_list, waggings, method=initial_method, config=config, seed=rng
+    )
+    initial_score = evaluate_solution(initial_teams, waggings, config)
+    best_teams, best_score, stats = solve(
+        initial_teams,
+        waggings=waggings,
+        solver=solver,
+        config=config,
+        seed=rng,
+        **options,
+    )
+    return {
+        "job": job_id,
+        "seed": seed,
+        "initial_score": initial_score,
+        "score": best_score,
+        "elapsed": time.perf_counter() - start,
+        "stats": stats,
+        "team_ids": [[member["id"] for member in team] for team in best_teams],
+    }
+
+
+class MatchingPool:
+    """
+    여러 코호트(학교별, 트랙별 등)의 독립적인 매칭을 처리하는 워커 프로세스 풀
+    워커 프로세스는 풀을 닫을 때까지 유지되므로, run 을 여러 번 호출해도 모듈 로딩을 반복하지 않음
+
+    with MatchingPool(max_workers=4) as pool:
+        for result in pool.run(jobs):
+            ...
+
+    input:
+        - max_workers: 워커 프로세스 수 (기본값: CPU 수), 1 이면 현재 프로세스에서 실행
+    """
+
+    def __init__(self, max_workers: int = None):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        self.executor = (
+            ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_worker)
+            if max_workers > 1
+            else None
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def run(
+        self,
+        jobs: list[tuple],
+        seed: int = None,
+        initial_method: str = "greedy",
+        solver: str = "annealing",
+        **options,
+    ):
+        """
+        매칭 작업 목록을 실행 시간이 긴 것부터 워커에 배정하고, 끝나는 순서대로 결과를 반환하는 generator
+        (긴 작업을 먼저 시작해야 마지막에 긴 작업 하나만 남아서 기다리는 일이 줄어듦)
+
+        input:
+            - jobs = [
+                (participant_list, waggings, config),  # config 는 생략하거나 None 이면 DEFAULT_CONFIG
+                ...
+            ]
+            - seed: 작업별 시드를 만들 기준 시드 (같은 값이면 같은 시드 목록, seeding.spawn_seeds 참고)
+            - initial_method: 초기 매칭 방법 ("random" | "greedy")
+            - solver: 탐색 엔진 (matching.SOLVERS 참고)
+            - options: solve 에 전달할 인자 (time_limit, max_iterations 등, 모든 작업에 공통)
+
+        yield:
+            - result = {
+                "job": 0,                # jobs 에서의 위치
+                "seed": 1234,
+                "initial_score": -80.5,
+                "score": -126.1,
+                "elapsed": 0.42,
+                "stats": {...},          # solve 의 stats
+                "team_list": [[...], ...]  # 원본 참가자 dict 로 복원한 팀 매칭
+            }
+            작업이 실패하면 {"job": 0, "seed": 1234, "error": "..."} (다른 작업은 계속 진행)
+        """
+        # config 를 생략한 (participant_list, waggings) 작업도 허용
+        jobs = [(job[0], job[1], job[2] if len(job) > 2 else None) for job in jobs]
+        seeds = spawn_seeds(seed, len(jobs))
+        order = sorted(
+            range(len(jobs)),
+            key=lambda job_id: -_estimate_cost(jobs[job_id][0], jobs[job_id][1]),
+        )
+        args = {
+            job_id: (
+                job_id,
+                seeds[job_id],
+                *jobs[job_id],
+                initial_method,
+                solver,
+                options,
+            )
+            for job_id in order
+        }
+
+        if self.executor is None:
+            results = (self._collect(args[job_id], None) for job_id in order)
+        else:
+            futures = {
+                self.executor.submit(_run_job, *args[job_id]): job_id
+                for job_id in order
+            }
+            results = (
+                self._collect(args[futures[future]], future)
+                for future in as_completed(futures)
+            )
+
+        for result in results:
+            if "team_ids" in result:
+                # 워커에서는 참가자 id 만 돌려받고 원본 참가자 dict 로 복원
+                participant_by_id = {
+                    participant["id"]: participant
+                    for participant in jobs[result["job"]][0]
+                }
+                result["team_list"] = [
+                    [participant_by_id[member_id] for member_id in team]
+                    for team in result.pop("team_ids")
+                ]
+            yield result
+
+    @staticmethod
+    def _collect(args: tuple, future) -> dict:
+        """
+        작업 결과를 반환하고, 실패한 작업은 오류 내용으로 대신함
+        """
+        try:
+            return _run_job(*args) if future is None else future.result()
+        except Exception as error:
+            return {"job": args[0], "seed": args[1], "error": repr(error)}
+
+
+def batch_match(jobs: list[tuple], max_workers: int = None, **run_kwargs):
+    """
+    여러 코호트의 매칭 작업을 한 번 실행하는 단축 함수 (MatchingPool 을 만들고 run 의 결과를 그대로 반환)
+    같은 프로세스에서 여러 번 실행한다면 MatchingPool 을 직접 만들어 재사용
+
+    input:
+        - jobs: MatchingPool.run 과 동일
+        - max_workers: 워커 프로세스 수 (기본값: min(작업 수, CPU 수))
+        - run_kwargs: MatchingPool.run 에 전달할 인자 (seed, solver, max_iterations 등)
+
+    yield:
+        - result: MatchingPool.run 과 동일 (끝나는 순서대로)
+    """
+    jobs = list(jobs)
+    if max_workers is None:
+        max_workers = max(1, min(len(jobs), os.cpu_count() or 1))
+    with MatchingPool(max_workers) as pool:
+        yield from pool.run(jobs, **run_kwargs)
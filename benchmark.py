@@ -0,0 +1,316 @@
+import argparse
+import time
+
+from matching import (
+    evaluate_solution,
+    neighbor_solution,
+    random_team_assignment,
+    solve,
+)
+from parameter import DEFAULT_CONFIG, MatchingConfig
+from synthetic import generate_cohort
+
+
+def _get_team_count(
+    participant_list: list[dict], team_size: int, config: MatchingConfig = None
+) -> int:
+    """
+    한 팀이 대략 team_size 명이 되도록 하는 팀 수 (파트별 최소 인원수를 만족하는 범위 안에서)
+    """
+    config = config or DEFAULT_CONFIG
+    part_total = {part: 0 for part in config.part_min}
+    for participant in participant_list:
+        if participant["part"] in part_total:
+            part_total[participant["part"]] += 1
+
+    # 최소 인원수가 있는 파트가 없으면 팀 수는 참가자 수로만 제한됨
+    team_max = min(
+        (
+            part_total[part] // min_cnt
+            for part, min_cnt in config.part_min.items()
+            if min_cnt > 0
+        ),
+        default=len(participant_list),
+    )
+    return max(1, min(len(participant_list) // team_size, team_max))
+
+
+def _time_call(func, repeat: int) -> float:
+    """
+    func 를 repeat 번 호출했을 때의 1회 평균 실행 시간 (초)
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def run_benchmark(
+    sizes=(40, 400, 4000, 50000),
+    seed: int = 0,
+    team_size: int = 6,
+    repeat: int = 5,
+    max_iterations: int = 10000,
+    cooling_rate: float = 0.995,
+    solvers=("annealing",),
+    time_limit: float = None,
+    exact_scoring: bool = False,
+    **wagging_kwargs,
+) -> list[dict]:
+    """
+    참가자 수별로 가상 데이터를 생성해서 매칭 단계별 실행 시간과 탐색 엔진별 최종 점수를 측정
+
+    input:
+        - sizes: 측정할 참가자 수 목록
+        - seed: 데이터 생성과 매칭에 사용할 난수 시드
+        - team_size: 한 팀의 목표 인원수 (팀 수 = 참가자 수 / team_size)
+        - repeat: random_team_assignment / evaluate_solution / neighbor_solution 반복 측정 횟수
+        - max_iterations, cooling_rate: annealing 엔진에 전달할 값
+        - solvers: 비교할 탐색 엔진 이름 목록 (matching.SOLVERS)
+        - time_limit: 엔진마다의 실행 시간 제한 (초), 같은 시간 안에서의 품질을 비교할 때 사용
+        - exact_scoring: 반올림하지 않은 점수로 평가/탐색 (MatchingConfig.exact_scoring)
+        - wagging_kwargs: generate_waggings 에 전달할 값 (min_wags, max_wags, reciprocity)
+
+    return:
+        - results = [  # 참가자 수 x 탐색 엔진마다 하나씩
+            {
+                "participants": 40,
+                "solver": "annealing",
+                "waggings": 172,
+                "teams": 6,
+                "random_assignment_sec": 0.0001,
+                "evaluate_sec": 0.0004,
+                "neighbor_sec": 0.00005,
+                "solve_sec": 0.21,
+                "iterations_per_sec": 6500.0,  # 엔진의 반복(세대) 수 / 실행 시간
+                "initial_score": 834.0,
+                "final_score": -126.1
+            },
+            {result},
+            ...
+        ]
+    """
+    config = DEFAULT_CONFIG.replace(exact_scoring=exact_scoring)
+    results = []
+    for size in sizes:
+        participant_list, waggings = generate_cohort(size, seed=seed, **wagging_kwargs)
+        team_count = _get_team_count(participant_list, team_size)
+
+        random_sec = _time_call(
+            lambda: random_team_assignment(participant_list, team_count), repeat
+        )
+        initial_teams = random_team_assignment(participant_list, team_count, seed=seed)
+        evaluate_sec = _time_call(
+            lambda: evaluate_solution(initial_teams, waggings, config), repeat
+        )
+        neighbor_sec = _time_call(lambda: neighbor_solution(initial_teams), repeat)
+        initial_score = evaluate_solution(initial_teams, waggings, config)
+
+        for solver in solvers:
+            options = (
+                {"max_iterations": max_iterations, "cooling_rate": cooling_rate}
+                if solver == "annealing"
+                else {}
+            )
+            _, final_score, stats = solve(
+                initial_teams,
+                waggings=waggings,
+                solver=solver,
+                time_limit=time_limit,
+                config=config,
+                seed=seed,
+                **options,
+            )
+            iterations = stats.get("iterations", stats.get("generations", 0))
+
+            results.append(
+                {
+                    "participants": size,
+                    "solver": solver,
+                    "waggings": len(waggings),
+                    "teams": team_count,
+                    "random_assignment_sec": random_sec,
+                    "evaluate_sec": evaluate_sec,
+                    "neighbor_sec": neighbor_sec,
+                    "solve_sec": stats["elapsed"],
+                    "iterations_per_sec": iterations / stats["elapsed"],
+                    "initial_score": initial_score,
+                    "final_score": final_score,
+                }
+            )
+    return results
+
+
+def run_target_comparison(
+    sizes=(400, 4000),
+    seed: int = 0,
+    team_size: int = 6,
+    solvers=("annealing", "batched_annealing", "tempering", "tabu"),
+    target_iterations: int = 50000,
+    max_iterations: int = 400000,
+    time_limit: float = 60.0,
+    exact_scoring: bool = False,
+    **wagging_kwargs,
+) -> list[dict]:
+    """
+    target_iterations 번 동안 온도 하한까지 냉각하는 simulated annealing 이 도달한 점수를 목표 점수로 두고,
+    엔진마다 목표 점수에 도달하기까지 계산한 교환 후보 수(evaluations)와 시간을 측정
+    (annealing / batched_annealing 은 같은 냉각 속도를 사용)
+
+    input:
+        - sizes, seed, team_size, exact_scoring, wagging_kwargs: run_benchmark 와 동일
+        - solvers: 비교할 탐색 엔진 이름 목록 (stats 에 evaluations 를 반환하는 엔진)
+        - target_iterations: 목표 점수를 정하는 simulated annealing 의 냉각 반복 횟수
+        - max_iterations, time_limit: 목표에 도달하지 못했을 때 멈추는 조건 (annealing 계열 제외)
+
+    return:
+        - results = [
+            {
+                "participants": 400,
+                "solver": "tempering",
+                "target_score": 2639.4,
+                "reached": True,
+                "evaluations": 52000,
+                "solve_sec": 1.3,
+                "final_score": 2637.9
+            },
+            ...
+        ]
+    """
+    config = DEFAULT_CONFIG.replace(exact_scoring=exact_scoring)
+    # 기본 온도 범위(1.0 -> 0.001)를 target_iterations 번에 걸쳐 내려가는 냉각 속도
+    annealing_options = {
+        "cooling_rate": 0.001 ** (1 / target_iterations),
+        "max_iterations": 2 * target_iterations,
+    }
+    results = []
+    for size in sizes:
+        participant_list, waggings = generate_cohort(size, seed=seed, **wagging_kwargs)
+        team_count = _get_team_count(participant_list, team_size)
+        initial_teams = random_team_assignment(participant_list, team_count, seed=seed)
+
+        _, target_score, _ = solve(
+            initial_teams,
+            waggings=waggings,
+            config=config,
+            seed=seed,
+            **annealing_options,
+        )
+
+        for solver in solvers:
+            options = (
+                annealing_options
+                if solver in ("annealing", "batched_annealing")
+                else {"max_iterations": max_iterations}
+            )
+            _, final_score, stats = solve(
+                initial_teams,
+                waggings=waggings,
+                solver=solver,
+                time_limit=time_limit,
+                config=config,
+                seed=seed,
+                target_score=target_score,
+                **options,
+            )
+            results.append(
+                {
+                    "participants": size,
+                    "solver": solver,
+                    "target_score": target_score,
+                    "reached": final_score <= target_score,
+                    "evaluations": stats["evaluations"],
+                    "solve_sec": stats["elapsed"],
+                    "final_score": final_score,
+                }
+            )
+    return results
+
+
+def _print_target_results(results: list[dict]):
+    print("참가자 | 엔진 | 목표 점수 | 도달 | 평가 횟수 | 탐색(s) | 최종 점수")
+    for result in results:
+        print(
+            f"{result['participants']:d} | {result['solver']} | {result['target_score']:.2f} | "
+            f"{'O' if result['reached'] else 'X'} | {result['evaluations']:d} | "
+            f"{result['solve_sec']:.2f} | {result['final_score']:.2f}"
+        )
+
+
+def _print_results(results: list[dict]):
+    # (결과 키, 제목, 출력 형식, 곱할 값)
+    columns = [
+        ("participants", "참가자", "{:d}", 1),
+        ("solver", "엔진", "{}", 1),
+        ("teams", "팀", "{:d}", 1),
+        ("waggings", "꼬리흔들기", "{:d}", 1),
+        ("random_assignment_sec", "랜덤 매칭(ms)", "{:.2f}", 1000),
+        ("evaluate_sec", "평가(ms)", "{:.2f}", 1000),
+        ("neighbor_sec", "이웃 생성(ms)", "{:.2f}", 1000),
+        ("solve_sec", "탐색(s)", "{:.2f}", 1),
+        ("iterations_per_sec", "반복/s", "{:.0f}", 1),
+        ("initial_score", "초기 점수", "{:.2f}", 1),
+        ("final_score", "최종 점수", "{:.2f}", 1),
+    ]
+    print(" | ".join(title for _, title, _, _ in columns))
+    for result in results:
+        print(
+            " | ".join(
+                fmt.format(result[key] * scale) for key, _, fmt, scale in columns
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="팀 매칭 알고리즘 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[40, 400, 4000, 50000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--team-size", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-iterations", type=int, default=10000)
+    parser.add_argument("--cooling-rate", type=float, default=0.995)
+    parser.add_argument("--solvers", nargs="+", default=["annealing"])
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--exact-scoring", action="store_true")
+    parser.add_argument("--min-wags", type=int, default=3)
+    parser.add_argument("--max-wags", type=int, default=6)
+    parser.add_argument("--reciprocity", type=float, default=0.1)
+    parser.add_argument(
+        "--target",
+        action="store_true",
+        help="simulated annealing 의 점수에 도달하기까지의 평가 횟수를 --solvers 엔진별로 비교",
+    )
+    args = parser.parse_args()
+
+    if args.target:
+        _print_target_results(
+            run_target_comparison(
+                sizes=args.sizes,
+                seed=args.seed,
+                team_size=args.team_size,
+                solvers=args.solvers,
+                time_limit=args.time_limit,
+                exact_scoring=args.exact_scoring,
+                min_wags=args.min_wags,
+                max_wags=args.max_wags,
+                reciprocity=args.reciprocity,
+            )
+        )
+        raise SystemExit
+
+    _print_results(
+        run_benchmark(
+            sizes=args.sizes,
+            seed=args.seed,
+            team_size=args.team_size,
+            repeat=args.repeat,
+            max_iterations=args.max_iterations,
+            cooling_rate=args.cooling_rate,
+            solvers=args.solvers,
+            time_limit=args.time_limit,
+            exact_scoring=args.exact_scoring,
+            min_wags=args.min_wags,
+            max_wags=args.max_wags,
+            reciprocity=args.reciprocity,
+        )
+    )
@@ -0,0 +1,58 @@
+import time
+
+
+class SearchBudget:
+    """
+    탐색 종료 조건 (시간 제한 / 개선 정체 / 목표 점수)
+    반복 횟수와 무관하게 정해진 시간 안에 결과를 반환하거나, best 점수가 한동안 개선되지 않으면
+    탐색을 일찍 멈추기 위해 사용함. 멈추더라도 그 시점까지의 best 해를 그대로 반환하면 됨
+
+    input:
+        - time_limit: 최대 실행 시간 (초), None 이면 제한 없음
+        - patience: best 점수가 개선되지 않은 채로 허용할 반복 횟수, None 이면 제한 없음
+        - target_score: best 점수가 이 값 이하가 되면 종료, None 이면 제한 없음
+          (엔진끼리 같은 점수에 도달하기까지의 평가 횟수를 비교할 때 사용)
+    """
+
+    def __init__(
+        self, time_limit: float = None, patience: int = None, target_score: float = None
+    ):
+        if time_limit is not None and time_limit < 0:
+            raise ValueError("시간 제한은 0 이상이어야 합니다.")
+        if patience is not None and patience < 1:
+            raise ValueError("patience 는 1 이상이어야 합니다.")
+
+        self.start = time.perf_counter()
+        self.deadline = None if time_limit is None else self.start + time_limit
+        self.patience = patience
+        self.target_score = target_score
+        self.last_improvement = 0
+        self.best_score = None
+
+    def improved(self, iteration: int, score: float = None):
+        """
+        best 점수가 개선된 반복 번호(와 개선된 점수)를 기록
+        """
+        self.last_improvement = iteration
+        if score is not None:
+            self.best_score = score
+
+    def exhausted(self, iteration: int) -> bool:
+        """
+        시간 제한을 넘었거나 patience 동안 개선이 없었으면 True
+        """
+        if (
+            self.patience is not None
+            and iteration - self.last_improvement >= self.patience
+        ):
+            return True
+        if (
+            self.target_score is not None
+            and self.best_score is not None
+            and self.best_score <= self.target_score
+        ):
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
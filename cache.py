@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+from parameter import DEFAULT_CONFIG, MatchingConfig
+
+# 저장된 결과가 없음을 나타내는 값 (None 도 결과로 저장할 수 있으므로 따로 둠)
+_MISSING = object()
+
+
+def matching_key(
+    participant_list: list[dict],
+    waggings: list[dict] = None,
+    config: MatchingConfig = None,
+    seed: int = None,
+    **params,
+) -> str:
+    """
+    매칭 입력 전체로부터 만든 고정 해시 (같은 입력이면 프로세스 / 실행 순서와 무관하게 같은 값)
+    dict 의 키 순서와 공백에 영향을 받지 않도록 키를 정렬한 JSON 으로 직렬화한 뒤 sha256 을 계산함
+
+    input:
+        - participant_list: 참가자 목록
+        - waggings: 꼬리흔들기 목록
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+        - seed: 난수 시드
+        - params: 결과에 영향을 주는 그 밖의 값 (initial_method, solver, time_limit 등)
+
+    return:
+        - key: 64자리 16진수 문자열
+    """
+    payload = {
+        "participants": participant_list,
+        "waggings": waggings or [],
+        "config": (config or DEFAULT_CONFIG).as_dict(),
+        "seed": seed,
+        "params": params,
+    }
+    encoded = json.dumps(
+        payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    matching_key 로 찾는 매칭 결과 캐시 (메모리 LRU + 디스크)
+
+    - 메모리: 최근에 사용한 결과부터 유지하고, 직렬화한 크기의 합이 max_memory_bytes 를 넘으면
+      가장 오래 사용하지 않은 결과부터 제거
+    - 디스크: directory/키 앞 2자리/키.pkl 에 저장해서 프로세스를 다시 시작해도 유지
+      (임시 파일에 쓴 뒤 이름을 바꾸므로 쓰는 도중의 파일을 읽지 않음)
+    - 결과는 pickle 로 저장하므로 LLM 응답(pydantic 모델)도 그대로 저장 가능
+
+    여러 세션에서 동시에 사용할 수 있도록 메모리 캐시는 잠금으로 보호함
+
+    input:
+        - directory: 디스크 캐시 경로, None 이면 메모리만 사용
+        - max_memory_bytes: 메모리 캐시의 최대 크기 (바이트)
+    """
+
+    def __init__(
+        self,
+        directory: str = ".matching_cache",
+        max_memory_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.memory = OrderedDict()  # 키 -> 직렬화한 결과 (마지막이 가장 최근에 사용)
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pkl")
+
+    def _remember(self, key: str, data: bytes):
+        """
+        메모리 캐시에 추가하고 크기 제한을 넘는 만큼 오래된 결과를 제거 (잠금을 잡은 상태에서 호출)
+        """
+        if key in self.memory:
+            self.memory_bytes -= len(self.memory.pop(key))
+        if len(data) > self.max_memory_bytes:
+            return  # 제한보다 큰 결과는 디스크에만 저장
+        self.memory[key] = data
+        self.memory_bytes += len(data)
+        while self.memory_bytes > self.max_memory_bytes:
+            _, evicted = self.memory.popitem(last=False)
+            self.memory_bytes -= len(evicted)
+
+    def get(self, key: str, default=None):
+        """
+        저장된 결과를 반환 (없으면 default)
+        """
+        with self._lock:
+            data = self.memory.get(key)
+            if data is not None:
+                self.memory.move_to_end(key)
+
+        if data is None and self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                pass
+            else:
+                with self._lock:
+                    self._remember(key, data)
+
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return pickle.loads(data)
+
+    def put(self, key: str, value):
+        """
+        결과를 메모리와 디스크에 저장
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, data)
+
+        if self.directory is not None:
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+
+    def get_or_compute(self, key: str, compute):
+        """
+        저장된 결과가 있으면 반환하고, 없으면 compute() 를 실행해서 저장한 뒤 반환
+
+        return:
+            - value: 결과
+            - hit: 저장된 결과를 사용했는지 여부
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value, True
+        value = compute()
+        self.put(key, value)
+        return value, False
+
+    def clear(self):
+        """
+        메모리 캐시를 비움 (디스크에 저장된 결과는 유지)
+        """
+        with self._lock:
+            self.memory.clear()
+            self.memory_bytes = 0
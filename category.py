@@ -1,10 +1,14 @@
 # TODO: 팀원들간의 카테고리 데이터 유사도를 구해야함. 현재는 팀의 카테고리 단순 통계를 활용 중.
 
 from math import log
-from parameter import CATEGORY
+from parameter import DEFAULT_CONFIG, MatchingConfig
 
 
-def get_category_score(team_list: list[list[dict]]) -> list[dict]:
+def get_category_score(
+    team_list: list[list[dict]],
+    category_weight: dict[dict] = None,
+    config: MatchingConfig = None,
+) -> list[dict]:
     """
     모든 팀의 카테고리 데이터 점수를 반환
 
@@ -20,10 +24,17 @@ def get_category_score(team_list: list[list[dict]]) -> list[dict]:
             ...
         ]
 
+        - category_weight: 미리 계산한 카테고리 가중치 (없으면 team_list 로부터 계산)
+            참가자 구성에만 의존하는 값이므로 같은 참가자들의 매칭을 여러 번 평가할 때 재사용
+
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+
     return:
         - category_score = [0.45, 0.88]
     """
-    category_weight = _get_category_weight(team_list)
+    config = config or DEFAULT_CONFIG
+    if category_weight is None:
+        category_weight = _get_category_weight(team_list, config)
     weight_list = []
     for value_dict in category_weight.values():
         weight_list.extend(value_dict.values())
@@ -32,7 +43,7 @@ def get_category_score(team_list: list[list[dict]]) -> list[dict]:
     category_score = []
 
     for team in team_list:
-        team_similarity = _get_team_category_rate(team)
+        team_similarity = _get_team_category_rate(team, config)
         team_score = 0
 
         for key, values in team_similarity.items():
@@ -43,13 +54,18 @@ def get_category_score(team_list: list[list[dict]]) -> list[dict]:
             weight = category_weight[key][most_frequent_value]
             score = rate * weight
             team_score += score
-        team_score = round(team_score / len(team_similarity) / max_weight, 2) * 100
+        team_score = team_score / len(team_similarity) / max_weight
+        if not config.exact_scoring:
+            team_score = round(team_score, 2)
+        team_score *= 100
         category_score.append(team_score)
 
     return category_score
 
 
-def _get_team_category_rate(member_list: list[dict]) -> dict[dict]:
+def _get_team_category_rate(
+    member_list: list[dict], config: MatchingConfig = None
+) -> dict[dict]:
     """
     한 팀의 카테고리 데이터의 비율을 반환
 
@@ -60,6 +76,8 @@ def _get_team_category_rate(member_list: list[dict]) -> dict[dict]:
             ...
         ]
 
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+
     Returns:
         - similarity = {
             "team_vibe": {"learning": 0.65, "professional": 0.35},
@@ -68,14 +86,17 @@ def _get_team_category_rate(member_list: list[dict]) -> dict[dict]:
         }
     """
 
+    config = config or DEFAULT_CONFIG
+    category = config.category
+
     # 카테고리 개수를 저장할 딕셔너리
     team_category_count = {
-        key: {value: 0 for value in values} for key, values in CATEGORY.items()
+        key: {value: 0 for value in values} for key, values in category.items()
     }
 
     # team _category_count 업데이트
     for member in member_list:
-        for category_key in CATEGORY:
+        for category_key in category:
             team_category_count[category_key][member[category_key]] += 1
 
     # 각 카테고리의 유사도를 저장 (카테고리가 일치하는 사람의 비율)
@@ -85,14 +106,15 @@ def _get_team_category_rate(member_list: list[dict]) -> dict[dict]:
         value_total = sum(team_category_count[key][value] for value in values)
 
         for value in values:
-            similarity[key][value] = round(
-                team_category_count[key][value] / value_total, 2
-            )
+            rate = team_category_count[key][value] / value_total
+            similarity[key][value] = rate if config.exact_scoring else round(rate, 2)
 
     return similarity
 
 
-def _get_category_weight(team_list: list[list[dict]]) -> dict[dict]:
+def _get_category_weight(
+    team_list: list[list[dict]], config: MatchingConfig = None
+) -> dict[dict]:
     """
     카테고리 데이터의 가중치 정보를 담은 딕셔너리를 반환
 
@@ -108,19 +130,24 @@ def _get_category_weight(team_list: list[list[dict]]) -> dict[dict]:
             ...
         ]
 
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+
     return:
         - category_weight = {
             team_vibe: {learning: 0.82, professional: 0.18},
             active_hours: {},
         }
     """
+    config = config or DEFAULT_CONFIG
+    category = config.category
+
     # 카테고리 통계
     category_count = {
-        key: {value: 0 for value in values} for key, values in CATEGORY.items()
+        key: {value: 0 for value in values} for key, values in category.items()
     }
     for team in team_list:
         for member in team:
-            for key in CATEGORY:
+            for key in category:
                 category_count[key][member[key]] += 1
 
     # 카테고리별 가중치 계산
@@ -137,8 +164,9 @@ def _get_category_weight(team_list: list[list[dict]]) -> dict[dict]:
             if category_count[key][value] == participant_count:
                 category_weight[key][value] = 1
             else:
-                category_weight[key][value] = round(
-                    -log(category_count[key][value] / value_total), 2
+                weight = -log(category_count[key][value] / value_total)
+                category_weight[key][value] = (
+                    weight if config.exact_scoring else round(weight, 2)
                 )
 
     return category_weight
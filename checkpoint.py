@@ -0,0 +1,38 @@
+import gzip
+import os
+import pickle
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path: str, state: dict):
+    """
+    탐색 상태를 gzip 으로 압축한 pickle 파일로 저장
+    임시 파일에 쓴 뒤 이름을 바꾸므로, 저장 도중에 프로세스가 종료되어도 이전 체크포인트가 남음
+
+    input:
+        - path: 체크포인트 파일 경로
+        - state: 탐색 상태 (matching.annealing_search 참고, 팀 번호 등은 numpy 배열)
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(temp_path, "wb", compresslevel=1) as f:
+        pickle.dump(
+            {"version": CHECKPOINT_VERSION, **state},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path: str) -> dict:
+    """
+    save_checkpoint 로 저장한 탐색 상태를 반환
+    """
+    with gzip.open(path, "rb") as f:
+        state = pickle.load(f)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"지원하지 않는 체크포인트 형식입니다: {path}")
+    return state
@@ -0,0 +1,149 @@
+from itertools import combinations
+
+from parameter import DEFAULT_CONFIG, MatchingConfig
+
+
+class ConstraintIndex:
+    """
+    반드시 같은 팀 / 반드시 다른 팀이어야 하는 참가자 제약을 참가자 번호 기준으로 한 번만 변환해 둔 인덱스
+    탐색 중에는 제약을 어기는 상태를 만들지 않도록, 이동마다 O(1) 로 확인할 수 있는 형태로 저장함
+
+    - group_of: 참가자 번호 -> 함께 배정해야 하는 묶음 번호 (-1 이면 묶음 없음)
+      묶음에 속한 참가자는 초기 매칭에서 한 팀에 배정한 뒤 교환 대상에서 제외함
+    - groups: 묶음별 참가자 번호 목록 (together 를 합쳐서 만든 연결 요소)
+    - apart_mask: 참가자 번호 -> 떨어뜨려야 하는 쌍의 비트마스크 (쌍마다 비트 하나를 두 참가자에게 함께 설정)
+      팀 안에서는 쌍의 두 참가자가 함께 있을 수 없으므로 팀원 마스크의 XOR 이 곧 팀 마스크가 되고,
+      참가자가 팀에 들어갈 수 있는지는 (참가자 마스크 & 팀 마스크) == 0 으로 확인함
+      떨어뜨려야 하는 쌍이 없으면 None
+    - apart_of: 참가자 번호 -> 떨어뜨려야 하는 참가자 번호 목록 (위반 내용을 보여줄 때 사용)
+
+    input:
+        - together = [[1, 2], [3, 4, 5], ...] 같은 팀이어야 하는 참가자 id 묶음
+        - apart = [[6, 7], ...] 서로 다른 팀이어야 하는 참가자 id 묶음 (묶음 안의 모든 쌍)
+        - participant_ids = [1, 2, 3, ...] 참가자 번호 순서의 참가자 id 목록
+          (목록에 없는 참가자가 포함된 제약은 그 참가자를 빼고 적용)
+    """
+
+    def __init__(
+        self,
+        together: list[list[int]],
+        apart: list[list[int]],
+        participant_ids: list[int],
+    ):
+        self.ids = list(participant_ids)
+        index = {participant_id: idx for idx, participant_id in enumerate(self.ids)}
+        participant_count = len(self.ids)
+
+        # 같은 팀 제약: 서로소 집합으로 묶음을 합침
+        parent = list(range(participant_count))
+
+        def find(idx):
+            while parent[idx] != idx:
+                parent[idx] = parent[parent[idx]]
+                idx = parent[idx]
+            return idx
+
+        linked = set()
+        for id_list in together or []:
+            members = [index[pid] for pid in id_list if pid in index]
+            for idx in members[1:]:
+                parent[find(idx)] = find(members[0])
+            if len(members) >= 2:
+                linked.update(members)
+
+        groups = {}
+        for idx in sorted(linked):
+            groups.setdefault(find(idx), []).append(idx)
+        self.groups = list(groups.values())
+        self.group_of = [-1] * participant_count
+        for group_id, members in enumerate(self.groups):
+            for idx in members:
+                self.group_of[idx] = group_id
+
+        # 다른 팀 제약: 쌍마다 비트 하나
+        pairs = {
+            tuple(sorted(pair))
+            for id_list in apart or []
+            for pair in combinations(
+                dict.fromkeys(index[pid] for pid in id_list if pid in index), 2
+            )
+        }
+        self.apart_of = [[] for _ in range(participant_count)]
+        mask = [0] * participant_count
+        for bit, (idx_a, idx_b) in enumerate(sorted(pairs)):
+            if (
+                self.group_of[idx_a] >= 0
+                and self.group_of[idx_a] == self.group_of[idx_b]
+            ):
+                raise ValueError(
+                    f"같은 팀이어야 하는 참가자({self.ids[idx_a]}, {self.ids[idx_b]})를 떨어뜨리는 제약이 있습니다."
+                )
+            mask[idx_a] |= 1 << bit
+            mask[idx_b] |= 1 << bit
+            self.apart_of[idx_a].append(idx_b)
+            self.apart_of[idx_b].append(idx_a)
+        self.apart_mask = mask if pairs else None
+
+    def __bool__(self) -> bool:
+        return bool(self.groups) or self.apart_mask is not None
+
+    def is_constrained(self, idx: int) -> bool:
+        """
+        idx 번 참가자에게 걸린 제약이 있는지 여부
+        """
+        return self.group_of[idx] >= 0 or (
+            self.apart_mask is not None and self.apart_mask[idx] != 0
+        )
+
+    def team_masks(self, team_of: list[int], team_count: int = None) -> list[int]:
+        """
+        팀별 팀원 비트마스크 (떨어뜨려야 하는 쌍이 없으면 None)
+        """
+        if self.apart_mask is None:
+            return None
+        if team_count is None:
+            team_count = max(team_of, default=-1) + 1
+        masks = [0] * team_count
+        for idx, team_idx in enumerate(team_of):
+            masks[team_idx] ^= self.apart_mask[idx]
+        return masks
+
+    def violations(self, team_of: list[int]) -> list[tuple]:
+        """
+        팀 번호 목록이 어기는 제약 목록
+
+        return:
+            - violations = [("together", 1, 2), ("apart", 6, 7), ...] (참가자 id)
+        """
+        team_of = list(team_of)
+        result = []
+        for members in self.groups:
+            for idx in members[1:]:
+                if team_of[idx] != team_of[members[0]]:
+                    result.append(("together", self.ids[members[0]], self.ids[idx]))
+        for idx_a, others in enumerate(self.apart_of):
+            for idx_b in others:
+                if idx_a < idx_b and team_of[idx_a] == team_of[idx_b]:
+                    result.append(("apart", self.ids[idx_a], self.ids[idx_b]))
+        return result
+
+    def check(self, team_of: list[int]):
+        """
+        제약을 어기는 팀 매칭이면 ValueError (탐색은 제약을 지키는 상태에서만 시작할 수 있음)
+        """
+        violations = self.violations(team_of)
+        if violations:
+            raise ValueError(
+                f"팀 매칭이 제약 조건을 지키지 않습니다: {violations[:5]}"
+                + (f" 외 {len(violations) - 5}건" if len(violations) > 5 else "")
+            )
+
+
+def compile_constraints(
+    participant_ids: list[int], config: MatchingConfig = None
+) -> ConstraintIndex:
+    """
+    config.together / config.apart 로부터 ConstraintIndex 를 생성 (매칭 한 번에 한 번만 호출)
+    """
+    config = config or DEFAULT_CONFIG
+    return ConstraintIndex(config.together, config.apart, participant_ids)
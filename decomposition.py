@@ -0,0 +1,467 @@
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from evaluator import IncrementalEvaluator
+from matching import _get_team_template, initial_team_assignment, solve
+from moves import SwapMove
+from parameter import DEFAULT_CONFIG, MatchingConfig
+from problem import MatchingProblem
+from seeding import make_rng, spawn_seeds
+
+
+def _wagging_neighbors(
+    participant_list: list[dict], waggings: list[dict]
+) -> list[list[int]]:
+    """
+    참가자 번호별로 꼬리흔들기 관계(양방향)가 있는 참가자 번호 목록 (맞꼬리흔들기는 두 번 포함)
+    """
+    index = {participant["id"]: idx for idx, participant in enumerate(participant_list)}
+    neighbors = [[] for _ in participant_list]
+    for wagging in waggings or []:
+        wagger, waggee = index.get(wagging["wagger"]), index.get(wagging["waggee"])
+        if wagger is not None and waggee is not None:
+            neighbors[wagger].append(waggee)
+            neighbors[waggee].append(wagger)
+    return neighbors
+
+
+def _locality_order(
+    participant_list: list[dict], neighbors: list[list[int]], config: MatchingConfig
+) -> list[int]:
+    """
+    꼬리흔들기 관계가 있는 참가자끼리, 카테고리 값이 같은 참가자끼리 가깝게 놓이도록 정렬한 참가자 번호 목록
+
+    카테고리 값 순서로 정렬한 참가자를 시작점으로 꼬리흔들기 그래프(양방향)를 너비 우선 탐색하고,
+    이웃도 카테고리 값 순서로 방문함
+    """
+    category_key = [
+        tuple(
+            category_index.get(participant.get(key), -1)
+            for key, category_index in zip(config.category_keys, config.category_index)
+        )
+        for participant in participant_list
+    ]
+
+    order = []
+    visited = [False] * len(participant_list)
+    for root in sorted(range(len(participant_list)), key=category_key.__getitem__):
+        if visited[root]:
+            continue
+        visited[root] = True
+        queue = deque([root])
+        while queue:
+            idx = queue.popleft()
+            order.append(idx)
+            for other in sorted(neighbors[idx], key=category_key.__getitem__):
+                if not visited[other]:
+                    visited[other] = True
+                    queue.append(other)
+    return order
+
+
+def _refine_partition(
+    cluster_of: list[int],
+    part_of: list,
+    neighbors: list[list[int]],
+    rounds: int,
+) -> int:
+    """
+    같은 파트 참가자끼리 클러스터를 맞바꾸어 클러스터 사이에 걸친 꼬리흔들기 수를 줄임 (cluster_of 를 직접 수정)
+    같은 파트끼리만 맞바꾸므로 클러스터별 파트 인원수(파트별 최소 인원수)는 그대로 유지됨
+
+    라운드마다 꼬리흔들기 이웃이 가장 많은 다른 클러스터로 옮기면 이득인 참가자를 이득이 큰 순서로 훑고,
+    옮길 클러스터의 같은 파트 참가자 중 반대로 옮겼을 때 손해가 가장 적은 사람과의 교환을
+    두 사람의 이득 합이 양수일 때만 채택 (교환마다 현재 상태로 다시 계산하므로 걸친 꼬리흔들기 수는 늘지 않음)
+
+    return:
+        - gained: 줄어든 클러스터 사이 꼬리흔들기 수
+    """
+
+    def gain(idx: int, target: int) -> int:
+        # idx 를 target 클러스터로 옮길 때 줄어드는 클러스터 사이 꼬리흔들기 수
+        own = cluster_of[idx]
+        return sum(
+            (cluster_of[other] == target) - (cluster_of[other] == own)
+            for other in neighbors[idx]
+        )
+
+    # (클러스터, 파트) 별 참가자 번호 (교환 상대 후보)
+    members = {}
+    for idx, cluster_id in enumerate(cluster_of):
+        if cluster_id >= 0:
+            members.setdefault((cluster_id, part_of[idx]), set()).add(idx)
+
+    gained = 0
+    for _ in range(rounds):
+        movers = []
+        for idx, others in enumerate(neighbors):
+            own = cluster_of[idx]
+            if own < 0 or not others:
+                continue
+            count = {}
+            for other in others:
+                if cluster_of[other] >= 0:
+                    count[cluster_of[other]] = count.get(cluster_of[other], 0) + 1
+            target = max(count, key=count.get)
+            if count[target] > count.get(own, 0):
+                movers.append((count[target] - count.get(own, 0), idx, target))
+        movers.sort(reverse=True)
+
+        round_gained = 0
+        for _, idx, target in movers:
+            # 앞선 교환으로 이웃의 클러스터가 바뀌었을 수 있으므로 현재 상태로 다시 계산
+            source = cluster_of[idx]
+            partners = members.get((target, part_of[idx]))
+            first = gain(idx, target)
+            if first <= 0 or not partners:
+                continue
+            cluster_of[idx] = target
+            other = max(partners, key=lambda other: gain(other, source))
+            second = gain(other, source)
+            if first + second > 0:
+                cluster_of[other] = source
+                partners.remove(other)
+                partners.add(idx)
+                members[(source, part_of[idx])].remove(idx)
+                members[(source, part_of[idx])].add(other)
+                round_gained += first + second
+            else:
+                cluster_of[idx] = source
+        gained += round_gained
+        if not round_gained:
+            break
+    return gained
+
+
+def partition_participants(
+    participant_list: list[dict],
+    waggings: list[dict] = None,
+    team_count: int = None,
+    cluster_teams: int = 16,
+    config: MatchingConfig = None,
+    refine_rounds: int = 10,
+) -> list[tuple[list[dict], int]]:
+    """
+    참가자를 팀 cluster_teams 개 정도 크기의 클러스터로 나눔
+
+    _get_team_template 의 팀별 파트 인원수를 클러스터 단위로 묶어서 클러스터별 파트 인원수를 정하므로,
+    클러스터 안에서 다시 팀을 나누어도 파트별 최소 인원수(config.part_min)를 항상 만족함
+    파트마다 _locality_order 순서대로 클러스터를 채운 뒤, _refine_partition 으로 같은 파트 참가자끼리 맞바꾸어
+    클러스터 사이에 걸친 꼬리흔들기를 줄임
+
+    input:
+        - participant_list: 참가자 목록
+        - waggings: 꼬리흔들기 목록
+        - team_count: 전체 팀의 개수 (기본값: config.team_count)
+        - cluster_teams: 클러스터 하나에 들어갈 팀의 개수 (목표값)
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+        - refine_rounds: _refine_partition 에서 참가자 전체를 훑는 최대 횟수
+
+    return:
+        - clusters = [
+            ([participant, ...], 16),  # (클러스터의 참가자 목록, 클러스터의 팀 개수)
+            ...
+        ]
+    """
+    config = config or DEFAULT_CONFIG
+    team_template = _get_team_template(participant_list, team_count, config)
+    if not team_template:
+        return []
+
+    cluster_count = max(1, round(len(team_template) / cluster_teams))
+    bounds = [len(team_template) * k // cluster_count for k in range(cluster_count + 1)]
+    quotas = [
+        {
+            part: sum(row[part] for row in team_template[start:end])
+            for part in config.parts
+        }
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+    # 파트를 알 수 없는 참가자는 _get_team_template 과 같이 제외 (클러스터 번호 -1)
+    cluster_of = [-1] * len(participant_list)
+    part_of = [participant.get("part") for participant in participant_list]
+    filled = {part: 0 for part in config.parts}
+    cluster_of_part = {part: 0 for part in config.parts}
+    neighbors = _wagging_neighbors(participant_list, waggings)
+    for idx in _locality_order(participant_list, neighbors, config):
+        part = part_of[idx]
+        if part not in config.part_index:
+            continue
+        while filled[part] >= quotas[cluster_of_part[part]][part]:
+            cluster_of_part[part] += 1
+            filled[part] = 0
+        cluster_of[idx] = cluster_of_part[part]
+        filled[part] += 1
+
+    if cluster_count > 1 and refine_rounds:
+        _refine_partition(cluster_of, part_of, neighbors, refine_rounds)
+
+    clusters = [[] for _ in range(cluster_count)]
+    for participant, cluster_id in zip(participant_list, cluster_of):
+        if cluster_id >= 0:
+            clusters[cluster_id].append(participant)
+
+    return [
+        (members, end - start)
+        for members, start, end in zip(clusters, bounds, bounds[1:])
+    ]
+
+
+def _solve_cluster(
+    cluster_id: int,
+    seed: int,
+    participant_list: list[dict],
+    waggings: list[dict],
+    team_count: int,
+    initial_method: str,
+    solver: str,
+    options: dict,
+    config: MatchingConfig,
+    category_weight: np.ndarray,
+) -> dict:
+    """
+    워커 프로세스에서 클러스터 하나의 초기 매칭 + solve 를 실행
+    카테고리 점수는 클러스터 참가자가 아닌 전체 참가자 기준의 가중치 표(category_weight)로 계산
+
+    return:
+        - result = {
+            "cluster": 0,
+            "participants": 96,
+            "score": -40.2,
+            "elapsed": 0.31,
+            "team_ids": [[1, 5, 9, ...], [], ...]  # 팀별 참가자 id
+        }
+    """
+    # 초기 매칭과 solve 가 하나의 난수 생성기를 이어서 사용 (시드 하나로 클러스터 결과를 재현)
+    rng = make_rng(seed)
+    start = time.perf_counter()
+    initial_teams = initial_team_assignment(
+        participant_list,
+        waggings,
+        method=initial_method,
+        team_count=team_count,
+        config=config,
+        seed=rng,
+    )
+    best_teams, best_score, _ = solve(
+        initial_teams,
+        waggings=waggings,
+        solver=solver,
+        config=config,
+        seed=rng,
+        category_weight=category_weight,
+        **options,
+    )
+    return {
+        "cluster": cluster_id,
+        "participants": len(participant_list),
+        "score": best_score,
+        "elapsed": time.perf_counter() - start,
+        "team_ids": [[member["id"] for member in team] for team in best_teams],
+    }
+
+
+def _refine_cross_cluster(
+    evaluator: IncrementalEvaluator, rounds: int, rng: random.Random
+) -> int:
+    """
+    같은 팀에 꼬리흔들기 대상이 없는 참가자를 대상이 있는 팀으로 옮기는 교환 중 가장 좋은 것을 채택
+    클러스터별 탐색에서는 클러스터 사이의 꼬리흔들기가 보이지 않으므로, 합친 뒤 이런 참가자를 대상으로 한 번 더 개선함
+    (대상 팀의 같은 파트 참가자 전체를 교환 후보로 두고 swap_scores 로 한 번에 평가)
+
+    return:
+        - accepted: 채택한 교환 횟수
+    """
+    part_code = evaluator.problem.part_code.tolist()
+    team_of = evaluator.team_of
+    # 제약이 있는 참가자는 옮기지 않음 (클러스터별 탐색에서 지킨 제약을 그대로 유지)
+    constrained = evaluator.problem.constraints.is_constrained
+
+    accepted = 0
+    for _ in range(rounds):
+        stranded = [
+            idx
+            for idx, hit in enumerate(evaluator.hits)
+            if hit == 0 and evaluator.waggees[idx] and not constrained(idx)
+        ]
+        rng.shuffle(stranded)
+        round_accepted = 0
+        for idx in stranded:
+            if evaluator.hits[idx]:
+                continue  # 앞선 교환으로 이미 대상과 같은 팀이 됨
+            partners = [
+                other
+                for team_idx in {team_of[waggee] for waggee in evaluator.waggees[idx]}
+                for other in evaluator.teams[team_idx]
+                if part_code[other] == part_code[idx]
+                and team_idx != team_of[idx]
+                and not constrained(other)
+            ]
+            if not partners:
+                continue
+            scores = evaluator.swap_scores(
+                np.full(len(partners), idx), np.array(partners)
+            )
+            best = int(scores.argmin())
+            if scores[best] < evaluator.score:
+                SwapMove(
+                    evaluator,
+                    evaluator.position(idx),
+                    evaluator.position(partners[best]),
+                ).apply()
+                round_accepted += 1
+        accepted += round_accepted
+        if not round_accepted:
+            break
+    return accepted
+
+
+def decomposed_solve(
+    participant_list: list[dict],
+    waggings: list[dict] = None,
+    team_count: int = None,
+    cluster_teams: int = 16,
+    solver: str = "annealing",
+    initial_method: str = "greedy",
+    max_workers: int = None,
+    seed: int = None,
+    refine_rounds: int = 3,
+    config: MatchingConfig = None,
+    **options,
+):
+    """
+    참가자가 수만 명 규모일 때 사용하는 계층 분해 매칭
+    하나의 전체 탐색 대신 클러스터별 작은 문제로 나누어 병렬로 풀기 때문에
+    참가자 수와 코어 수에 거의 비례해서 확장됨
+
+    1) partition_participants 로 파트별 최소 인원수를 지키는 클러스터로 나눔
+    2) 클러스터마다 초기 매칭 + solve 를 ProcessPoolExecutor 의 워커 프로세스에서 병렬로 실행
+       (카테고리 가중치는 전체 참가자 기준의 표를 워커에 전달해서, 클러스터별 점수가 전체 점수와 같은 기준을 사용)
+    3) 결과를 합치고 _refine_cross_cluster 로 클러스터 사이의 꼬리흔들기를 반영
+
+    input:
+        - participant_list: 참가자 목록
+        - waggings: 꼬리흔들기 목록
+        - team_count: 전체 팀의 개수 (기본값: config.team_count)
+        - cluster_teams: 클러스터 하나에 들어갈 팀의 개수 (목표값)
+        - solver: 클러스터별로 사용할 탐색 엔진 (matching.SOLVERS 참고)
+        - initial_method: 클러스터별 초기 매칭 방법 ("random" | "greedy")
+        - max_workers: 워커 프로세스 수 (기본값: min(클러스터 수, CPU 수)), 1 이면 현재 프로세스에서 실행
+        - seed: 클러스터별 시드를 만들 기준 시드 (seeding.spawn_seeds 로 클러스터마다 독립적인 시드를 만듦)
+        - refine_rounds: 3) 에서 후보 참가자 전체를 훑는 횟수
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG), 워커 프로세스에도 그대로 전달
+        - options: 클러스터별 solve 에 전달할 인자 (time_limit, max_iterations 등)
+
+    다른 팀 제약(config.apart)은 클러스터마다 적용되고, 서로 다른 클러스터의 참가자는 항상 다른 팀이 됨
+    같은 팀 제약(config.together)은 클러스터 분할이 묶음을 보장하지 않으므로 지원하지 않음 (ValueError)
+
+    return:
+        - team_list: 전체 팀 매칭 (team_list 형식)
+        - score: 전체 팀 매칭의 점수
+        - stats = {
+            "clusters": 40,
+            "cut_waggings": 0.12,   # 클러스터 사이에 걸친 꼬리흔들기 비율
+            "merged_score": -80.1,  # 3) 이전 점수
+            "refine_accepted": 35,  # 3) 에서 채택한 교환 횟수
+            "elapsed": 12.4,
+            "cluster_stats": [{"cluster": 0, "participants": 96, "score": -40.2, "elapsed": 0.31}, ...],
+        }
+    """
+    if config is not None and config.together:
+        raise ValueError("계층 분해 매칭은 같은 팀 제약을 지원하지 않습니다.")
+
+    start = time.perf_counter()
+    waggings = waggings or []
+    clusters = partition_participants(
+        participant_list, waggings, team_count, cluster_teams, config
+    )
+    if not clusters:
+        return [], None, {}
+
+    # 클러스터 안의 꼬리흔들기만 각 클러스터에 전달 (클러스터 사이의 꼬리흔들기는 3) 에서 반영)
+    cluster_of_id = {
+        member["id"]: cluster_id
+        for cluster_id, (members, _) in enumerate(clusters)
+        for member in members
+    }
+    cluster_waggings = [[] for _ in clusters]
+    cut = 0
+    for wagging in waggings:
+        cluster_id = cluster_of_id.get(wagging["wagger"])
+        if cluster_id is not None and cluster_id == cluster_of_id.get(
+            wagging["waggee"]
+        ):
+            cluster_waggings[cluster_id].append(wagging)
+        else:
+            cut += 1
+
+    # 클러스터에 배정된 전체 참가자의 문제 표현 (카테고리 가중치를 워커와 3) 에서 함께 사용)
+    problem = MatchingProblem(
+        [member for members, _ in clusters for member in members], waggings, config
+    )
+
+    # 클러스터마다 하나 + 3) 에서 사용할 하나
+    seeds = spawn_seeds(seed, len(clusters) + 1)
+    jobs = [
+        (
+            cluster_id,
+            seeds[cluster_id],
+            members,
+            cluster_waggings[cluster_id],
+            cluster_team_count,
+            initial_method,
+            solver,
+            options,
+            config,
+            problem.category_weight,
+        )
+        for cluster_id, (members, cluster_team_count) in enumerate(clusters)
+    ]
+
+    if max_workers is None:
+        max_workers = min(len(clusters), os.cpu_count() or 1)
+
+    if max_workers == 1:
+        results = [_solve_cluster(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_solve_cluster, *job) for job in jobs]
+            results = [future.result() for future in futures]
+
+    # 워커에서는 참가자 id 만 돌려받고 원본 참가자 dict 로 복원
+    participant_by_id = {
+        participant["id"]: participant for participant in participant_list
+    }
+    team_list = [
+        [participant_by_id[member_id] for member_id in team]
+        for result in results
+        for team in result["team_ids"]
+    ]
+
+    assignment = problem.assignment_from_team_list(team_list)
+    evaluator = IncrementalEvaluator(problem, assignment, len(team_list))
+    merged_score = evaluator.score
+    accepted = _refine_cross_cluster(evaluator, refine_rounds, make_rng(seeds[-1]))
+
+    stats = {
+        "clusters": len(clusters),
+        "cut_waggings": cut / len(waggings) if waggings else 0.0,
+        "merged_score": merged_score,
+        "refine_accepted": accepted,
+        "elapsed": time.perf_counter() - start,
+        "cluster_stats": [
+            {key: value for key, value in result.items() if key != "team_ids"}
+            for result in results
+        ],
+    }
+    return (
+        problem.to_team_list(evaluator.snapshot(), len(team_list)),
+        evaluator.score,
+        stats,
+    )
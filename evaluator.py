@@ -0,0 +1,688 @@
+import numpy as np
+
+from problem import MatchingProblem
+
+
+class IncrementalEvaluator:
+    """
+    팀 매칭 상태를 유지하면서 스왑 한 번에 바뀌는 부분만 다시 계산하는 평가기
+    evaluate_solution 과 같은 점수를 반환하지만, 스왑 후에는 두 팀과 관련된 값만 갱신함
+
+    - 카테고리: 팀별 카테고리 값 개수와 팀 점수, 팀 점수의 합/제곱합
+    - 꼬리흔들기: 참가자별 적중 횟수, 적중 횟수의 합/제곱합, 적중 0회 인원 수
+
+    초기 상태는 배열 연산으로 계산하고, 스왑 한 번의 갱신은 값 몇 개만 바뀌므로
+    배열에서 꺼내 둔 파이썬 리스트로 처리함
+
+    input:
+        - problem: MatchingProblem
+        - assignment: 참가자 번호 순서의 팀 번호 배열
+        - team_count: 팀의 개수 (생략하면 assignment 로부터 계산)
+    """
+
+    def __init__(
+        self, problem: MatchingProblem, assignment: np.ndarray, team_count: int = None
+    ):
+        self.problem = problem
+        assignment = np.asarray(assignment)
+        if team_count is None:
+            team_count = int(assignment.max()) + 1
+
+        # 참가자 번호 -> 팀 번호, 팀 내 위치 / 팀별 참가자 번호 목록
+        self.team_of = assignment.tolist()
+        self.teams = [[] for _ in range(team_count)]
+        self.slot_of = [0] * len(problem)
+        for idx, team_idx in enumerate(self.team_of):
+            self.slot_of[idx] = len(self.teams[team_idx])
+            self.teams[team_idx].append(idx)
+        # 팀별 인원 (같은 파트끼리의 교환은 인원을 바꾸지 않으므로 한 번만 계산)
+        self.team_size = np.array([len(team) for team in self.teams], dtype=np.int64)
+
+        # 꼬리흔들기 인접 정보 (나가는 방향, 들어오는 방향), 같은 문제의 평가기끼리 공유
+        self.waggees, self.waggers = problem.wagging.adjacency_lists()
+
+        # 카테고리 가중치는 문제 표현에 미리 계산되어 있음
+        self.category_weight = problem.category_weight.tolist()
+        self.max_weight = problem.max_weight
+        self.category_code = problem.category_code.tolist()
+        self.exact = problem.config.exact_scoring
+
+        # 팀별 카테고리 상태
+        self.team_category_count = _count_team_category(
+            problem, assignment, team_count
+        ).tolist()
+        self.category_scores = [
+            self._team_category_score(count, len(team))
+            for count, team in zip(self.team_category_count, self.teams)
+        ]
+        self.category_sum = sum(self.category_scores)
+        self.category_sq_sum = sum(score**2 for score in self.category_scores)
+
+        # 참가자별 꼬리흔들기 상태
+        self.hits = problem.wagging.count_hits(assignment).tolist()
+        self.hit_sum = sum(self.hits)
+        self.hit_sq_sum = sum(hit**2 for hit in self.hits)
+        self.zero_count = self.hits.count(0)
+
+        self.score = self._total_score()
+
+        # swap_scores 를 처음 호출할 때 만드는 배열 사본 (이후 교환마다 함께 갱신)
+        self._arrays = None
+
+    def _team_category_score(self, count: list[list[int]], team_size: int) -> float:
+        """
+        카테고리 값 개수로부터 한 팀의 카테고리 점수를 계산 (get_category_score 와 동일한 규칙)
+        """
+        team_score = 0
+        if self.exact:
+            for values, weights in zip(count, self.category_weight):
+                value = max(values)  # 가장 많이 선택된 값 (동률이면 앞선 값)
+                team_score += value / team_size * weights[values.index(value)]
+            return team_score / len(count) / self.max_weight * 100
+
+        for values, weights in zip(count, self.category_weight):
+            rates = [_round_score(value / team_size) for value in values]
+            rate = max(rates)  # 가장 많이 선택된 값 (동률이면 앞선 값)
+            team_score += rate * weights[rates.index(rate)]
+        return _round_score(team_score / len(count) / self.max_weight) * 100
+
+    def _total_score(self) -> float:
+        """
+        유지 중인 합/제곱합으로부터 evaluate_solution 과 같은 최종 점수를 계산
+        """
+        team_count = len(self.teams)
+        category_mean = self.category_sum / team_count
+        category_variance = max(self.category_sq_sum / team_count - category_mean**2, 0)
+
+        participant_count = len(self.hits)
+        wagging_mean = self.hit_sum / participant_count
+        wagging_variance = (
+            participant_count * self.hit_sq_sum - self.hit_sum**2
+        ) / participant_count**2
+
+        return _combine_score(
+            category_mean,
+            category_variance,
+            wagging_mean,
+            wagging_variance,
+            self.zero_count,
+        )
+
+    def _move_category(self, team_idx: int, leaving: int, joining: int):
+        """
+        팀의 카테고리 값 개수를 갱신하고 팀 점수와 합/제곱합을 다시 계산
+        """
+        count = self.team_category_count[team_idx]
+        for col, (old_code, new_code) in enumerate(
+            zip(self.category_code[leaving], self.category_code[joining])
+        ):
+            count[col][old_code] -= 1
+            count[col][new_code] += 1
+
+        old = self.category_scores[team_idx]
+        score = self._team_category_score(count, len(self.teams[team_idx]))
+        self.category_scores[team_idx] = score
+        self.category_sum += score - old
+        self.category_sq_sum += score**2 - old**2
+
+    def _set_hit(self, idx: int, hit: int):
+        old = self.hits[idx]
+        self.hits[idx] = hit
+        self.hit_sum += hit - old
+        self.hit_sq_sum += hit**2 - old**2
+        self.zero_count += (hit == 0) - (old == 0)
+
+    def apply_swap(self, pos_a: tuple[int], pos_b: tuple[int]) -> tuple:
+        """
+        (팀 번호, 팀 내 위치) 로 지정한 두 멤버를 제자리에서 교환하고 상태를 갱신
+
+        return:
+            - undo: revert 에 전달하면 교환 이전 상태로 되돌릴 수 있는 기록
+        """
+        team_a, slot_a = pos_a
+        team_b, slot_b = pos_b
+        idx_a = self.teams[team_a][slot_a]
+        idx_b = self.teams[team_b][slot_b]
+
+        undo = (
+            pos_a,
+            pos_b,
+            self.category_scores[team_a],
+            self.category_scores[team_b],
+            self.category_sum,
+            self.category_sq_sum,
+            self.hit_sum,
+            self.hit_sq_sum,
+            self.zero_count,
+            self.score,
+            [],
+        )
+        old_hits = undo[-1]
+
+        # 1) 팀 구성 교환
+        self.teams[team_a][slot_a] = idx_b
+        self.teams[team_b][slot_b] = idx_a
+        self.team_of[idx_a], self.team_of[idx_b] = team_b, team_a
+        self.slot_of[idx_a], self.slot_of[idx_b] = slot_b, slot_a
+
+        # 2) 카테고리: 두 팀의 카테고리 값 개수만 조정
+        self._move_category(team_a, idx_a, idx_b)
+        self._move_category(team_b, idx_b, idx_a)
+
+        # 3) 꼬리흔들기: 교환된 두 사람과 그들에게 꼬리를 흔든 사람만 영향을 받음
+        team_of = self.team_of
+        for idx in (idx_a, idx_b):
+            old_hits.append((idx, self.hits[idx]))
+            self._set_hit(
+                idx,
+                sum(
+                    1 for waggee in self.waggees[idx] if team_of[waggee] == team_of[idx]
+                ),
+            )
+        for moved, old_team in ((idx_a, team_a), (idx_b, team_b)):
+            for wagger in self.waggers[moved]:
+                if wagger == idx_a or wagger == idx_b:
+                    continue
+                wagger_team = team_of[wagger]
+                diff = (team_of[moved] == wagger_team) - (old_team == wagger_team)
+                if diff:
+                    old_hits.append((wagger, self.hits[wagger]))
+                    self._set_hit(wagger, self.hits[wagger] + diff)
+
+        self.score = self._total_score()
+        if self._arrays is not None:
+            self._update_arrays(team_a, team_b, idx_a, idx_b, old_hits)
+        return undo
+
+    def revert(self, undo: tuple):
+        """
+        apply_swap 이 반환한 기록으로 교환 이전 상태를 복원
+        """
+        (
+            pos_a,
+            pos_b,
+            category_score_a,
+            category_score_b,
+            self.category_sum,
+            self.category_sq_sum,
+            self.hit_sum,
+            self.hit_sq_sum,
+            self.zero_count,
+            self.score,
+            old_hits,
+        ) = undo
+        team_a, slot_a = pos_a
+        team_b, slot_b = pos_b
+
+        # apply_swap 이후 idx_a 는 team_b 에, idx_b 는 team_a 에 있음
+        idx_b = self.teams[team_a][slot_a]
+        idx_a = self.teams[team_b][slot_b]
+
+        self.teams[team_a][slot_a] = idx_a
+        self.teams[team_b][slot_b] = idx_b
+        self.team_of[idx_a], self.team_of[idx_b] = team_a, team_b
+        self.slot_of[idx_a], self.slot_of[idx_b] = slot_a, slot_b
+
+        count_a = self.team_category_count[team_a]
+        count_b = self.team_category_count[team_b]
+        for col, (code_a, code_b) in enumerate(
+            zip(self.category_code[idx_a], self.category_code[idx_b])
+        ):
+            count_a[col][code_b] -= 1
+            count_a[col][code_a] += 1
+            count_b[col][code_a] -= 1
+            count_b[col][code_b] += 1
+        self.category_scores[team_a] = category_score_a
+        self.category_scores[team_b] = category_score_b
+
+        # 같은 참가자가 여러 번 기록될 수 있으므로 역순으로 복원
+        for idx, hit in reversed(old_hits):
+            self.hits[idx] = hit
+
+        if self._arrays is not None:
+            self._update_arrays(team_a, team_b, idx_a, idx_b, old_hits)
+
+    def _update_arrays(self, team_a, team_b, idx_a, idx_b, changed_hits):
+        """
+        교환으로 바뀐 값만 배열 사본에 반영
+        """
+        team_of, hits, count, category_scores = self._arrays
+        team_of[idx_a] = self.team_of[idx_a]
+        team_of[idx_b] = self.team_of[idx_b]
+        for team_idx in (team_a, team_b):
+            count[team_idx] = self.team_category_count[team_idx]
+            category_scores[team_idx] = self.category_scores[team_idx]
+        for idx, _ in changed_hits:
+            hits[idx] = self.hits[idx]
+
+    def swap_scores(self, idx_a: np.ndarray, idx_b: np.ndarray) -> np.ndarray:
+        """
+        참가자 idx_a[k] 와 idx_b[k] 를 교환했을 때의 점수 K 개를 상태 변경 없이 한 번에 계산
+        각 후보는 현재 상태를 기준으로 독립적으로 평가하며, 같은 팀에 속한 쌍은 inf 로 반환
+
+        input:
+            - idx_a, idx_b: 교환할 참가자 번호 배열, shape (K,)
+
+        return:
+            - scores: 후보별 교환 후 점수, shape (K,)
+        """
+        if self._arrays is None:
+            self._arrays = self._build_arrays()
+        return _swap_scores(
+            self.problem,
+            self._arrays,
+            self.team_size,
+            (
+                self.category_sum,
+                self.category_sq_sum,
+                self.hit_sum,
+                self.hit_sq_sum,
+                self.zero_count,
+            ),
+            idx_a,
+            idx_b,
+        )
+
+    def _build_arrays(self) -> tuple[np.ndarray]:
+        """
+        swap_scores 에 사용하는 배열 사본 (팀 번호, 적중 횟수, 팀별 카테고리 값 개수, 팀 카테고리 점수)
+        """
+        return (
+            np.array(self.team_of, dtype=np.int64),
+            np.array(self.hits, dtype=np.int64),
+            np.array(self.team_category_count, dtype=np.int64),
+            np.array(self.category_scores, dtype=np.float64),
+        )
+
+    def state(self) -> dict:
+        """
+        체크포인트에 저장할 상태를 반환
+        팀 번호와 팀 내 위치, 그리고 교환마다 누적해서 갱신하므로 처음부터 다시 계산하면 오차가 달라지는
+        카테고리 점수의 합/제곱합만 저장함 (나머지 값은 팀 번호로부터 정확히 다시 계산됨)
+        """
+        return {
+            "team_of": self.snapshot(),
+            "slot_of": np.array(self.slot_of, dtype=np.int32),
+            "category_sum": self.category_sum,
+            "category_sq_sum": self.category_sq_sum,
+        }
+
+    def restore_state(self, state: dict):
+        """
+        state() 로 저장한 상태를 복원 (같은 문제와 state["team_of"] 로 생성한 평가기에서 호출)
+        """
+        self.slot_of = state["slot_of"].tolist()
+        for idx, (team_idx, slot) in enumerate(zip(self.team_of, self.slot_of)):
+            self.teams[team_idx][slot] = idx
+        self.category_sum = state["category_sum"]
+        self.category_sq_sum = state["category_sq_sum"]
+        self.score = self._total_score()
+        self._arrays = None
+
+    def position(self, idx: int) -> tuple[int]:
+        """
+        참가자 번호의 현재 (팀 번호, 팀 내 위치)
+        """
+        return self.team_of[idx], self.slot_of[idx]
+
+    def snapshot(self) -> np.ndarray:
+        """
+        현재 팀 매칭을 참가자 번호 순서의 팀 번호 배열로 반환 (dict 복사 없음)
+        """
+        return np.array(self.team_of, dtype=np.int32)
+
+    def to_team_list(self, assignment: np.ndarray) -> list[list[dict]]:
+        """
+        snapshot 으로 저장한 팀 번호 배열을 team_list 형식으로 변환
+        """
+        return self.problem.to_team_list(assignment, len(self.teams))
+
+
+class ReplicaScorer:
+    """
+    같은 문제와 같은 팀 구성(팀별 인원)의 평가기 여러 개(병렬 템퍼링의 복제본)에 대한 교환 후보를
+    한 번의 배열 연산으로 계산
+
+    평가기마다 swap_scores 에 사용하는 배열 사본을 복제본 순서로 이어 붙인 배열의 구간(view)으로 바꾸므로,
+    평가기가 교환마다 갱신하는 값이 이어 붙인 배열에 그대로 반영됨 (복사 없이 유지)
+
+    input:
+        - evaluators: 같은 MatchingProblem 으로 만든 IncrementalEvaluator 목록
+    """
+
+    def __init__(self, evaluators: list[IncrementalEvaluator]):
+        self.evaluators = list(evaluators)
+        self.problem = self.evaluators[0].problem
+        self.team_size = self.evaluators[0].team_size
+        self.replica_of = {
+            id(evaluator): replica for replica, evaluator in enumerate(self.evaluators)
+        }
+        participant_count = len(self.problem)
+        team_count = len(self.team_size)
+
+        arrays = [
+            evaluator._arrays or evaluator._build_arrays()
+            for evaluator in self.evaluators
+        ]
+        self.arrays = tuple(np.concatenate(columns) for columns in zip(*arrays))
+        team_of, hits, count, category_scores = self.arrays
+        for replica, evaluator in enumerate(self.evaluators):
+            people = slice(
+                replica * participant_count, (replica + 1) * participant_count
+            )
+            teams = slice(replica * team_count, (replica + 1) * team_count)
+            evaluator._arrays = (
+                team_of[people],
+                hits[people],
+                count[teams],
+                category_scores[teams],
+            )
+
+    def swap_scores(
+        self, replica: np.ndarray, idx_a: np.ndarray, idx_b: np.ndarray
+    ) -> np.ndarray:
+        """
+        replica[k] 번째 평가기에서 참가자 idx_a[k] 와 idx_b[k] 를 교환했을 때의 점수 K 개
+        (IncrementalEvaluator.swap_scores 와 같은 규칙, 같은 팀에 속한 쌍은 inf)
+
+        input:
+            - replica: 후보별 평가기 위치 (evaluators 순서), shape (K,)
+            - idx_a, idx_b: 평가기 안의 참가자 번호 배열, shape (K,)
+        """
+        replica = np.asarray(replica, dtype=np.int64)
+        evaluators = self.evaluators
+        totals = tuple(
+            np.array([getattr(evaluator, name) for evaluator in evaluators])[replica]
+            for name in (
+                "category_sum",
+                "category_sq_sum",
+                "hit_sum",
+                "hit_sq_sum",
+                "zero_count",
+            )
+        )
+        return _swap_scores(
+            self.problem,
+            self.arrays,
+            self.team_size,
+            totals,
+            idx_a,
+            idx_b,
+            replica * len(self.problem),
+            replica * len(self.team_size),
+        )
+
+
+def _swap_scores(
+    problem: MatchingProblem,
+    arrays: tuple[np.ndarray],
+    team_size: np.ndarray,
+    totals: tuple,
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+    offset: np.ndarray = 0,
+    team_offset: np.ndarray = 0,
+) -> np.ndarray:
+    """
+    IncrementalEvaluator.swap_scores / ReplicaScorer.swap_scores 의 계산 본체
+
+    input:
+        - arrays: (팀 번호, 적중 횟수, 팀별 카테고리 값 개수, 팀 카테고리 점수) 배열
+          평가기 여러 개를 이어 붙인 경우 후보 k 의 값은 참가자 offset[k], 팀 team_offset[k] 만큼 밀린 위치에 있음
+          (팀 번호 배열에는 평가기 안의 팀 번호를 저장)
+        - team_size: 팀별 인원, shape (팀 수,)
+        - totals: (카테고리 점수 합, 제곱합, 적중 횟수 합, 제곱합, 적중 0회 인원) 스칼라 또는 후보별 배열
+        - idx_a, idx_b: 평가기 안의 참가자 번호 배열, shape (K,)
+        - offset, team_offset: 후보별 참가자 / 팀 위치 이동량 (평가기 하나면 0)
+    """
+    team_of, hits, count, category_scores = arrays
+    category_sum, category_sq_sum, hit_sum, hit_sq_sum, zero_count = totals
+    wagging = problem.wagging
+    participant_count = len(problem)
+
+    idx_a = np.asarray(idx_a, dtype=np.int64)
+    idx_b = np.asarray(idx_b, dtype=np.int64)
+    candidate_count = len(idx_a)
+    offset = np.broadcast_to(np.asarray(offset, dtype=np.int64), (candidate_count,))
+    rows = np.arange(candidate_count)
+    team_a, team_b = team_of[idx_a + offset], team_of[idx_b + offset]
+
+    # 1) 카테고리: 후보별로 두 팀의 카테고리 값 개수를 조정한 뒤 팀 점수 계산
+    code = problem.category_code
+    cols = np.arange(code.shape[1])[None, :]
+    count_a = count[team_a + team_offset]
+    count_b = count[team_b + team_offset]
+    count_a[rows[:, None], cols, code[idx_a]] -= 1
+    count_a[rows[:, None], cols, code[idx_b]] += 1
+    count_b[rows[:, None], cols, code[idx_b]] -= 1
+    count_b[rows[:, None], cols, code[idx_a]] += 1
+    score_a = _category_scores_from_count(problem, count_a, team_size[team_a])
+    score_b = _category_scores_from_count(problem, count_b, team_size[team_b])
+    old_a = category_scores[team_a + team_offset]
+    old_b = category_scores[team_b + team_offset]
+    category_sum = category_sum + (score_a - old_a) + (score_b - old_b)
+    category_sq_sum = (
+        category_sq_sum + (score_a**2 - old_a**2) + (score_b**2 - old_b**2)
+    )
+
+    def new_team(members, row):
+        # 교환 후의 팀 번호 (교환된 두 사람만 팀이 바뀜)
+        result = team_of[members + offset[row]]
+        result = np.where(members == idx_a[row], team_b[row], result)
+        return np.where(members == idx_b[row], team_a[row], result)
+
+    # 2) 꼬리흔들기: 교환된 두 사람의 적중 횟수는 새 팀 기준으로 다시 계산
+    hit_sum = np.array(np.broadcast_to(hit_sum, (candidate_count,)), dtype=np.int64)
+    hit_sq_sum = np.array(
+        np.broadcast_to(hit_sq_sum, (candidate_count,)), dtype=np.int64
+    )
+    zero_count = np.array(
+        np.broadcast_to(zero_count, (candidate_count,)), dtype=np.int64
+    )
+    for moved, destination in ((idx_a, team_b), (idx_b, team_a)):
+        edge_row, waggee = _gather_csr(wagging.indptr, wagging.indices, moved)
+        same_team = new_team(waggee, edge_row) == destination[edge_row]
+        new_hit = np.bincount(edge_row[same_team], minlength=candidate_count).astype(
+            np.int64
+        )
+        old_hit = hits[moved + offset]
+        hit_sum += new_hit - old_hit
+        hit_sq_sum += new_hit**2 - old_hit**2
+        zero_count += (new_hit == 0).astype(np.int64) - (old_hit == 0)
+
+    # 3) 꼬리흔들기: 교환된 사람에게 꼬리를 흔든 사람들의 적중 횟수 변화
+    edge_rows, edge_waggers, edge_diffs = [], [], []
+    for moved, source, destination in (
+        (idx_a, team_a, team_b),
+        (idx_b, team_b, team_a),
+    ):
+        edge_row, wagger = _gather_csr(wagging.in_indptr, wagging.in_indices, moved)
+        keep = (wagger != idx_a[edge_row]) & (wagger != idx_b[edge_row])
+        edge_row, wagger = edge_row[keep], wagger[keep]
+        wagger_team = team_of[wagger + offset[edge_row]]
+        edge_rows.append(edge_row)
+        edge_waggers.append(wagger)
+        edge_diffs.append(
+            (wagger_team == destination[edge_row]).astype(np.int64)
+            - (wagger_team == source[edge_row])
+        )
+    edge_row = np.concatenate(edge_rows)
+    wagger = np.concatenate(edge_waggers)
+    # 두 사람 모두에게 꼬리를 흔든 경우를 합치기 위해 (후보, 참가자) 별로 집계
+    keys, inverse = np.unique(
+        edge_row * participant_count + wagger, return_inverse=True
+    )
+    diff = np.bincount(inverse, weights=np.concatenate(edge_diffs)).astype(np.int64)
+    key_row, key_wagger = keys // participant_count, keys % participant_count
+    old_hit = hits[key_wagger + offset[key_row]]
+    new_hit = old_hit + diff
+    hit_sum += np.bincount(key_row, weights=diff, minlength=candidate_count).astype(
+        np.int64
+    )
+    hit_sq_sum += np.bincount(
+        key_row, weights=new_hit**2 - old_hit**2, minlength=candidate_count
+    ).astype(np.int64)
+    zero_count += np.bincount(
+        key_row,
+        weights=(new_hit == 0).astype(np.int64) - (old_hit == 0),
+        minlength=candidate_count,
+    ).astype(np.int64)
+
+    # 4) 최종 점수
+    team_count = len(team_size)
+    category_mean = category_sum / team_count
+    category_variance = np.maximum(category_sq_sum / team_count - category_mean**2, 0)
+    wagging_mean = hit_sum / participant_count
+    wagging_variance = (
+        participant_count * hit_sq_sum - hit_sum**2
+    ) / participant_count**2
+
+    scores = _combine_score(
+        category_mean, category_variance, wagging_mean, wagging_variance, zero_count
+    )
+    return np.where(team_a == team_b, np.inf, scores)
+
+
+def evaluate_assignment(
+    problem: MatchingProblem, assignment: np.ndarray, team_count: int = None
+) -> float:
+    """
+    팀 번호 배열의 점수를 배열 연산으로 계산 (evaluate_solution 과 같은 점수)
+
+    input:
+        - problem: MatchingProblem
+        - assignment: 참가자 번호 순서의 팀 번호 배열
+        - team_count: 팀의 개수 (생략하면 assignment 로부터 계산)
+
+    return:
+        - score: 알고리즘에 사용되는 점수
+    """
+    assignment = np.asarray(assignment)
+    if team_count is None:
+        team_count = int(assignment.max()) + 1
+
+    # 카테고리 점수
+    count = _count_team_category(problem, assignment, team_count)
+    team_size = np.bincount(assignment, minlength=team_count)
+    category_scores = _category_scores_from_count(problem, count, team_size)
+
+    # 꼬리흔들기 점수
+    hits = problem.wagging.count_hits(assignment)
+
+    return float(
+        _combine_score(
+            category_scores.mean(),
+            category_scores.var(),
+            hits.mean(),
+            hits.var(),
+            int((hits == 0).sum()),
+        )
+    )
+
+
+def _combine_score(
+    category_mean, category_variance, wagging_mean, wagging_variance, wagging_fail_count
+) -> float:
+    """
+    카테고리/꼬리흔들기 통계값에 가중치를 적용해 최종 점수(낮을수록 좋음)를 계산
+    (통계값이 배열이면 후보별 점수 배열을 반환)
+    """
+    # 가중치 설정
+    w_category_mean = 2.0  # 카테고리 매칭의 평균 품질
+    w_category_var = 0.1  # 팀 간 카테고리 균형
+    w_wagging_mean = 2.0  # 꼬리흔들기 매칭의 평균 품질
+    w_wagging_var = 0.1  # 팀 간 꼬리흔들기 균형
+    w_wagging_penalty = 50.0  # 꼬리흔들기 매칭 실패 패널티
+
+    # 높은 점수를 낮은 비용으로 변환 (음수 사용)
+    # 분산은 그대로 사용 (낮을수록 좋음)
+    return (
+        -w_category_mean * category_mean  # 카테고리 평균이 높을수록 비용 감소
+        + w_category_var * category_variance  # 분산이 낮을수록 비용 감소
+        + -w_wagging_mean * wagging_mean  # 꼬리흔들기 평균이 높을수록 비용 감소
+        + w_wagging_var * wagging_variance  # 분산이 낮을수록 비용 감소
+        + w_wagging_penalty * wagging_fail_count
+    )
+
+
+def _count_team_category(
+    problem: MatchingProblem, assignment: np.ndarray, team_count: int
+) -> np.ndarray:
+    """
+    팀별 카테고리 값 인원수를 반환, shape (팀 수, 카테고리 수, 값의 최대 개수)
+    """
+    category_count = len(problem.category_values)
+    value_count = max(len(values) for values in problem.category_values)
+    count = np.zeros((team_count, category_count, value_count), dtype=np.int64)
+    np.add.at(
+        count,
+        (
+            np.asarray(assignment)[:, None],
+            np.arange(category_count)[None, :],
+            problem.category_code,
+        ),
+        1,
+    )
+    return count
+
+
+def _category_scores_from_count(
+    problem: MatchingProblem, count: np.ndarray, team_size: np.ndarray
+) -> np.ndarray:
+    """
+    팀별 카테고리 값 인원수로부터 팀 카테고리 점수를 배열 연산으로 계산
+
+    input:
+        - count: shape (팀 수, 카테고리 수, 값의 최대 개수)
+        - team_size: shape (팀 수,)
+
+    return:
+        - category_scores: shape (팀 수,)
+    """
+    weight = problem.category_weight
+    exact = problem.config.exact_scoring
+    rate = count / team_size[:, None, None]
+    if not exact:
+        rate = _round_score(rate)
+    best = rate.argmax(axis=2)  # 가장 많이 선택된 값 (동률이면 앞선 값)
+    best_rate = np.take_along_axis(rate, best[:, :, None], axis=2)[:, :, 0]
+    best_weight = weight[np.arange(weight.shape[0])[None, :], best]
+    team_score = (
+        (best_rate * best_weight).sum(axis=1) / weight.shape[0] / problem.max_weight
+    )
+    if not exact:
+        team_score = _round_score(team_score)
+    return team_score * 100
+
+
+def _round_score(value):
+    """
+    round(value, 2) 와 같은 반올림 (배열이면 원소별로 같은 결과)
+    np.round 는 100 을 곱한 값을 반올림하므로 0.5 경계 부근에서 round 와 결과가 달라질 수 있음
+    경계 부근의 원소만 round 로 다시 계산해서, 스칼라 경로 / 배열 경로 / category.py 가 같은 점수를 내게 함
+    """
+    if not isinstance(value, np.ndarray):
+        return round(value, 2)
+    rounded = np.round(value, 2)
+    scaled = value * 100
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(item, 2) for item in value[near_half].tolist()]
+    return rounded
+
+
+def _gather_csr(
+    indptr: np.ndarray, indices: np.ndarray, rows: np.ndarray
+) -> tuple[np.ndarray]:
+    """
+    CSR 에서 여러 행의 원소를 한 번에 모아서 반환
+
+    return:
+        - row: 원소별로 속한 행의 위치 (rows 기준 0 ~ K-1)
+        - value: 원소 값
+    """
+    start = indptr[rows]
+    degree = indptr[rows + 1] - start
+    row = np.repeat(np.arange(len(rows)), degree)
+    offset = np.arange(degree.sum()) - np.repeat(np.cumsum(degree) - degree, degree)
+    return row, indices[np.repeat(start, degree) + offset]
@@ -5,9 +5,9 @@ TODO:
 """
 
 import json
-from parameter import CATEGORY, PART_MIN
+from parameter import DEFAULT_CONFIG, MatchingConfig
 from category import _get_team_category_rate
-from wagging import _get_wagging_dict
+from wagging import compile_wagging_index
 from pydantic import BaseModel, TypeAdapter
 from llm_call import call_llm
 from dotenv import load_dotenv
@@ -15,7 +15,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-def _get_team_info_list(team_list, waggings):
+def _get_team_info_list(
+    team_list, waggings, wagging_index=None, config: MatchingConfig = None
+):
     """
     팀 매칭 결과에 대한 설명글을 작성하기 위해 LLM에 전달할 팀별 통계 데이터를 반환
 
@@ -52,6 +54,10 @@ def _get_team_info_list(team_list, waggings):
             {wagging info}
         ]
 
+        - wagging_index: 미리 생성한 WaggingIndex (없으면 waggings 로부터 생성)
+
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+
     Returns:
         - team_info_list = [
             {
@@ -73,21 +79,28 @@ def _get_team_info_list(team_list, waggings):
             ...
         ]
     """
+    config = config or DEFAULT_CONFIG
     team_info_list = []
-    wagging_dict = _get_wagging_dict(waggings)
+    if wagging_index is None:
+        wagging_index = compile_wagging_index(
+            waggings, [member["id"] for team in team_list for member in team]
+        )
 
     for team in team_list:
-        team_info = {part: 0 for part in PART_MIN}
+        team_info = {part: 0 for part in config.parts}
 
         # 파트별 인원수
         for member in team:
             team_info[member["part"]] += 1
 
         # 팀별 가장 높은 카테고리 데이터와 비율
-        team_category_rate = _get_team_category_rate(team)
+        team_category_rate = _get_team_category_rate(team, config)
         for key, rate_dict in team_category_rate.items():
             max_value, rate = max(rate_dict.items(), key=lambda x: x[1])
-            team_info[key] = (max_value, rate)
+            team_info[key] = (
+                max_value,
+                round(rate, 2),
+            )  # 설명에는 소수점 둘째 자리까지
 
         # 팀별 mbti 통계
         ei_mean = sum([member["ei"] for member in team]) / len(team)
@@ -104,15 +117,18 @@ def _get_team_info_list(team_list, waggings):
 
         # 꼬리흔들기 짝궁 구하기
         wagging_pairs = []
+        team_index = [wagging_index.index.get(member["id"]) for member in team]
         for i in range(len(team)):
             member1 = team[i]
-            waggees = wagging_dict.get(member1["id"], set())
+            if team_index[i] is None:
+                continue
+            waggees = set(wagging_index.waggees(team_index[i]).tolist())
 
             for j in range(len(team)):
                 if i == j:
                     continue
                 member2 = team[j]
-                if member2["id"] in waggees:
+                if team_index[j] in waggees:
                     wagging_pairs.append(
                         [
                             f"{member1["devti"]}({member1["part"]})",
@@ -126,7 +142,9 @@ def _get_team_info_list(team_list, waggings):
     return team_info_list
 
 
-def get_matching_explanations(team_list):
+def get_matching_explanations(
+    team_list, wagging_index=None, config: MatchingConfig = None
+):
     """
     Args:
         - team_list = [
@@ -151,12 +169,16 @@ def get_matching_explanations(team_list):
             ...
         ]
 
+        - wagging_index: 미리 생성한 WaggingIndex (없으면 꼬리흔들기 데이터로부터 생성)
+
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+
     Returns:
         - reasons: 각 팀마다 팀 매칭 설명을 담아서 반환
     """
     with open("sample_data/wagging.json", "r", encoding="utf-8") as f:
         waggings = json.load(f)
-    team_info_list = _get_team_info_list(team_list, waggings)
+    team_info_list = _get_team_info_list(team_list, waggings, wagging_index, config)
     response = call_llm(team_info_list)
 
     return response
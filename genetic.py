@@ -0,0 +1,194 @@
+import random
+
+import numpy as np
+
+from budget import SearchBudget
+from evaluator import IncrementalEvaluator, evaluate_assignment
+from moves import SwapMove, SwapSampler
+from problem import MatchingProblem
+from seeding import make_rng, numpy_rng
+
+
+def _shuffle_within_parts(
+    assignment: np.ndarray, part_code: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    같은 파트의 참가자끼리 팀 번호를 무작위로 섞은 배열 (팀별 파트 인원 구성은 그대로)
+    """
+    shuffled = assignment.copy()
+    for part in np.unique(part_code):
+        members = np.flatnonzero(part_code == part)
+        shuffled[members] = rng.permutation(assignment[members])
+    return shuffled
+
+
+def _part_preserving_crossover(
+    parent_a: np.ndarray,
+    parent_b: np.ndarray,
+    part_code: np.ndarray,
+    team_count: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    두 부모의 팀 구성을 섞은 자식 팀 번호 배열을 반환
+    모든 해는 같은 초기 매칭에서 같은 파트끼리의 교환으로만 만들어지므로 팀별 파트 인원수
+    (_get_team_template 의 결과)가 같고, 자식도 이 인원수를 그대로 지킴
+
+    1) 무작위로 고른 절반의 팀은 부모 A 의 구성원을 그대로 물려받음
+    2) 나머지 참가자는 부모 B 에서 속했던 팀에 그 파트 자리가 남아 있으면 그 팀으로
+    3) 그래도 남은 참가자는 그 파트의 남은 자리에 무작위로 배정
+    """
+    part_index = part_code + 1  # 알 수 없는 파트(-1)도 하나의 파트로 취급
+    capacity = np.zeros((team_count, part_index.max() + 1), dtype=np.int64)
+    np.add.at(capacity, (parent_a, part_index), 1)
+
+    child = np.full(len(parent_a), -1, dtype=parent_a.dtype)
+
+    # 1) 부모 A 에서 팀 단위로 물려받기
+    from_a = rng.random(team_count) < 0.5
+    inherited = from_a[parent_a]
+    child[inherited] = parent_a[inherited]
+    np.subtract.at(capacity, (parent_a[inherited], part_index[inherited]), 1)
+
+    # 2) 부모 B 의 팀으로 (자리가 남은 경우만)
+    for idx in rng.permutation(np.flatnonzero(~inherited)):
+        team_idx = parent_b[idx]
+        if capacity[team_idx, part_index[idx]]:
+            child[idx] = team_idx
+            capacity[team_idx, part_index[idx]] -= 1
+
+    # 3) 남은 자리 채우기
+    for idx in rng.permutation(np.flatnonzero(child == -1)):
+        open_teams = np.flatnonzero(capacity[:, part_index[idx]])
+        team_idx = open_teams[rng.integers(len(open_teams))]
+        child[idx] = team_idx
+        capacity[team_idx, part_index[idx]] -= 1
+
+    return child
+
+
+def _local_search(
+    problem: MatchingProblem,
+    assignment: np.ndarray,
+    team_count: int,
+    iterations: int,
+    rng: random.Random,
+) -> tuple[np.ndarray, float]:
+    """
+    같은 파트끼리의 교환 중 점수가 좋아지는 것만 채택하는 언덕 오르기 (memetic 개선 단계)
+    """
+    evaluator = IncrementalEvaluator(problem, assignment, team_count)
+    sampler = SwapSampler(problem.part_code.tolist(), evaluator.team_of, rng)
+
+    for _ in range(iterations):
+        swap = sampler.sample()
+        if swap is None:
+            break
+        current_score = evaluator.score
+        move = SwapMove(
+            evaluator,
+            evaluator.position(swap[0]),
+            evaluator.position(swap[1]),
+            sampler,
+        )
+        if move.apply() >= current_score:
+            move.undo()
+
+    return evaluator.snapshot(), evaluator.score
+
+
+def genetic_search(
+    problem: MatchingProblem,
+    assignment: np.ndarray,
+    team_count: int,
+    budget: SearchBudget,
+    population_size=16,
+    generations=300,
+    local_search_iterations=200,
+    tournament_size=2,
+    rng=None,
+):
+    """
+    파트 보존 교차와 지역 탐색을 결합한 유전(memetic) 알고리즘
+    (matching.SOLVERS 에 "genetic" 으로 등록되는 solver)
+
+    - 초기 집단: 입력 매칭 + 같은 파트끼리 팀 번호를 섞은 매칭들 (각각 지역 탐색으로 개선)
+    - 세대마다 토너먼트로 부모 두 개를 고르고, 파트 보존 교차로 만든 자식을 지역 탐색으로 개선
+    - 자식이 집단에서 가장 나쁜 해보다 좋고 같은 점수의 해가 없으면 가장 나쁜 해를 대체 (steady-state)
+
+    input:
+        - problem: MatchingProblem
+        - assignment: 초기 팀 번호 배열
+        - team_count: 팀의 개수
+        - budget: 종료 조건 (SearchBudget, patience 는 세대 수 기준)
+        - population_size: 집단 크기
+        - generations: 최대 세대 수
+        - local_search_iterations: 해마다 수행할 지역 탐색 교환 시도 횟수
+        - tournament_size: 부모 선택 토너먼트 크기
+        - rng: 이 탐색 전용 난수 생성기 (seeding.make_rng 참고)
+
+    return:
+        - best_assignment: 가장 좋은 팀 번호 배열
+        - best_score: 가장 좋은 점수
+        - stats = {"generations": 300, "replacements": 87}
+    """
+    if population_size < 2:
+        raise ValueError("집단 크기는 2 이상이어야 합니다.")
+    if problem.constraints:
+        # 파트 보존 교차와 초기 집단의 섞기는 같은 팀 / 다른 팀 제약을 지키지 않음
+        raise ValueError("유전 알고리즘은 같은 팀 / 다른 팀 제약을 지원하지 않습니다.")
+
+    rng = make_rng(rng)
+    # 배열 단위 난수(섞기, 교차)는 rng 에서 시드를 받은 numpy 난수로 뽑음
+    np_rng = numpy_rng(rng)
+    assignment = np.asarray(assignment)
+
+    population = [(assignment, evaluate_assignment(problem, assignment, team_count))]
+    while len(population) < population_size and not budget.exhausted(0):
+        population.append(
+            _local_search(
+                problem,
+                _shuffle_within_parts(assignment, problem.part_code, np_rng),
+                team_count,
+                local_search_iterations,
+                rng,
+            )
+        )
+
+    best_assignment, best_score = min(population, key=lambda member: member[1])
+
+    def select():
+        contestants = rng.sample(population, min(tournament_size, len(population)))
+        return min(contestants, key=lambda member: member[1])[0]
+
+    generation = 0
+    replacements = 0
+    while generation < generations and len(population) >= 2:
+        if budget.exhausted(generation):
+            break
+
+        child = _part_preserving_crossover(
+            select(), select(), problem.part_code, team_count, np_rng
+        )
+        child, child_score = _local_search(
+            problem, child, team_count, local_search_iterations, rng
+        )
+
+        worst = max(range(len(population)), key=lambda k: population[k][1])
+        if child_score < population[worst][1] and all(
+            child_score != score for _, score in population
+        ):
+            population[worst] = (child, child_score)
+            replacements += 1
+
+        if child_score < best_score:
+            best_assignment, best_score = child, child_score
+            budget.improved(generation, best_score)
+
+        generation += 1
+
+    return (
+        best_assignment,
+        best_score,
+        {"generations": generation, "replacements": replacements},
+    )
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+def linear_sum_assignment(cost: np.ndarray) -> tuple[np.ndarray]:
+    """
+    비용 행렬에서 행마다 서로 다른 열 하나씩을 골라 비용 합이 최소가 되는 배정을 반환
+    (헝가리안 알고리즘의 최단 증가 경로 방식, O(n^2 m), scipy.optimize.linear_sum_assignment 와 같은 형식)
+
+    행을 하나씩 추가하면서 열 방향 연산은 배열 연산으로 처리함
+
+    input:
+        - cost: shape (n, m) 비용 행렬
+
+    return:
+        - row_ind: 배정된 행 번호 (오름차순)
+        - col_ind: row_ind 에 배정된 열 번호
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.ndim != 2:
+        raise ValueError("비용 행렬은 2차원 배열이어야 합니다.")
+    if not np.isfinite(cost).all():
+        raise ValueError("비용 행렬에 유한하지 않은 값이 있습니다.")
+
+    # 행이 열보다 많으면 전치해서 풀고 결과를 되돌림
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+
+    # 0 번 열은 증가 경로의 시작점으로 사용하는 가상 열 (행/열 번호는 1부터)
+    u = np.zeros(n + 1)  # 행 포텐셜
+    v = np.zeros(m + 1)  # 열 포텐셜
+    row_of = np.zeros(m + 1, dtype=np.int64)  # 열에 배정된 행 (0 이면 미배정)
+    way = np.zeros(m + 1, dtype=np.int64)  # 증가 경로에서 직전 열
+
+    for i in range(1, n + 1):
+        row_of[0] = i
+        col = 0
+        min_slack = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+
+        # 미배정 열에 도달할 때까지 최단 증가 경로 확장
+        while True:
+            used[col] = True
+            row = row_of[col]
+            free = ~used
+            slack = cost[row - 1] - u[row] - v[1:]
+            improved = free[1:] & (slack < min_slack[1:])
+            min_slack[1:][improved] = slack[improved]
+            way[1:][improved] = col
+
+            masked = np.where(free, min_slack, np.inf)
+            next_col = int(masked.argmin())
+            delta = masked[next_col]
+
+            u[row_of[used]] += delta
+            v[used] -= delta
+            min_slack[free] -= delta
+
+            col = next_col
+            if row_of[col] == 0:
+                break
+
+        # 증가 경로를 따라 배정 갱신
+        while col:
+            prev_col = way[col]
+            row_of[col] = row_of[prev_col]
+            col = prev_col
+
+    col_ind = np.flatnonzero(row_of[1:])
+    row_ind = row_of[1:][col_ind] - 1
+    if transposed:
+        row_ind, col_ind = col_ind, row_ind
+    order = np.argsort(row_ind)
+    return row_ind[order], col_ind[order]
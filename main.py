@@ -3,9 +3,12 @@ import json
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
-from matching import random_team_assignment, simulated_annealing, evaluate_solution
-from category import get_category_score
-from wagging import get_wagging_score
+from matching import SOLVERS, initial_team_assignment, solve, evaluate_solution
+from parameter import DEFAULT_CONFIG
+from cache import ResultCache, matching_key
+from seeding import make_rng
+from category import get_category_score, _get_category_weight
+from wagging import compile_wagging_index, get_wagging_score
 from explain import get_matching_explanations
 
 # 페이지 설정
@@ -22,6 +25,12 @@ def load_data():
     return participants, waggings
 
 
+@st.cache_resource
+def load_result_cache():
+    # 같은 입력으로 매칭을 다시 실행하면 저장된 결과(LLM 설명 포함)를 바로 사용
+    return ResultCache()
+
+
 @st.cache_data
 def load_devti_data():
     with open("sample_data/devti_list.json", "r", encoding="utf-8") as f:
@@ -29,8 +38,23 @@ def load_devti_data():
     return devti_list
 
 
+# 탐색과 점수 계산은 반올림하지 않은 정확한 점수를 사용 (반올림은 화면에 표시할 때만 적용)
+scoring_config = DEFAULT_CONFIG.replace(exact_scoring=True)
+
+
+@st.cache_resource
+def load_scoring_tables():
+    # 꼬리흔들기 인덱스와 카테고리 가중치는 한 번만 생성해서 점수 계산/설명 생성에 함께 사용
+    # (위젯을 조작할 때마다 스크립트가 다시 실행되어도 다시 계산하지 않음)
+    participants, waggings = load_data()
+    wagging_index = compile_wagging_index(waggings, [p["id"] for p in participants])
+    category_weight = _get_category_weight([participants], scoring_config)
+    return wagging_index, category_weight
+
+
 participants, waggings = load_data()
 devti_list = load_devti_data()
+wagging_index, category_weight = load_scoring_tables()
 
 st.title("🎯 팀 매칭 알고리즘 데모")
 st.markdown("---")
@@ -107,34 +131,78 @@ with tab1:
     # 매칭 실행 버튼
     st.header("🚀 팀 매칭 실행")
 
+    initial_method = st.radio(
+        "초기 매칭 방식",
+        options=["greedy", "random"],
+        format_func=lambda method: {
+            "greedy": "탐욕적 배치 (꼬리흔들기/카테고리 기반)",
+            "random": "랜덤 배치",
+        }[method],
+        horizontal=True,
+    )
+    solver_name = st.selectbox("탐색 엔진", options=list(SOLVERS), index=0)
+    team_count = st.number_input(
+        "팀 개수", min_value=1, value=DEFAULT_CONFIG.team_count, step=1
+    )
+    seed = st.number_input("난수 시드", min_value=0, value=0, step=1)
+
+    def run_matching(config):
+        # 이번 매칭 전용 난수 생성기 (다른 세션의 매칭과 난수 상태를 공유하지 않음)
+        rng = make_rng(int(seed))
+
+        # 초기 매칭
+        initial_teams = initial_team_assignment(
+            participants, waggings, method=initial_method, config=config, seed=rng
+        )
+        initial_score = evaluate_solution(initial_teams, waggings, config)
+
+        # 최적화된 매칭 (선택한 탐색 엔진, 엔진별 기본 설정)
+        optimized_teams, optimized_score, _ = solve(
+            initial_teams,
+            waggings=waggings,
+            solver=solver_name,
+            time_limit=2.5,
+            config=config,
+            seed=rng,
+        )
+
+        # 매칭 이유 생성
+        matching_reasons = get_matching_explanations(
+            optimized_teams, wagging_index, config
+        )
+
+        return {
+            "initial_teams": initial_teams,
+            "initial_score": initial_score,
+            "optimized_teams": optimized_teams,
+            "optimized_score": optimized_score,
+            "matching_reasons": matching_reasons,
+        }
+
     if st.button("매칭 시작", type="primary", use_container_width=True):
         with st.spinner("매칭 알고리즘 실행 중..."):
-            # 초기 랜덤 매칭
-            initial_teams = random_team_assignment(participants)
-            initial_score = evaluate_solution(initial_teams, waggings)
-
-            # 최적화된 매칭
-            optimized_teams, optimized_score = simulated_annealing(
-                initial_teams,
-                waggings=waggings,
-                initial_temp=1.0,
-                min_temp=0.001,
-                cooling_rate=0.995,
-                max_iterations=10000,
+            # 이번 매칭에만 사용하는 설정 (다른 세션의 매칭과 공유하지 않음)
+            config = scoring_config.replace(team_count=int(team_count))
+
+            # 입력 / 설정 / 시드 / 탐색 설정이 모두 같으면 저장된 결과를 사용
+            key = matching_key(
+                participants,
+                waggings,
+                config,
+                seed=int(seed),
+                initial_method=initial_method,
+                solver=solver_name,
+                time_limit=2.5,
+            )
+            result, cache_hit = load_result_cache().get_or_compute(
+                key, lambda: run_matching(config)
             )
-
-            # 매칭 이유 생성
-            matching_reasons = get_matching_explanations(optimized_teams)
 
             # 세션 상태에 저장
-            st.session_state["initial_teams"] = initial_teams
-            st.session_state["initial_score"] = initial_score
-            st.session_state["optimized_teams"] = optimized_teams
-            st.session_state["optimized_score"] = optimized_score
-            st.session_state["matching_reasons"] = matching_reasons
+            st.session_state.update(result)
             st.session_state["matching_done"] = True
 
-        st.success("매칭 완료!")
+        st.success("매칭 완료! (저장된 결과 사용)" if cache_hit else "매칭 완료!")
         st.rerun()
 
     # 매칭 결과 표시
@@ -150,16 +218,21 @@ with tab1:
         # 팀별 점수 비교
         st.subheader("팀별 점수 상세 비교")
 
-        initial_category_scores = get_category_score(initial_teams)
-        optimized_category_scores = get_category_score(optimized_teams)
+        initial_category_scores = get_category_score(
+            initial_teams, category_weight, scoring_config
+        )
+        optimized_category_scores = get_category_score(
+            optimized_teams, category_weight, scoring_config
+        )
 
         initial_wagging_scores, initial_team_wagging = get_wagging_score(
-            initial_teams, waggings
+            initial_teams, waggings, wagging_index, scoring_config
         )
         optimized_wagging_scores, optimized_team_wagging = get_wagging_score(
-            optimized_teams, waggings
+            optimized_teams, waggings, wagging_index, scoring_config
         )
 
+        # 표시할 때만 소수점 첫째 자리로 반올림 (점수는 이미 100 을 곱한 값)
         score_df = pd.DataFrame(
             {
                 "팀": [f"Team {i+1}" for i in range(len(initial_teams))],
@@ -168,7 +241,7 @@ with tab1:
                 "초기 꼬리흔들기 매칭 일치도(%)": initial_team_wagging,
                 "최적화 꼬리흔들기 매칭 일치도(%)": optimized_team_wagging,
             }
-        )
+        ).round(1)
 
         st.dataframe(score_df, use_container_width=True)
 
@@ -303,7 +376,7 @@ with tab1:
 
                     # 팀원별 꼬리흔들기 정보 추가
                     st.subheader("팀원별 꼬리흔들기 현황")
-                    team_ids = [m["id"] for m in team]
+                    team_ids = {m["id"] for m in team}
                     wagging_info = []
 
                     # 현재 팀의 개별 wagging 점수 가져오기
@@ -317,9 +390,11 @@ with tab1:
                     for idx, member in enumerate(team):
                         my_id = member["id"]
                         my_waggees = [
-                            w["waggee"]
-                            for w in waggings
-                            if w["wagger"] == my_id and w["waggee"] in team_ids
+                            int(wagging_index.ids[waggee])
+                            for waggee in wagging_index.waggees(
+                                wagging_index.index[my_id]
+                            )
+                            if int(wagging_index.ids[waggee]) in team_ids
                         ]
                         wagging_info.append(
                             {
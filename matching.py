@@ -1,12 +1,26 @@
-import random
 import math
+import random
+import time
 
-from category import get_category_score
-from wagging import get_wagging_score
-from parameter import TEAM_COUNT, PART_MIN
+import numpy as np
 
+from budget import SearchBudget
+from checkpoint import load_checkpoint, save_checkpoint
+from constraints import compile_constraints
+from evaluator import IncrementalEvaluator, evaluate_assignment
+from genetic import genetic_search
+from moves import AdaptiveMoveSelector, SwapMove, SwapSampler, sample_part_reassign
+from problem import MatchingProblem, compile_problem
+from seeding import make_rng, numpy_rng
+from tabu import tabu_search
+from telemetry import SolverTelemetry
+from tempering import tempering_search
+from parameter import DEFAULT_CONFIG, MatchingConfig
 
-def _get_team_template(participant_list: list[dict]) -> list[str, int]:
+
+def _get_team_template(
+    participant_list: list[dict], team_count: int = None, config: MatchingConfig = None
+) -> list[str, int]:
     """
     참가자 수와 파트당 인원에 적절한 팀 매칭 템플릿을 생성
 
@@ -28,6 +42,10 @@ def _get_team_template(participant_list: list[dict]) -> list[str, int]:
             {participant}
         ]
 
+        - team_count: 생성할 팀의 개수 (기본값: config.team_count)
+
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+
     return:
         - team_template = [
             {
@@ -40,8 +58,12 @@ def _get_team_template(participant_list: list[dict]) -> list[str, int]:
             {team size},
         ]
     """
+    config = config or DEFAULT_CONFIG
+    if team_count is None:
+        team_count = config.team_count
+
     part_total = {
-        role: 0 for role in PART_MIN.keys()
+        role: 0 for role in config.part_min.keys()
     }  # 팀 매칭 참여자들의 파트별 인원수 통계값
     for participant in participant_list:
         if participant.get("part") not in part_total:
@@ -51,33 +73,113 @@ def _get_team_template(participant_list: list[dict]) -> list[str, int]:
             continue
         part_total[participant["part"]] += 1
 
-    # TEAM_COUNT 만큼의 팀을 생성할 수 있는지 여부 판단
+    # team_count 만큼의 팀을 생성할 수 있는지 여부 판단
     team_max = min(
         (part_total[part] // min_cnt) if min_cnt > 0 else float("inf")
-        for part, min_cnt in PART_MIN.items()
+        for part, min_cnt in config.part_min.items()
     )
-    if TEAM_COUNT > team_max:
+    if team_count > team_max:
         print("설정한 팀의 개수만큼 팀을 생성할 수 없습니다.")
         return []
 
     team_template = [
-        {part: part_total[part] // TEAM_COUNT for part in part_total.keys()}
-        for _ in range(TEAM_COUNT)
+        {part: part_total[part] // team_count for part in part_total.keys()}
+        for _ in range(team_count)
     ]
 
     # 파트별로 남은 인원 분배
-    leftovers = {part: part_total[part] % TEAM_COUNT for part in part_total.keys()}
+    leftovers = {part: part_total[part] % team_count for part in part_total.keys()}
     team_idx = 0
 
     for part, left_count in leftovers.items():
         for _ in range(left_count):
             team_template[team_idx][part] += 1
-            team_idx = (team_idx + 1) % TEAM_COUNT
+            team_idx = (team_idx + 1) % team_count
 
     return team_template
 
 
-def random_team_assignment(participant_list: list[dict]) -> list[dict]:
+def _place_constrained(
+    participant_list: list[dict],
+    team_template: list[dict],
+    config: MatchingConfig,
+    rng,
+) -> tuple[list[list[dict]], list[dict]]:
+    """
+    같은 팀 / 다른 팀 제약(config.together, config.apart)이 있는 참가자를 먼저 팀에 배정
+    나머지 자리는 제약이 없는 참가자로 채우므로, 초기 매칭이 처음부터 제약을 지킴
+
+    - 같은 팀 묶음 하나, 또는 다른 팀 제약만 있는 참가자 한 명을 하나의 단위로 보고 큰 단위부터 배정
+    - 단위마다 파트별 남은 자리가 충분하고, 이미 배정한 참가자와 다른 팀 제약이 겹치지 않는 팀 중 무작위로 선택
+
+    input:
+        - participant_list: 참가자 목록
+        - team_template: _get_team_template 의 팀 매칭 템플릿
+        - config: 매칭 설정
+        - rng: 난수 생성기
+
+    return:
+        - placed: 팀별로 먼저 배정한 참가자 목록
+        - remaining_template: 팀별 남은 자리 (team_template 형식)
+    """
+    placed = [[] for _ in team_template]
+    remaining_template = [dict(template) for template in team_template]
+    if not (config.together or config.apart):
+        return placed, remaining_template
+
+    participants = [
+        participant
+        for participant in participant_list
+        if participant.get("part") in config.part_index
+    ]
+    constraints = compile_constraints(
+        [participant["id"] for participant in participants], config
+    )
+    apart_mask = constraints.apart_mask or [0] * len(participants)
+    units = [list(members) for members in constraints.groups] + [
+        [idx]
+        for idx in range(len(participants))
+        if constraints.group_of[idx] < 0 and apart_mask[idx]
+    ]
+    rng.shuffle(units)
+    units.sort(key=len, reverse=True)
+
+    team_mask = [0] * len(team_template)
+    for members in units:
+        # 묶음 안에는 떨어뜨려야 하는 쌍이 없으므로 OR 로 합쳐도 팀 마스크와 같음
+        unit_mask = 0
+        need = {}
+        for idx in members:
+            unit_mask |= apart_mask[idx]
+            part = participants[idx]["part"]
+            need[part] = need.get(part, 0) + 1
+
+        feasible = [
+            team_idx
+            for team_idx, template in enumerate(remaining_template)
+            if not team_mask[team_idx] & unit_mask
+            and all(template.get(part, 0) >= count for part, count in need.items())
+        ]
+        if not feasible:
+            raise ValueError(
+                f"제약 조건을 지키는 팀 매칭을 만들 수 없습니다.\n참가자: {[participants[idx]['id'] for idx in members]}"
+            )
+
+        team_idx = rng.choice(feasible)
+        team_mask[team_idx] |= unit_mask
+        for part, count in need.items():
+            remaining_template[team_idx][part] -= count
+        placed[team_idx].extend(participants[idx] for idx in members)
+
+    return placed, remaining_template
+
+
+def random_team_assignment(
+    participant_list: list[dict],
+    team_count: int = None,
+    config: MatchingConfig = None,
+    seed=None,
+) -> list[dict]:
     """
     초기 팀 매칭 템플릿을 랜덤으로 생성
 
@@ -110,6 +212,12 @@ def random_team_assignment(participant_list: list[dict]) -> list[dict]:
             {team size},
         ]
 
+        - team_count: 생성할 팀의 개수 (기본값: config.team_count)
+
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+
+        - seed: 난수 시드 (정수 | random.Random, seeding.make_rng 참고)
+
     return:
         - team_list = [
             [
@@ -133,20 +241,30 @@ def random_team_assignment(participant_list: list[dict]) -> list[dict]:
             []
         ]
     """
-    team_template = _get_team_template(participant_list)
+    config = config or DEFAULT_CONFIG
+    rng = make_rng(seed)
+    team_template = _get_team_template(participant_list, team_count, config)
     if not team_template:
         raise ValueError("요청하신 개수만큼의 팀을 생성할 수 없습니다.")
 
-    part_groups = {part: [] for part in PART_MIN.keys()}
+    part_groups = {part: [] for part in config.parts}
+
+    # 제약이 있는 참가자를 먼저 배정하고, 남은 자리만 랜덤으로 채움
+    placed, team_template = _place_constrained(
+        participant_list, team_template, config, rng
+    )
+    placed_ids = {participant["id"] for team in placed for participant in team}
 
     # 참여자들을 파트별로 분리해서 저장
     for participant in participant_list:
+        if placed_ids and participant["id"] in placed_ids:
+            continue
         part = participant.get("part")
         part_groups[part].append(participant)
 
     # 파트별로 랜덤하게 셔플
     for part in part_groups.keys():
-        random.shuffle(part_groups[part])
+        rng.shuffle(part_groups[part])
 
     team_list = []
     for team_id in range(len(team_template)):
@@ -165,15 +283,233 @@ def random_team_assignment(participant_list: list[dict]) -> list[dict]:
                 person = part_groups[part].pop()
                 team.append(person)
 
+        if placed[team_id]:
+            team = sorted(
+                placed[team_id] + team,
+                key=lambda member: config.part_index[member["part"]],
+            )
         team_list.append(team)
 
     return team_list
 
 
-def evaluate_solution(team_list: list[list[dict]], waggings: list[dict] = None):
+def greedy_team_assignment(
+    participant_list: list[dict],
+    waggings: list[dict] = None,
+    team_count: int = None,
+    candidate_sample: int = 8,
+    config: MatchingConfig = None,
+    seed=None,
+) -> list[list[dict]]:
+    """
+    _get_team_template 의 파트별 자리를 탐욕적으로 채우는 초기 팀 매칭
+    random_team_assignment 와 입력/출력 형식이 같고, 팀별 파트 구성도 같음
+
+    팀을 하나씩 키워 나가며, 빈 자리마다 아직 배정되지 않은 참가자 중 점수가 가장 좋은 사람을 넣음
+    - 팀원과 꼬리흔들기 관계가 있는 참가자를 우선 (맞꼬리흔들기면 양쪽 모두 적중)
+    - 특히 적중 0회인 사람(본인 또는 팀원)을 벗어나게 하는 참가자를 가장 우선
+    - 그 다음으로 team_vibe / active_hours / meeting_preference 값이 같은 팀원이 많은 참가자
+
+    후보는 팀원과 꼬리흔들기 관계가 있는 참가자와, 필요한 파트의 미배정 참가자 중 무작위 candidate_sample 명으로
+    제한하므로 참가자 수가 많아도 자리당 비용이 일정함
+
+    input:
+        - participant_list: 참가자 목록
+        - waggings: 꼬리흔들기 목록
+        - team_count: 생성할 팀의 개수 (기본값: config.team_count)
+        - candidate_sample: 파트마다 꼬리흔들기 관계와 무관하게 비교할 참가자 수
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+        - seed: 난수 시드 (정수 | random.Random, seeding.make_rng 참고)
+
+    return:
+        - team_list: random_team_assignment 와 같은 형식
+    """
+    config = config or DEFAULT_CONFIG
+    rng = make_rng(seed)
+    team_template = _get_team_template(participant_list, team_count, config)
+    if not team_template:
+        raise ValueError("요청하신 개수만큼의 팀을 생성할 수 없습니다.")
+
+    participant_by_id = {
+        participant["id"]: participant
+        for participant in participant_list
+        if participant.get("part") in config.part_index
+    }
+
+    # 꼬리흔들기 관계 (나가는 방향 / 들어오는 방향)
+    waggees = {participant_id: set() for participant_id in participant_by_id}
+    waggers = {participant_id: set() for participant_id in participant_by_id}
+    for wagging in waggings or []:
+        wagger, waggee = wagging["wagger"], wagging["waggee"]
+        if wagger in participant_by_id and waggee in participant_by_id:
+            waggees[wagger].add(waggee)
+            waggers[waggee].add(wagger)
+    linked = {
+        participant_id: waggees[participant_id] | waggers[participant_id]
+        for participant_id in participant_by_id
+    }
+
+    # 파트별 미배정 참가자 (무작위 순서, 위치를 기억해서 O(1) 로 제거)
+    unplaced = {part: [] for part in config.parts}
+    for participant_id, participant in participant_by_id.items():
+        unplaced[participant["part"]].append(participant_id)
+    unplaced_pos = {}
+    for part, id_list in unplaced.items():
+        rng.shuffle(id_list)
+        for position, participant_id in enumerate(id_list):
+            unplaced_pos[participant_id] = position
+
+    def remove_unplaced(participant_id):
+        id_list = unplaced[participant_by_id[participant_id]["part"]]
+        position = unplaced_pos.pop(participant_id)
+        last = id_list.pop()
+        if last != participant_id:
+            id_list[position] = last
+            unplaced_pos[last] = position
+
+    # 제약이 있는 참가자를 먼저 배정 (남은 참가자에는 제약이 없으므로 이후에는 확인할 필요 없음)
+    placed, team_template = _place_constrained(
+        list(participant_by_id.values()), team_template, config, rng
+    )
+    for members in placed:
+        for member in members:
+            remove_unplaced(member["id"])
+
+    team_list = []
+    for template, members in zip(team_template, placed):
+        need = dict(template)
+        team = set()
+        hits = {}  # 팀원별 같은 팀 안의 꼬리흔들기 대상 수
+        category_count = {
+            key: {value: 0 for value in values}
+            for key, values in config.category.items()
+        }
+
+        def gain(participant_id):
+            participant = participant_by_id[participant_id]
+            own_hits = len(waggees[participant_id] & team)
+            member_hits = waggers[participant_id] & team
+            # 적중 0회 인원이 점수에 가장 크게 반영되므로, 0회에서 벗어나는 인원을 우선
+            rescued = (own_hits > 0) + sum(
+                hits[member_id] == 0 for member_id in member_hits
+            )
+            category_match = (
+                sum(
+                    category_count[key][participant[key]]
+                    for key in config.category_keys
+                )
+                / len(team)
+                if team
+                else 0
+            )
+            # 점수가 같으면 아직 배정되지 않은 관계가 많은 참가자 (이후 자리를 채울 후보가 많음)
+            open_links = sum(
+                other_id in unplaced_pos for other_id in linked[participant_id]
+            )
+            return (
+                10 * rescued + 2 * (own_hits + len(member_hits)) + category_match,
+                open_links,
+            )
+
+        def add(participant_id):
+            participant = participant_by_id[participant_id]
+            hits[participant_id] = len(waggees[participant_id] & team)
+            for member_id in waggers[participant_id] & team:
+                hits[member_id] += 1
+            for key in config.category_keys:
+                category_count[key][participant[key]] += 1
+            team.add(participant_id)
+
+        for member in members:
+            add(member["id"])
+
+        while any(need.values()):
+            # 후보: 팀원과 관계가 있는 미배정 참가자 + 필요한 파트의 미배정 참가자 중 무작위 일부
+            candidates = {
+                other_id
+                for member_id in team
+                for other_id in linked[member_id]
+                if other_id in unplaced_pos
+                and need[participant_by_id[other_id]["part"]]
+            }
+            for part, count in need.items():
+                if count:
+                    if not unplaced[part]:
+                        raise ValueError(
+                            f"팀 매칭에 필요한 파트원 수가 부족하여 매칭에 실패했습니다.\n파트: {part}"
+                        )
+                    candidates.update(
+                        rng.sample(
+                            unplaced[part], min(candidate_sample, len(unplaced[part]))
+                        )
+                    )
+
+            best_id = max(sorted(candidates), key=gain)
+            add(best_id)
+            need[participant_by_id[best_id]["part"]] -= 1
+            remove_unplaced(best_id)
+
+        # 팀 안에서는 random_team_assignment 와 같이 파트 순서로 정렬
+        team_list.append(
+            [
+                participant_by_id[member_id]
+                for part in config.parts
+                for member_id in sorted(team)
+                if participant_by_id[member_id]["part"] == part
+            ]
+        )
+
+    return team_list
+
+
+# 초기 팀 매칭 방법 (이름 -> 함수(participant_list, waggings, team_count, config, seed))
+INITIALIZERS = {
+    "random": lambda participant_list, waggings=None, team_count=None, config=None, seed=None: (
+        random_team_assignment(participant_list, team_count, config, seed)
+    ),
+    "greedy": lambda participant_list, waggings=None, team_count=None, config=None, seed=None: (
+        greedy_team_assignment(
+            participant_list, waggings, team_count, config=config, seed=seed
+        )
+    ),
+}
+
+
+def initial_team_assignment(
+    participant_list: list[dict],
+    waggings: list[dict] = None,
+    method: str = "random",
+    team_count: int = None,
+    config: MatchingConfig = None,
+    seed=None,
+) -> list[list[dict]]:
+    """
+    INITIALIZERS 에 등록된 방법으로 초기 팀 매칭을 생성
+
+    input:
+        - participant_list: 참가자 목록
+        - waggings: 꼬리흔들기 목록 (greedy 에서 사용)
+        - method: "random" | "greedy"
+        - team_count: 생성할 팀의 개수 (기본값: config.team_count)
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+        - seed: 난수 시드 (정수 | random.Random, seeding.make_rng 참고)
+    """
+    if method not in INITIALIZERS:
+        raise ValueError(f"알 수 없는 초기 매칭 방법입니다: {method}")
+    return INITIALIZERS[method](participant_list, waggings, team_count, config, seed)
+
+
+def evaluate_solution(
+    team_list: list[list[dict]],
+    waggings: list[dict] = None,
+    config: MatchingConfig = None,
+    problem: MatchingProblem = None,
+):
     """
     팀 매칭의 품질을 평가하는 함수
     낮은 점수일수록 좋은 매칭을 의미함 (최소화 문제)
+    compile_problem 으로 문제 표현을 만든 뒤 evaluate_assignment 로 계산하므로,
+    카테고리 가중치는 문제 표현마다 한 번만 계산됨
 
     input:
         - team_list = [
@@ -208,54 +544,25 @@ def evaluate_solution(team_list: list[list[dict]], waggings: list[dict] = None):
             {wagging info}
         ]
 
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG)
+
+        - problem: 같은 참가자 / 꼬리흔들기로 미리 만든 문제 표현 (MatchingProblem)
+          같은 참가자들의 여러 팀 매칭을 반복해서 평가할 때 전달하면 문제 표현을 다시 만들지 않음
+          (전달하면 waggings, config 는 사용하지 않음)
+
     return:
         - score: 알고리즘에 사용되는 점수
     """
+    if problem is None:
+        problem, assignment = compile_problem(team_list, waggings, config)
+    else:
+        assignment = problem.assignment_from_team_list(team_list)
 
-    # 카테고리 점수 계산 (높을수록 좋음)
-    category_scores = get_category_score(team_list)
-
-    # 카테고리 점수의 평균과 분산 계산
-    # 평균: 전체적인 매칭 품질
-    # 분산: 팀 간 균형 (분산이 낮을수록 모든 팀이 고르게 좋음)
-    category_mean = sum(category_scores) / len(category_scores)
-    category_variance = sum(
-        (score - category_mean) ** 2 for score in category_scores
-    ) / len(category_scores)
-
-    # 꼬리흔들기 점수 계산 (높을수록 좋음)
-    wagging_scores, _ = get_wagging_score(team_list, waggings)
-
-    # 꼬리흔들기에 성공하지 못한 사람의 수를 계산 후 패널티 부여
-    wagging_fail_count = wagging_scores.count(0)
-
-    wagging_mean = sum(wagging_scores) / len(wagging_scores)
-    wagging_variance = sum(
-        (score - wagging_mean) ** 2 for score in wagging_scores
-    ) / len(wagging_scores)
-
-    # 3. 최종 점수 계산 (낮을수록 좋게 변환)
-    # 가중치 설정
-    w_category_mean = 2.0  # 카테고리 매칭의 평균 품질
-    w_category_var = 0.1  # 팀 간 카테고리 균형
-    w_wagging_mean = 2.0  # 꼬리흔들기 매칭의 평균 품질
-    w_wagging_var = 0.1  # 팀 간 꼬리흔들기 균형
-    w_wagging_penalty = 50.0  # 꼬리흔들기 매칭 실패 패널티
-
-    # 높은 점수를 낮은 비용으로 변환 (음수 사용)
-    # 분산은 그대로 사용 (낮을수록 좋음)
-    score = (
-        -w_category_mean * category_mean  # 카테고리 평균이 높을수록 비용 감소
-        + w_category_var * category_variance  # 분산이 낮을수록 비용 감소
-        + -w_wagging_mean * wagging_mean  # 꼬리흔들기 평균이 높을수록 비용 감소
-        + w_wagging_var * wagging_variance  # 분산이 낮을수록 비용 감소
-        + w_wagging_penalty * wagging_fail_count
-    )
-
-    return score
+    # 카테고리 점수의 평균 / 분산 (팀 간 균형)과 꼬리흔들기 점수의 평균 / 분산, 실패 인원을 합친 점수
+    return evaluate_assignment(problem, assignment, len(team_list))
 
 
-def neighbor_solution(teams):
+def neighbor_solution(teams, seed=None):
     """
     현재 팀 매칭에서 두 명의 멤버를 교환하여 이웃 해를 생성
 
@@ -265,70 +572,322 @@ def neighbor_solution(teams):
             [member1, member2, ...],           # team 2
             ...
         ]
+        - seed: 난수 시드 (정수 | random.Random, seeding.make_rng 참고)
 
     return:
-        - new_teams: 새로운 팀 매칭 (깊은 복사)
+        - new_teams: 새로운 팀 매칭 (팀 리스트만 복사, 참가자 dict 는 공유)
     """
-    # 깊은 복사로 원본 teams 훼손 방지
-    new_teams = [[member.copy() for member in team] for team in teams]
+    # 팀 리스트만 복사해서 원본 teams 훼손 방지 (교환은 참가자 dict 를 수정하지 않음)
+    new_teams = [list(team) for team in teams]
 
-    # 팀이 2개 미만이거나 전체 인원이 2명 미만이면 swap 불가
-    if len(new_teams) < 2:
-        return new_teams
+    # 같은 파트끼리, 서로 다른 팀 사이에서만 교환 (재시도 없이 한 번에 선택)
+    positions = [
+        (team_idx, slot)
+        for team_idx, team in enumerate(new_teams)
+        for slot in range(len(team))
+    ]
+    sampler = SwapSampler(
+        [new_teams[team_idx][slot].get("part") for team_idx, slot in positions],
+        [team_idx for team_idx, _ in positions],
+        rng=seed,
+    )
+    swap = sampler.sample()
+    if swap is not None:
+        # 교환 수행
+        (team_a_idx, person_a_idx), (team_b_idx, person_b_idx) = (
+            positions[swap[0]],
+            positions[swap[1]],
+        )
+        person_a = new_teams[team_a_idx][person_a_idx]
+        person_b = new_teams[team_b_idx][person_b_idx]
+        new_teams[team_a_idx][person_a_idx] = person_b
+        new_teams[team_b_idx][person_b_idx] = person_a
 
-    total_members = sum(len(team) for team in new_teams)
-    if total_members < 2:
-        return new_teams
+    return new_teams
 
-    # 두 명의 멤버를 무작위로 선택하여 교환
-    max_iter = 200
-    for _ in range(max_iter):
-        # 랜덤하게 두 개의 다른 팀 선택
-        team_a_idx, team_b_idx = random.sample(range(len(new_teams)), 2)
 
-        # 각 팀이 비어있지 않은지 확인
-        if len(new_teams[team_a_idx]) == 0 or len(new_teams[team_b_idx]) == 0:
-            continue
+def simulated_annealing(
+    initial_solution,
+    waggings=None,
+    initial_temp=1.0,
+    min_temp=0.001,
+    cooling_rate=0.995,
+    max_iterations=10000,
+    time_limit=None,
+    patience=None,
+    callback=None,
+    report_interval=1000,
+    lns_interval=None,
+    lns_teams=16,
+    lns_size=128,
+    move_operators=None,
+    checkpoint_path=None,
+    checkpoint_interval=10000,
+    config=None,
+    seed=None,
+):
+    """
+    같은 파트끼리의 교환을 이웃으로 하는 simulated annealing
+    lns_interval 을 지정하면 그 간격마다 교환 대신 한 파트를 여러 팀에 걸쳐 최적으로 다시 배정하는
+    큰 이웃 이동(moves.PartReassignMove)을 시도함
 
-        # 각 팀에서 랜덤하게 한 명씩 선택
-        person_a_idx = random.randint(0, len(new_teams[team_a_idx]) - 1)
-        person_b_idx = random.randint(0, len(new_teams[team_b_idx]) - 1)
+    input:
+        - initial_solution: 초기 팀 매칭 (team_list 형식)
+        - waggings: 꼬리흔들기 목록
+        - initial_temp, min_temp, cooling_rate: 시작 온도 / 종료 온도 / 반복마다 곱하는 감온 비율
+        - max_iterations: 최대 반복 횟수
+        - time_limit: 최대 실행 시간 (초), 넘으면 그때까지의 best 를 반환
+        - patience: best 가 이 횟수만큼 개선되지 않으면 조기 종료
+        - callback: 진행 상황 snapshot 을 받는 함수 (telemetry.SolverTelemetry 참고), None 이면 기록 안 함
+        - report_interval: callback 을 호출하는 반복 간격
+        - lns_interval: 큰 이웃 이동을 시도하는 반복 간격, None 이면 교환만 사용
+        - lns_teams, lns_size: 큰 이웃 이동 한 번에 다시 배정할 팀 수 / 최대 참가자 수
+        - move_operators: 교환 대신 사용할 이동 연산자 이름 목록 (moves.MOVE_OPERATORS 참고)
+          지정하면 moves.AdaptiveMoveSelector 가 최근 성공률에 따라 연산자를 골라서 사용함, None 이면 교환만 사용
+        - checkpoint_path: 탐색 상태를 저장할 파일 경로, None 이면 저장 안 함
+          (중단된 탐색은 resume_simulated_annealing 으로 이어서 실행)
+        - checkpoint_interval: 탐색 상태를 저장하는 반복 간격
+        - config: 매칭 설정 (MatchingConfig, 기본값: DEFAULT_CONFIG)
+        - seed: 난수 시드 (정수 | random.Random, seeding.make_rng 참고)
+          같은 시드면 같은 결과이고, 전역 random 상태를 사용하지 않으므로 동시에 실행해도 서로 영향이 없음
 
-        person_a = new_teams[team_a_idx][person_a_idx]
-        person_b = new_teams[team_b_idx][person_b_idx]
+    return:
+        - best_solution: 가장 좋은 팀 매칭 (team_list 형식)
+        - best_score: 가장 좋은 점수
+    """
+    budget = SearchBudget(time_limit, patience)
 
-        # 같은 파트끼리만 교환 (파트 제약 유지)
-        if person_a.get("part") == person_b.get("part"):
-            # 교환 수행
-            new_teams[team_a_idx][person_a_idx] = person_b
-            new_teams[team_b_idx][person_b_idx] = person_a
-            break
+    # 참가자 목록을 배열 기반 문제 표현으로 한 번만 변환
+    problem, assignment = compile_problem(initial_solution, waggings, config)
+    problem.constraints.check(assignment)
+    team_count = len(initial_solution)
 
-    return new_teams
+    best_assignment, best_score, _ = annealing_search(
+        problem,
+        assignment,
+        team_count,
+        budget,
+        initial_temp=initial_temp,
+        min_temp=min_temp,
+        cooling_rate=cooling_rate,
+        max_iterations=max_iterations,
+        callback=callback,
+        report_interval=report_interval,
+        lns_interval=lns_interval,
+        lns_teams=lns_teams,
+        lns_size=lns_size,
+        move_operators=move_operators,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=checkpoint_interval,
+        rng=make_rng(seed),
+    )
+    return problem.to_team_list(best_assignment, team_count), best_score
 
 
-def simulated_annealing(
-    initial_solution,
+def resume_simulated_annealing(
+    checkpoint_path,
+    participant_list,
     waggings=None,
+    max_iterations=None,
+    time_limit=None,
+    patience=None,
+    callback=None,
+    report_interval=1000,
+    checkpoint_interval=10000,
+    config=None,
+):
+    """
+    simulated_annealing 이 checkpoint_path 에 저장한 상태에서 탐색을 이어서 실행
+    팀 구성, 온도, 반복 횟수, 난수 상태, best 를 모두 복원하므로 중단 없이 실행했을 때와 같은 결과를 반환함
+    (time_limit 으로 중간에 멈춘 경우는 멈춘 시점이 실행마다 다를 수 있음)
+    이어서 실행하는 동안에도 같은 파일에 계속 저장함
+
+    input:
+        - checkpoint_path: 체크포인트 파일 경로
+        - participant_list: 처음 실행한 매칭의 참가자 목록 (순서 무관)
+        - waggings: 처음 실행한 매칭의 꼬리흔들기 목록
+        - max_iterations: 전체 최대 반복 횟수 (None 이면 처음 실행할 때의 값)
+        - time_limit, patience, callback, report_interval, checkpoint_interval: simulated_annealing 과 동일
+          (time_limit 은 이어서 실행하는 시간 기준)
+        - config: 처음 실행할 때와 같은 매칭 설정
+
+    return:
+        - best_solution: 가장 좋은 팀 매칭 (team_list 형식)
+        - best_score: 가장 좋은 점수
+    """
+    state = load_checkpoint(checkpoint_path)
+
+    # 처음 실행할 때와 같은 참가자 번호 순서로 문제 표현을 다시 만듦
+    participant_by_id = {
+        participant["id"]: participant for participant in participant_list
+    }
+    try:
+        participants = [participant_by_id[idx] for idx in state["ids"].tolist()]
+    except KeyError as error:
+        raise ValueError(
+            f"체크포인트의 참가자({error.args[0]})가 참가자 목록에 없습니다."
+        ) from None
+    problem = MatchingProblem(participants, waggings, config)
+    # 다른 제약으로 저장한 체크포인트일 수 있으므로 현재 상태와 가장 좋은 상태 모두 확인
+    problem.constraints.check(state["evaluator"]["team_of"])
+    problem.constraints.check(state["best_assignment"])
+
+    params = dict(state["params"])
+    if max_iterations is not None:
+        params["max_iterations"] = max_iterations
+
+    # 저장된 난수 상태를 이어받을 전용 난수 생성기
+    rng = random.Random()
+    rng.setstate(state["random_state"])
+
+    budget = SearchBudget(time_limit, patience)
+    best_assignment, best_score, _ = annealing_search(
+        problem,
+        state["evaluator"]["team_of"],
+        state["team_count"],
+        budget,
+        callback=callback,
+        report_interval=report_interval,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=checkpoint_interval,
+        resume_state=state,
+        rng=rng,
+        **params,
+    )
+    return problem.to_team_list(best_assignment, state["team_count"]), best_score
+
+
+def annealing_search(
+    problem: MatchingProblem,
+    assignment: np.ndarray,
+    team_count: int,
+    budget: SearchBudget,
     initial_temp=1.0,
     min_temp=0.001,
     cooling_rate=0.995,
     max_iterations=10000,
+    callback=None,
+    report_interval=1000,
+    lns_interval=None,
+    lns_teams=16,
+    lns_size=128,
+    move_operators=None,
+    checkpoint_path=None,
+    checkpoint_interval=10000,
+    resume_state=None,
+    rng=None,
 ):
-    current_solution = initial_solution
-    current_score = evaluate_solution(current_solution, waggings)
+    """
+    simulated_annealing 의 탐색 본체 (SOLVERS 에 "annealing" 으로 등록되는 solver)
+    인자는 simulated_annealing 과 같고, 시드 대신 이 탐색 전용 난수 생성기 rng 를 받음
+    resume_state 에 체크포인트 상태를 전달하면 그 시점부터 이어서 탐색함 (resume_simulated_annealing 참고)
 
-    best_solution = current_solution
-    best_score = current_score
+    return:
+        - best_assignment: 가장 좋은 팀 번호 배열
+        - best_score: 가장 좋은 점수
+        - stats = {
+            "iterations": 1380,
+            "accepted": 412,
+            "final_temperature": 0.001,
+            "evaluations": 1380,  # 점수를 계산한 이동 수 (반복마다 하나)
+            "moves": {...},  # move_operators 를 지정한 경우 AdaptiveMoveSelector.stats()
+        }
+    """
+    telemetry = None if callback is None else SolverTelemetry(callback, report_interval)
+    rng = make_rng(rng)
 
-    T = initial_temp
+    # 스왑마다 바뀐 두 팀만 다시 계산하는 평가기
+    evaluator = IncrementalEvaluator(problem, assignment, team_count)
+
+    # 같은 파트의 교환 쌍을 재시도 없이 뽑는 샘플러 (평가기와 팀 번호 목록, 난수 생성기 공유)
+    sampler = SwapSampler(
+        problem.part_code.tolist(), evaluator.team_of, rng, problem.constraints
+    )
+
+    # 여러 이동 연산자를 최근 성공률에 따라 골라서 사용 (지정하지 않으면 교환만 사용)
+    selector = (
+        None
+        if move_operators is None
+        else AdaptiveMoveSelector(evaluator, sampler, move_operators)
+    )
+
+    if resume_state is None:
+        # best 는 참가자별 팀 번호만 저장 (dict 복사 없음)
+        best_assignment = evaluator.snapshot()
+        best_score = evaluator.score
+        T = initial_temp
+        iteration = 0
+        accepted = 0
+    else:
+        evaluator.restore_state(resume_state["evaluator"])
+        sampler.restore_state(resume_state["sampler"])
+        if selector is not None:
+            selector.restore_state(resume_state["moves"])
+        best_assignment = resume_state["best_assignment"]
+        best_score = resume_state["best_score"]
+        T = resume_state["temperature"]
+        iteration = resume_state["iteration"]
+        accepted = resume_state["accepted"]
+        budget.improved(resume_state["last_improvement"])
+    current_score = evaluator.score
+
+    def checkpoint():
+        save_checkpoint(
+            checkpoint_path,
+            {
+                "ids": problem.ids,
+                "team_count": team_count,
+                "params": {
+                    "initial_temp": initial_temp,
+                    "min_temp": min_temp,
+                    "cooling_rate": cooling_rate,
+                    "max_iterations": max_iterations,
+                    "lns_interval": lns_interval,
+                    "lns_teams": lns_teams,
+                    "lns_size": lns_size,
+                    "move_operators": move_operators,
+                },
+                "iteration": iteration,
+                "temperature": T,
+                "accepted": accepted,
+                "evaluator": evaluator.state(),
+                "sampler": sampler.state(),
+                "moves": None if selector is None else selector.state(),
+                "best_assignment": best_assignment,
+                "best_score": best_score,
+                "last_improvement": budget.last_improvement,
+                "random_state": rng.getstate(),
+            },
+        )
 
-    iteration = 0
     while T > min_temp and iteration < max_iterations:
+        if budget.exhausted(iteration):
+            break
 
-        # 1) neighbor 생성
-        new_solution = neighbor_solution(current_solution)
-        new_score = evaluate_solution(new_solution, waggings)
+        if telemetry is not None:
+            neighbor_start = time.perf_counter()
+
+        # 1) neighbor 생성: 제자리 교환, 이동 연산자 또는 파트 재배정 (채택되지 않으면 되돌림)
+        operator = None
+        if lns_interval and (iteration + 1) % lns_interval == 0:
+            move = sample_part_reassign(evaluator, sampler, lns_teams, lns_size)
+        elif selector is not None:
+            operator, move = selector.sample()
+        else:
+            swap = sampler.sample()
+            move = (
+                None
+                if swap is None
+                else SwapMove(
+                    evaluator,
+                    evaluator.position(swap[0]),
+                    evaluator.position(swap[1]),
+                    sampler,
+                )
+            )
+        if telemetry is not None:
+            scoring_start = time.perf_counter()
+        new_score = current_score if move is None else move.apply()
 
         # 2) score 차이
         delta = new_score - current_score
@@ -339,19 +898,329 @@ def simulated_annealing(
         else:
             # 4) 더 나쁜 해는 확률적으로 채택
             p = math.exp(-delta / T)
-            accept = random.random() < p
+            accept = rng.random() < p
+
+        if operator is not None:
+            selector.record(operator, delta < 0)
 
         if accept:
-            current_solution = new_solution
             current_score = new_score
+            accepted += move is not None
+        elif move is not None:
+            move.undo()
 
         # 5) best 업데이트
         if current_score < best_score:
-            best_solution = current_solution
+            best_assignment = evaluator.snapshot()
+            best_score = current_score
+            budget.improved(iteration, best_score)
+
+        if telemetry is not None:
+            scoring_end = time.perf_counter()
+            telemetry.record(
+                iteration + 1,
+                T,
+                current_score,
+                best_score,
+                accept and move is not None,
+                scoring_start - neighbor_start,
+                scoring_end - scoring_start,
+            )
+
+        # 온도 감소
+        T *= cooling_rate
+        iteration += 1
+
+        if checkpoint_path is not None and iteration % checkpoint_interval == 0:
+            checkpoint()
+
+    if telemetry is not None:
+        telemetry.finish(iteration, T, current_score, best_score)
+
+    stats = {
+        "iterations": iteration,
+        "accepted": accepted,
+        "final_temperature": T,
+        "evaluations": iteration,
+    }
+    if selector is not None:
+        stats["moves"] = selector.stats()
+    return best_assignment, best_score, stats
+
+
+def batched_simulated_annealing(
+    initial_solution,
+    waggings=None,
+    batch_size=32,
+    initial_temp=1.0,
+    min_temp=0.001,
+    cooling_rate=0.995,
+    max_iterations=10000,
+    time_limit=None,
+    patience=None,
+    callback=None,
+    report_interval=1000,
+    config=None,
+    seed=None,
+):
+    """
+    반복마다 같은 파트의 교환 후보 batch_size 개를 한 번에 뽑고, 배열 연산으로 모든 후보의
+    점수를 계산한 뒤 가장 좋은 후보를 Metropolis 기준으로 채택하는 simulated_annealing
+    입력/출력 형식은 simulated_annealing 과 같음
+
+    input:
+        - initial_solution: 초기 팀 매칭 (team_list 형식)
+        - waggings: 꼬리흔들기 목록
+        - batch_size: 반복마다 평가할 교환 후보 수
+        - initial_temp, min_temp, cooling_rate, max_iterations: simulated_annealing 과 동일
+        - time_limit, patience, callback, report_interval: simulated_annealing 과 동일
+          (callback 의 evals_per_sec 는 후보 하나의 점수 계산을 한 번으로 셈)
+        - config, seed: simulated_annealing 과 동일
+
+    return:
+        - best_solution: 가장 좋은 팀 매칭 (team_list 형식)
+        - best_score: 가장 좋은 점수
+    """
+    budget = SearchBudget(time_limit, patience)
+
+    problem, assignment = compile_problem(initial_solution, waggings, config)
+    problem.constraints.check(assignment)
+    team_count = len(initial_solution)
+
+    best_assignment, best_score, _ = batched_annealing_search(
+        problem,
+        assignment,
+        team_count,
+        budget,
+        batch_size=batch_size,
+        initial_temp=initial_temp,
+        min_temp=min_temp,
+        cooling_rate=cooling_rate,
+        max_iterations=max_iterations,
+        callback=callback,
+        report_interval=report_interval,
+        rng=make_rng(seed),
+    )
+    return problem.to_team_list(best_assignment, team_count), best_score
+
+
+def batched_annealing_search(
+    problem: MatchingProblem,
+    assignment: np.ndarray,
+    team_count: int,
+    budget: SearchBudget,
+    batch_size=32,
+    initial_temp=1.0,
+    min_temp=0.001,
+    cooling_rate=0.995,
+    max_iterations=10000,
+    callback=None,
+    report_interval=1000,
+    rng=None,
+):
+    """
+    batched_simulated_annealing 의 탐색 본체 (SOLVERS 에 "batched_annealing" 으로 등록되는 solver)
+    인자는 batched_simulated_annealing 과 같고 (시드 대신 난수 생성기 rng), 반환 형식은 annealing_search 와 같음
+    """
+    telemetry = None if callback is None else SolverTelemetry(callback, report_interval)
+    rng = make_rng(rng)
+
+    evaluator = IncrementalEvaluator(problem, assignment, team_count)
+    current_score = evaluator.score
+
+    best_assignment = evaluator.snapshot()
+    best_score = current_score
+
+    # 후보 샘플링용: 파트 순서로 정렬한 참가자 번호와 파트별 구간
+    # (교환 상대가 있는 파트의 참가자 중에서 한 명을 고르고, 같은 파트에서 상대를 고름)
+    by_part = np.argsort(problem.part_code, kind="stable")
+    part_size = np.bincount(problem.part_code[by_part] + 1)[1:]
+    part_start = (
+        np.concatenate([[0], np.cumsum(part_size)[:-1]])
+        + (problem.part_code == -1).sum()
+    )
+    swappable = np.concatenate(
+        [
+            by_part[start : start + size]
+            for start, size in zip(part_start, part_size)
+            if size >= 2
+        ]
+        or [np.zeros(0, dtype=np.int64)]
+    )
+
+    # 제약이 있으면 같은 팀 묶음의 참가자를 후보에서 빼고, 다른 팀 제약은 샘플러의 팀 마스크로 확인
+    sampler = None
+    if problem.constraints:
+        sampler = SwapSampler(
+            problem.part_code.tolist(), evaluator.team_of, rng, problem.constraints
+        )
+        pinned = np.array(problem.constraints.group_of) >= 0
+        swappable = swappable[~pinned[swappable]]
+
+    # 후보 배열은 rng 에서 시드를 받은 numpy 난수로 뽑아서 같은 시드면 같은 결과가 나오게 함
+    np_rng = numpy_rng(rng)
+
+    T = initial_temp
+
+    iteration = 0
+    accepted = 0
+    evaluations = 0
+    while T > min_temp and iteration < max_iterations and len(swappable):
+        if budget.exhausted(iteration):
+            break
+
+        if telemetry is not None:
+            neighbor_start = time.perf_counter()
+
+        # 1) 교환 후보 batch_size 개 샘플링 및 점수 일괄 계산
+        idx_a = swappable[np_rng.integers(len(swappable), size=batch_size)]
+        part = problem.part_code[idx_a]
+        idx_b = by_part[part_start[part] + np_rng.integers(0, part_size[part])]
+
+        if telemetry is not None:
+            scoring_start = time.perf_counter()
+        scores = evaluator.swap_scores(idx_a, idx_b)
+        evaluations += batch_size
+        if sampler is not None:
+            for candidate, (a, b) in enumerate(zip(idx_a.tolist(), idx_b.tolist())):
+                if pinned[b] or not sampler.feasible_swap(a, b):
+                    scores[candidate] = np.inf
+        best_candidate = int(scores.argmin())
+
+        # 2) 가장 좋은 후보를 Metropolis 기준으로 채택
+        accept = False
+        if np.isfinite(scores[best_candidate]):
+            delta = scores[best_candidate] - current_score
+            if delta < 0 or rng.random() < math.exp(-delta / T):
+                accept = True
+                accepted += 1
+                a, b = int(idx_a[best_candidate]), int(idx_b[best_candidate])
+                current_score = SwapMove(
+                    evaluator,
+                    (evaluator.team_of[a], evaluator.slot_of[a]),
+                    (evaluator.team_of[b], evaluator.slot_of[b]),
+                    sampler,
+                ).apply()
+
+        # 3) best 업데이트
+        if current_score < best_score:
+            best_assignment = evaluator.snapshot()
             best_score = current_score
+            budget.improved(iteration, best_score)
+
+        if telemetry is not None:
+            scoring_end = time.perf_counter()
+            telemetry.record(
+                iteration + 1,
+                T,
+                current_score,
+                best_score,
+                accept,
+                scoring_start - neighbor_start,
+                scoring_end - scoring_start,
+                batch_size,
+            )
 
         # 온도 감소
         T *= cooling_rate
         iteration += 1
 
-    return best_solution, best_score
+    if telemetry is not None:
+        telemetry.finish(iteration, T, current_score, best_score)
+
+    stats = {
+        "iterations": iteration,
+        "accepted": accepted,
+        "final_temperature": T,
+        "evaluations": evaluations,
+    }
+    return best_assignment, best_score, stats
+
+
+# 탐색 엔진 (이름 -> solver)
+# solver(problem, assignment, team_count, budget, rng=None, **options) -> (best_assignment, best_score, stats)
+SOLVERS = {}
+
+
+def register_solver(name: str, solver):
+    """
+    solve 에서 이름으로 선택할 수 있도록 탐색 엔진을 등록
+
+    input:
+        - name: 엔진 이름
+        - solver: solver(problem, assignment, team_count, budget, rng=None, **options) 형식의 함수
+            - problem: MatchingProblem
+            - assignment: 초기 팀 번호 배열
+            - team_count: 팀의 개수
+            - budget: 종료 조건 (SearchBudget)
+            - rng: 이 탐색 전용 난수 생성기 (seeding.make_rng 로 변환해서 사용, 전역 random 사용 금지)
+            - return: (best_assignment, best_score, stats dict)
+    """
+    SOLVERS[name] = solver
+
+
+register_solver("annealing", annealing_search)
+register_solver("batched_annealing", batched_annealing_search)
+register_solver("tempering", tempering_search)
+register_solver("tabu", tabu_search)
+register_solver("genetic", genetic_search)
+
+
+def solve(
+    initial_solution,
+    waggings=None,
+    solver="annealing",
+    time_limit=None,
+    patience=None,
+    config=None,
+    seed=None,
+    target_score=None,
+    category_weight=None,
+    **options,
+):
+    """
+    등록된 탐색 엔진 중 하나로 팀 매칭을 최적화
+
+    input:
+        - initial_solution: 초기 팀 매칭 (team_list 형식)
+        - waggings: 꼬리흔들기 목록
+        - solver: SOLVERS 에 등록된 엔진 이름
+        - time_limit, patience: 종료 조건 (simulated_annealing 과 동일)
+        - config: 매칭 설정 (MatchingConfig, 기본값: DEFAULT_CONFIG)
+        - seed: 난수 시드 (정수 | random.Random, seeding.make_rng 참고)
+        - target_score: best 점수가 이 값 이하가 되면 종료 (SearchBudget 참고)
+        - category_weight: 카테고리 가중치 표 (MatchingProblem 참고, 기본값: initial_solution 의 참가자로 계산)
+        - options: 엔진별 인자 (예: annealing 의 cooling_rate, tabu 의 tenure)
+
+    return:
+        - best_solution: 가장 좋은 팀 매칭 (team_list 형식)
+        - best_score: 가장 좋은 점수
+        - stats = {
+            "solver": "annealing",
+            "initial_score": 834.0,
+            "score": -126.1,
+            "elapsed": 0.21,
+            ...  # 엔진별 통계 (iterations, accepted, evaluations 등)
+        }
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"알 수 없는 탐색 엔진입니다: {solver}")
+
+    budget = SearchBudget(time_limit, patience, target_score)
+    problem, assignment = compile_problem(
+        initial_solution, waggings, config, category_weight
+    )
+    problem.constraints.check(assignment)
+    team_count = len(initial_solution)
+
+    best_assignment, best_score, solver_stats = SOLVERS[solver](
+        problem, assignment, team_count, budget, rng=make_rng(seed), **options
+    )
+    stats = {
+        "solver": solver,
+        "initial_score": evaluate_assignment(problem, assignment, team_count),
+        "score": best_score,
+        "elapsed": budget.elapsed(),
+        **solver_stats,
+    }
+    return problem.to_team_list(best_assignment, team_count), best_score, stats
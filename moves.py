@@ -0,0 +1,765 @@
+from bisect import bisect_right
+from itertools import accumulate
+
+import numpy as np
+
+from evaluator import IncrementalEvaluator, _combine_score
+from constraints import ConstraintIndex
+from hungarian import linear_sum_assignment
+from seeding import make_rng
+
+
+class SwapSampler:
+    """
+    같은 파트이면서 서로 다른 팀에 속한 두 참가자를 재시도 없이 O(1) 로 뽑는 샘플러
+
+    파트마다 참가자 번호를 팀 순서로 정렬한 배열(order)을 유지하며, 팀별 구간(block)은
+    같은 파트끼리의 교환으로는 바뀌지 않음. 교환된 두 참가자의 위치만 맞바꾸면
+    정렬 상태가 유지되므로 교환 이후에도 O(1) 로 갱신됨
+
+    - 파트는 서로 다른 팀 사이의 교환 가능한 쌍의 수에 비례하는 확률로 선택
+    - 선택한 파트에서 한 명을 고르고, 그 사람의 팀 구간을 제외한 나머지에서 상대를 고름
+
+    constraints 를 전달하면 제약을 지키는 교환만 반환함
+    - 같은 팀이어야 하는 묶음의 참가자는 각자 고유한 파트로 취급해서 교환 대상에서 제외
+    - 다른 팀이어야 하는 쌍은 팀별 비트마스크(team_mask)를 교환마다 갱신하며 O(1) 로 확인하고,
+      어기는 쌍이 뽑히면 최대 tries 번까지 다시 뽑음
+
+    input:
+        - part_of: 참가자 번호 순서의 파트 목록
+        - team_of: 참가자 번호 순서의 팀 번호 목록 (평가기의 team_of 를 그대로 공유)
+        - rng: 샘플링에 사용할 난수 생성기 (random.Random 또는 시드, seeding.make_rng 참고)
+        - constraints: 같은 팀 / 다른 팀 제약 (MatchingProblem.constraints, 없으면 생략)
+        - tries: 다른 팀 제약을 어기는 쌍이 뽑혔을 때 다시 뽑는 최대 횟수
+    """
+
+    def __init__(
+        self,
+        part_of: list,
+        team_of: list[int],
+        rng=None,
+        constraints: ConstraintIndex = None,
+        tries: int = 16,
+    ):
+        if constraints and constraints.groups:
+            part_of = [
+                part if group_id < 0 else ("fixed", idx)
+                for idx, (part, group_id) in enumerate(
+                    zip(part_of, constraints.group_of)
+                )
+            ]
+        self.part_of = part_of
+        self.team_of = team_of
+        self.rng = make_rng(rng)
+        self.tries = tries
+
+        # 다른 팀 제약: 참가자별 / 팀별 비트마스크 (제약이 없으면 None)
+        self.apart_mask = None if constraints is None else constraints.apart_mask
+        self.team_mask = (
+            None
+            if self.apart_mask is None
+            else constraints.team_masks(team_of, max(team_of, default=-1) + 1)
+        )
+
+        members = {}
+        for idx, part in enumerate(part_of):
+            members.setdefault(part, []).append(idx)
+
+        self.order = {}  # 파트 -> 팀 순서로 정렬된 참가자 번호 목록
+        self.block = {}  # 파트 -> {팀 번호: (시작 위치, 끝 위치)}
+        self.pos = [0] * len(part_of)  # 참가자 번호 -> order 안에서의 위치
+        weights = {}
+        for part, idx_list in members.items():
+            order = sorted(idx_list, key=lambda idx: team_of[idx])
+            block = {}
+            for position, idx in enumerate(order):
+                self.pos[idx] = position
+                start, _ = block.get(team_of[idx], (position, position))
+                block[team_of[idx]] = (start, position + 1)
+            self.order[part] = order
+            self.block[part] = block
+
+            # 서로 다른 팀에 속한 쌍의 수
+            size = len(order)
+            weights[part] = (
+                size**2 - sum((end - start) ** 2 for start, end in block.values())
+            ) // 2
+
+        self.parts = [part for part, weight in weights.items() if weight > 0]
+        self.cum_weights = list(accumulate(weights[part] for part in self.parts))
+
+        # 파트 인원수가 같은 팀끼리만 그 파트 전체를 맞바꿀 수 있음 (팀 구간은 바뀌지 않으므로 한 번만 계산)
+        self.same_size_teams = {}  # 파트 -> {파트 인원수: [팀 번호, ...]}
+        self.block_teams = {}  # 파트 -> 파트 인원수가 같은 다른 팀이 있는 팀 번호 목록
+        for part, block in self.block.items():
+            groups = {}
+            for team_idx, (start, end) in block.items():
+                groups.setdefault(end - start, []).append(team_idx)
+            self.same_size_teams[part] = groups
+            self.block_teams[part] = [
+                team_idx
+                for group in groups.values()
+                if len(group) >= 2
+                for team_idx in group
+            ]
+        self.block_parts = [part for part, teams in self.block_teams.items() if teams]
+
+    def sample(self) -> tuple[int] | None:
+        """
+        교환할 두 참가자 번호를 반환 (교환 가능한 쌍이 없거나, tries 번 모두 제약을 어기는 쌍이 뽑히면 None)
+        """
+        if not self.parts:
+            return None
+
+        rng = self.rng
+        for _ in range(self.tries):
+            part = self.parts[
+                bisect_right(self.cum_weights, rng.random() * self.cum_weights[-1])
+            ]
+            order = self.order[part]
+            idx_a = order[rng.randrange(len(order))]
+
+            # idx_a 의 팀 구간을 건너뛰고 상대 선택
+            start, end = self.block[part][self.team_of[idx_a]]
+            position = rng.randrange(len(order) - (end - start))
+            if position >= start:
+                position += end - start
+            idx_b = order[position]
+            if self.apart_mask is None or self.feasible_swap(idx_a, idx_b):
+                return idx_a, idx_b
+        return None
+
+    def feasible_swap(self, idx_a: int, idx_b: int) -> bool:
+        """
+        두 참가자를 교환해도 다른 팀 제약을 지키는지 여부 (O(1))
+        각자 상대 팀에서 상대를 뺀 팀원 마스크와 겹치는 비트가 없어야 함
+        """
+        if self.apart_mask is None:
+            return True
+        mask_a, mask_b = self.apart_mask[idx_a], self.apart_mask[idx_b]
+        if not (mask_a or mask_b):
+            return True
+        team_mask = self.team_mask
+        return not (
+            mask_a & (team_mask[self.team_of[idx_b]] ^ mask_b)
+            or mask_b & (team_mask[self.team_of[idx_a]] ^ mask_a)
+        )
+
+    def feasible(self, pairs: list[tuple[int]]) -> bool:
+        """
+        pairs 의 교환을 순서대로 모두 적용한 결과가 다른 팀 제약을 지키는지 여부 (SwapSequenceMove 용)
+        """
+        if self.apart_mask is None:
+            return True
+
+        # 교환을 모두 적용한 뒤의 팀 번호
+        final_team = {}
+        for idx_a, idx_b in pairs:
+            team_a = final_team.get(idx_a, self.team_of[idx_a])
+            final_team[idx_a] = final_team.get(idx_b, self.team_of[idx_b])
+            final_team[idx_b] = team_a
+
+        leaving, joining = {}, {}
+        for idx, team_idx in final_team.items():
+            old_team = self.team_of[idx]
+            if team_idx != old_team:
+                leaving[old_team] = leaving.get(old_team, 0) ^ self.apart_mask[idx]
+                joining.setdefault(team_idx, []).append(idx)
+
+        # 남아 있는 팀원 마스크에 들어오는 참가자를 한 명씩 더하면서 겹치는 비트 확인
+        for team_idx, members in joining.items():
+            occupied = self.team_mask[team_idx] ^ leaving.get(team_idx, 0)
+            for idx in members:
+                if occupied & self.apart_mask[idx]:
+                    return False
+                occupied |= self.apart_mask[idx]
+        return True
+
+    def state(self) -> dict:
+        """
+        체크포인트에 저장할 파트별 참가자 순서 (팀 구간은 팀 번호로부터 다시 계산됨)
+        """
+        return {
+            part: np.array(order, dtype=np.int32) for part, order in self.order.items()
+        }
+
+    def restore_state(self, state: dict):
+        """
+        state() 로 저장한 순서를 복원 (같은 팀 번호 목록으로 생성한 샘플러에서 호출)
+        """
+        for part, order in state.items():
+            self.order[part] = order.tolist()
+            for position, idx in enumerate(self.order[part]):
+                self.pos[idx] = position
+
+    def swap(self, idx_a: int, idx_b: int):
+        """
+        두 참가자의 팀이 맞바뀐 것을 반영 (같은 두 참가자로 다시 호출하면 원래대로 돌아감)
+        """
+        order = self.order[self.part_of[idx_a]]
+        pos_a, pos_b = self.pos[idx_a], self.pos[idx_b]
+        order[pos_a], order[pos_b] = idx_b, idx_a
+        self.pos[idx_a], self.pos[idx_b] = pos_b, pos_a
+
+        if self.apart_mask is not None:
+            # 두 팀 모두 한 명이 나가고 한 명이 들어왔으므로 두 사람의 마스크를 함께 뒤집음
+            changed = self.apart_mask[idx_a] ^ self.apart_mask[idx_b]
+            if changed:
+                self.team_mask[self.team_of[idx_a]] ^= changed
+                self.team_mask[self.team_of[idx_b]] ^= changed
+
+
+class SwapMove:
+    """
+    서로 다른 팀의 두 멤버를 제자리에서 교환하는 이동
+    채택되지 않은 경우 undo 로 교환 이전 상태를 복원함 (팀 목록/참가자 dict 복사 없음)
+
+    input:
+        - evaluator: 현재 팀 매칭 상태를 가진 IncrementalEvaluator
+        - pos_a, pos_b: (팀 번호, 팀 내 위치)
+        - sampler: 교환 결과를 함께 반영할 SwapSampler (없으면 생략)
+    """
+
+    __slots__ = ("evaluator", "pos_a", "pos_b", "sampler", "_undo")
+
+    def __init__(
+        self,
+        evaluator: IncrementalEvaluator,
+        pos_a: tuple[int],
+        pos_b: tuple[int],
+        sampler: SwapSampler = None,
+    ):
+        self.evaluator = evaluator
+        self.pos_a = pos_a
+        self.pos_b = pos_b
+        self.sampler = sampler
+        self._undo = None
+
+    def apply(self) -> float:
+        """
+        교환을 수행하고 새로운 점수를 반환
+        """
+        self._undo = self.evaluator.apply_swap(self.pos_a, self.pos_b)
+        self._swap_sampler()
+        return self.evaluator.score
+
+    def undo(self):
+        """
+        apply 로 수행한 교환을 되돌림
+        """
+        if self._undo is None:
+            raise RuntimeError("적용되지 않은 이동은 되돌릴 수 없습니다.")
+        self.evaluator.revert(self._undo)
+        self._swap_sampler()
+        self._undo = None
+
+    def _swap_sampler(self):
+        if self.sampler is not None:
+            team_a, slot_a = self.pos_a
+            team_b, slot_b = self.pos_b
+            teams = self.evaluator.teams
+            self.sampler.swap(teams[team_a][slot_a], teams[team_b][slot_b])
+
+
+class PartReassignMove:
+    """
+    한 파트의 참가자 여러 명을, 그 참가자들이 차지하고 있던 자리 안에서 한 번에 다시 배정하는 큰 이웃(LNS) 이동
+    나머지 참가자는 고정한 채로 "참가자 -> 팀" 배정 비용을 선형 근사하고,
+    헝가리안 알고리즘으로 비용 합이 최소인 배정을 구한 뒤 같은 파트끼리의 교환 여러 번으로 적용함
+    (적용 후 점수는 평가기가 정확히 계산하므로 채택 여부는 실제 점수로 판단)
+
+    선형 근사 비용 (_combine_score 의 가중치로 환산):
+        - 꼬리흔들기: 같은 팀이 되는 꼬리흔들기 관계 수, 본인의 적중 0회 여부,
+          적중 0회였던 고정 팀원이 적중하게 되는 수
+        - 카테고리: 고정 팀원의 최빈값과 같은 값을 가진 카테고리마다 팀 점수가 오르는 양
+
+    input:
+        - evaluator: 현재 팀 매칭 상태를 가진 IncrementalEvaluator
+        - members: 다시 배정할 참가자 번호 목록 (모두 같은 파트)
+        - sampler: 교환 결과를 함께 반영할 SwapSampler (없으면 생략)
+    """
+
+    __slots__ = ("evaluator", "members", "sampler", "_moves")
+
+    def __init__(
+        self,
+        evaluator: IncrementalEvaluator,
+        members: list[int],
+        sampler: SwapSampler = None,
+    ):
+        self.evaluator = evaluator
+        self.members = members
+        self.sampler = sampler
+        self._moves = None
+
+    def apply(self) -> float:
+        """
+        최적 배정으로 참가자들을 이동시키고 새로운 점수를 반환
+        """
+        evaluator = self.evaluator
+        team_of = evaluator.team_of
+        target = self._solve()
+        target_of = dict(zip(self.members, target))
+
+        # 목표 팀이 아닌 팀에 있는 참가자 (팀 번호 -> 참가자 번호 집합)
+        leaving = {}
+        for idx, team_idx in zip(self.members, target):
+            if team_of[idx] != team_idx:
+                leaving.setdefault(team_of[idx], set()).add(idx)
+
+        # 목표 팀에서 나가야 하는 참가자와 교환 (교환마다 적어도 한 명이 목표 팀에 도착)
+        self._moves = []
+        for idx, team_idx in zip(self.members, target):
+            if team_of[idx] == team_idx:
+                continue
+            old_team = team_of[idx]
+            other = leaving[team_idx].pop()
+            leaving[old_team].discard(idx)
+
+            move = SwapMove(
+                evaluator,
+                evaluator.position(idx),
+                evaluator.position(other),
+                self.sampler,
+            )
+            move.apply()
+            self._moves.append(move)
+
+            if target_of[other] != old_team:
+                leaving[old_team].add(other)
+
+        return evaluator.score
+
+    def undo(self):
+        """
+        apply 로 수행한 교환들을 역순으로 되돌림
+        """
+        if self._moves is None:
+            raise RuntimeError("적용되지 않은 이동은 되돌릴 수 없습니다.")
+        for move in reversed(self._moves):
+            move.undo()
+        self._moves = None
+
+    def _solve(self) -> list[int]:
+        """
+        참가자별 목표 팀 번호 목록을 반환 (members 순서)
+        """
+        evaluator = self.evaluator
+        team_of = evaluator.team_of
+        moving = set(self.members)
+
+        # 후보 팀: 다시 배정할 참가자들이 현재 속한 팀 (팀별 자리 수는 그대로 유지)
+        team_list = sorted({team_of[idx] for idx in self.members})
+        column = {team_idx: col for col, team_idx in enumerate(team_list)}
+        cost = np.zeros((len(self.members), len(team_list)))
+
+        # 통계값이 1 단위 바뀔 때의 점수 변화량
+        base = _combine_score(0, 0, 0, 0, 0)
+        hit_cost = _combine_score(0, 0, 1 / len(team_of), 0, 0) - base
+        fail_cost = _combine_score(0, 0, 0, 0, 1) - base
+        category_cost = _combine_score(1 / len(evaluator.teams), 0, 0, 0, 0) - base
+        category_scale = 100 / len(evaluator.category_weight) / evaluator.max_weight
+
+        # 고정 참가자 기준의 팀별 카테고리 값 개수
+        fixed_count = {
+            team_idx: [list(count) for count in evaluator.team_category_count[team_idx]]
+            for team_idx in team_list
+        }
+        for idx in self.members:
+            for col, code in enumerate(evaluator.category_code[idx]):
+                fixed_count[team_of[idx]][col][code] -= 1
+
+        # 고정 참가자의 적중 횟수 (다시 배정할 참가자에 대한 적중 제외)
+        def fixed_hits(idx):
+            return evaluator.hits[idx] - sum(
+                1
+                for waggee in evaluator.waggees[idx]
+                if waggee in moving and team_of[waggee] == team_of[idx]
+            )
+
+        for row, idx in enumerate(self.members):
+            own_hits = [0] * len(team_list)
+            for waggee in evaluator.waggees[idx]:
+                if waggee not in moving and team_of[waggee] in column:
+                    own_hits[column[team_of[waggee]]] += 1
+            for col, hits in enumerate(own_hits):
+                cost[row, col] += hit_cost * hits + fail_cost * (hits == 0)
+
+            for wagger in evaluator.waggers[idx]:
+                if wagger not in moving and team_of[wagger] in column:
+                    col = column[team_of[wagger]]
+                    cost[row, col] += hit_cost - fail_cost * (fixed_hits(wagger) == 0)
+
+            for col, team_idx in enumerate(team_list):
+                team_size = len(evaluator.teams[team_idx])
+                for count, code, weights in zip(
+                    fixed_count[team_idx],
+                    evaluator.category_code[idx],
+                    evaluator.category_weight,
+                ):
+                    if count[code] >= max(count):
+                        cost[row, col] += (
+                            category_cost * category_scale * weights[code] / team_size
+                        )
+
+        # 팀의 자리 수만큼 열을 복제해서 참가자 x 자리 정사각 비용 행렬로 만듦
+        slot_column = [column[team_of[idx]] for idx in self.members]
+        _, slot_ind = linear_sum_assignment(cost[:, slot_column])
+        return [team_list[slot_column[slot]] for slot in slot_ind]
+
+
+def sample_part_reassign(
+    evaluator: IncrementalEvaluator,
+    sampler: SwapSampler,
+    team_sample: int = 16,
+    member_sample: int = 128,
+) -> PartReassignMove | None:
+    """
+    무작위 파트 하나와 그 파트의 참가자가 있는 팀 최대 team_sample 개를 골라,
+    해당 팀들에 속한 그 파트 참가자(최대 member_sample 명)를 다시 배정하는 이동을 생성
+    (다시 배정할 팀이 2개 미만이면 None, 난수는 sampler 의 난수 생성기를 함께 사용)
+    """
+    if not sampler.parts:
+        return None
+
+    rng = sampler.rng
+    part = rng.choice(sampler.parts)
+    order = sampler.order[part]
+    block = sampler.block[part]
+    team_list = rng.sample(list(block), min(team_sample, len(block)))
+
+    members = [
+        idx
+        for team_idx in team_list
+        for idx in order[block[team_idx][0] : block[team_idx][1]]
+    ]
+    if sampler.apart_mask is not None:
+        # 다시 배정한 결과는 미리 알 수 없으므로 다른 팀 제약이 있는 참가자는 제외
+        members = [idx for idx in members if not sampler.apart_mask[idx]]
+    if len(members) > member_sample:
+        members = rng.sample(members, member_sample)
+    if len({evaluator.team_of[idx] for idx in members}) < 2:
+        return None
+    return PartReassignMove(evaluator, members, sampler)
+
+
+class SwapSequenceMove:
+    """
+    같은 파트끼리의 교환 여러 번을 순서대로 적용하는 이동 (3명 순환, 파트 전체 교환 등)
+    교환마다 팀별 파트 구성이 유지되므로 SwapSampler 의 팀 구간도 그대로 유지됨
+
+    input:
+        - evaluator: 현재 팀 매칭 상태를 가진 IncrementalEvaluator
+        - pairs: 순서대로 교환할 (참가자 번호, 참가자 번호) 목록 (위치는 교환할 때의 위치를 사용)
+        - sampler: 교환 결과를 함께 반영할 SwapSampler (없으면 생략)
+    """
+
+    __slots__ = ("evaluator", "pairs", "sampler", "_moves")
+
+    def __init__(
+        self,
+        evaluator: IncrementalEvaluator,
+        pairs: list[tuple[int]],
+        sampler: SwapSampler = None,
+    ):
+        self.evaluator = evaluator
+        self.pairs = pairs
+        self.sampler = sampler
+        self._moves = None
+
+    def apply(self) -> float:
+        """
+        교환들을 순서대로 수행하고 새로운 점수를 반환
+        """
+        evaluator = self.evaluator
+        self._moves = []
+        for idx_a, idx_b in self.pairs:
+            move = SwapMove(
+                evaluator,
+                evaluator.position(idx_a),
+                evaluator.position(idx_b),
+                self.sampler,
+            )
+            move.apply()
+            self._moves.append(move)
+        return evaluator.score
+
+    def undo(self):
+        """
+        apply 로 수행한 교환들을 역순으로 되돌림
+        """
+        if self._moves is None:
+            raise RuntimeError("적용되지 않은 이동은 되돌릴 수 없습니다.")
+        for move in reversed(self._moves):
+            move.undo()
+        self._moves = None
+
+
+def sample_swap(
+    evaluator: IncrementalEvaluator, sampler: SwapSampler
+) -> SwapMove | None:
+    """
+    같은 파트의 두 참가자를 서로 다른 팀 사이에서 교환하는 이동
+    """
+    swap = sampler.sample()
+    if swap is None:
+        return None
+    return SwapMove(
+        evaluator, evaluator.position(swap[0]), evaluator.position(swap[1]), sampler
+    )
+
+
+def sample_cycle(
+    evaluator: IncrementalEvaluator, sampler: SwapSampler, tries: int = 8
+) -> SwapSequenceMove | None:
+    """
+    서로 다른 세 팀의 같은 파트 참가자 a, b, c 를 a -> b 의 팀, b -> c 의 팀, c -> a 의 팀으로 순환시키는 이동
+    두 명의 교환으로는 한 번에 갈 수 없는 배치로 이동함 (세 번째 참가자는 최대 tries 번 뽑아서 찾음)
+    """
+    swap = sampler.sample()
+    if swap is None:
+        return None
+    idx_a, idx_b = swap
+    part = sampler.part_of[idx_a]
+    if len(sampler.block[part]) < 3:
+        return None
+
+    team_of = sampler.team_of
+    order = sampler.order[part]
+    rng = sampler.rng
+    for _ in range(tries):
+        idx_c = order[rng.randrange(len(order))]
+        if team_of[idx_c] != team_of[idx_a] and team_of[idx_c] != team_of[idx_b]:
+            # (a, b) 교환 후 b 는 a 의 팀에 있으므로 (b, c) 교환으로 순환이 완성됨
+            pairs = [(idx_a, idx_b), (idx_b, idx_c)]
+            if not sampler.feasible(pairs):
+                return None
+            return SwapSequenceMove(evaluator, pairs, sampler)
+    return None
+
+
+def sample_part_block_exchange(
+    evaluator: IncrementalEvaluator, sampler: SwapSampler
+) -> SwapSequenceMove | None:
+    """
+    파트 인원수가 같은 두 팀 사이에서 한 파트의 참가자 전체를 맞바꾸는 이동
+    나머지 팀원은 그대로 두고 한 파트 묶음만 다른 팀과 바꿔 보므로, 팀 단위의 큰 변화를 한 번에 시도함
+    """
+    if not sampler.block_parts:
+        return None
+
+    rng = sampler.rng
+    part = rng.choice(sampler.block_parts)
+    block = sampler.block[part]
+    team_a = rng.choice(sampler.block_teams[part])
+    start_a, end_a = block[team_a]
+
+    # 같은 인원수의 팀 중 team_a 를 제외하고 하나를 고름
+    group = sampler.same_size_teams[part][end_a - start_a]
+    team_b = group[rng.randrange(len(group) - 1)]
+    if team_b == team_a:
+        team_b = group[-1]
+    start_b, end_b = block[team_b]
+
+    order = sampler.order[part]
+    pairs = list(zip(order[start_a:end_a], order[start_b:end_b]))
+    if not sampler.feasible(pairs):
+        return None
+    return SwapSequenceMove(evaluator, pairs, sampler)
+
+
+def sample_wagging_pull(
+    evaluator: IncrementalEvaluator, sampler: SwapSampler, tries: int = 4
+) -> SwapMove | None:
+    """
+    서로 다른 팀에 있는 꼬리흔들기 쌍 (wagger, waggee) 를 골라, waggee 를 wagger 의 팀으로 데려오는 이동
+    (wagger 의 팀에 있는 waggee 와 같은 파트의 다른 참가자와 교환, 그런 참가자가 없으면 wagger 를 waggee 의 팀으로 보냄)
+
+    꼬리흔들기 간선을 최대 tries 번 뽑아서, 적중 0회인 wagger 의 간선을 우선함 (적중 0회는 가장 큰 패널티)
+    적중 여부가 같으면 상호 꼬리흔들기 간선(WaggingIndex.mutual)을 우선함 (같은 팀이 되면 두 사람 모두 적중)
+    """
+    wagging = evaluator.problem.wagging
+    edge_count = len(wagging.indices)
+    if not edge_count:
+        return None
+
+    rng = sampler.rng
+    team_of = evaluator.team_of
+    chosen, chosen_priority = None, None
+    for _ in range(tries):
+        edge = rng.randrange(edge_count)
+        wagger, waggee = int(wagging.edge_src[edge]), int(wagging.indices[edge])
+        if team_of[wagger] == team_of[waggee]:
+            continue
+        priority = (evaluator.hits[wagger] == 0, bool(wagging.mutual[edge]))
+        if chosen is None or priority > chosen_priority:
+            chosen, chosen_priority = (wagger, waggee), priority
+        if all(priority):
+            break
+    if chosen is None:
+        return None
+
+    wagger, waggee = chosen
+    for mover, host in ((waggee, wagger), (wagger, waggee)):
+        # host 의 팀에서 mover 와 같은 파트인 참가자 (host 본인은 제외)
+        part = sampler.part_of[mover]
+        start, end = sampler.block[part].get(team_of[host], (0, 0))
+        candidates = [
+            idx
+            for idx in sampler.order[part][start:end]
+            if idx != host and sampler.feasible_swap(mover, idx)
+        ]
+        if candidates:
+            return SwapMove(
+                evaluator,
+                evaluator.position(mover),
+                evaluator.position(rng.choice(candidates)),
+                sampler,
+            )
+    return None
+
+
+# 이동 연산자 (이름 -> 함수(evaluator, sampler) -> 이동 | None)
+# 모든 이동은 같은 파트끼리의 교환으로 이루어지므로 팀별 파트 구성이 유지됨
+MOVE_OPERATORS = {
+    "swap": sample_swap,
+    "cycle": sample_cycle,
+    "part_block": sample_part_block_exchange,
+    "wagging_pull": sample_wagging_pull,
+}
+
+
+class AdaptiveMoveSelector:
+    """
+    MOVE_OPERATORS 중 하나를 최근 성공률에 비례하는 확률로 골라 이동을 생성하는 적응형 룰렛 선택
+    연산자를 segment 번 사용할 때마다 가중치를 (1 - reaction) * 가중치 + reaction * 구간 성공률 로 갱신하고,
+    한동안 성공하지 못한 연산자도 다시 시도되도록 가중치를 min_weight 아래로는 내리지 않음
+    (성공: 이동 후 점수가 이동 전보다 좋아짐, 구간 성공률은 그 구간에서 가장 높은 성공률을 1 로 둔 상대값
+    탐색 후반에는 모든 연산자의 성공률이 낮아지므로 절대값을 쓰면 가중치가 모두 하한에 붙어 버림)
+
+    selector = AdaptiveMoveSelector(evaluator, sampler)
+    operator, move = selector.sample()
+    ...
+    selector.record(operator, improved)
+
+    input:
+        - evaluator: 현재 팀 매칭 상태를 가진 IncrementalEvaluator
+        - sampler: 평가기와 팀 번호 목록을 공유하는 SwapSampler (난수 생성기도 함께 사용)
+        - operators: 사용할 연산자 이름 목록 (기본값: MOVE_OPERATORS 전체)
+        - segment: 가중치를 갱신하는 사용 횟수 간격
+        - reaction: 가중치 갱신 시 최근 구간 성공률의 반영 비율 (0 ~ 1)
+        - min_weight: 연산자 가중치의 하한
+    """
+
+    def __init__(
+        self,
+        evaluator: IncrementalEvaluator,
+        sampler: SwapSampler,
+        operators: list[str] = None,
+        segment: int = 200,
+        reaction: float = 0.3,
+        min_weight: float = 0.05,
+    ):
+        operators = list(MOVE_OPERATORS) if operators is None else list(operators)
+        for name in operators:
+            if name not in MOVE_OPERATORS:
+                raise ValueError(f"알 수 없는 이동 연산자입니다: {name}")
+        if not operators:
+            raise ValueError("이동 연산자가 하나 이상 필요합니다.")
+
+        self.evaluator = evaluator
+        self.sampler = sampler
+        self.operators = operators
+        self.functions = [MOVE_OPERATORS[name] for name in operators]
+        self.segment = segment
+        self.reaction = reaction
+        self.min_weight = min_weight
+
+        self.weights = [1.0] * len(operators)
+        self.cum_weights = list(accumulate(self.weights))
+        self.segment_tried = [0] * len(operators)
+        self.segment_improved = [0] * len(operators)
+        self.tried = [0] * len(operators)
+        self.improved = [0] * len(operators)
+        self.uses = 0
+
+    def sample(self) -> tuple:
+        """
+        가중치에 비례하는 확률로 연산자를 골라 이동을 생성
+
+        return:
+            - operator: 고른 연산자 번호 (record 에 전달)
+            - move: 이동 (만들 수 없으면 None)
+        """
+        operator = bisect_right(
+            self.cum_weights, self.sampler.rng.random() * self.cum_weights[-1]
+        )
+        return operator, self.functions[operator](self.evaluator, self.sampler)
+
+    def record(self, operator: int, improved: bool):
+        """
+        sample 로 고른 연산자의 결과를 기록하고, segment 번마다 가중치를 갱신
+        """
+        self.segment_tried[operator] += 1
+        self.segment_improved[operator] += improved
+        self.tried[operator] += 1
+        self.improved[operator] += improved
+        self.uses += 1
+        if self.uses % self.segment:
+            return
+
+        rates = [
+            improved_count / tried if tried else None
+            for tried, improved_count in zip(self.segment_tried, self.segment_improved)
+        ]
+        # 아무 연산자도 성공하지 못한 구간은 비교할 근거가 없으므로 가중치를 유지
+        best_rate = max((rate for rate in rates if rate is not None), default=0)
+        for k, rate in enumerate(rates):
+            if rate is not None and best_rate:
+                self.weights[k] = max(
+                    (1 - self.reaction) * self.weights[k]
+                    + self.reaction * rate / best_rate,
+                    self.min_weight,
+                )
+        self.cum_weights = list(accumulate(self.weights))
+        self.segment_tried = [0] * len(self.operators)
+        self.segment_improved = [0] * len(self.operators)
+
+    def stats(self) -> dict:
+        """
+        연산자별 사용 횟수 / 성공 횟수 / 현재 가중치
+
+        return:
+            - stats = {"swap": {"tried": 5200, "improved": 310, "weight": 0.08}, ...}
+        """
+        return {
+            name: {"tried": tried, "improved": improved, "weight": weight}
+            for name, tried, improved, weight in zip(
+                self.operators, self.tried, self.improved, self.weights
+            )
+        }
+
+    def state(self) -> dict:
+        """
+        체크포인트에 저장할 가중치와 사용 기록
+        """
+        return {
+            "weights": list(self.weights),
+            "segment_tried": list(self.segment_tried),
+            "segment_improved": list(self.segment_improved),
+            "tried": list(self.tried),
+            "improved": list(self.improved),
+            "uses": self.uses,
+        }
+
+    def restore_state(self, state: dict):
+        """
+        state() 로 저장한 가중치와 사용 기록을 복원 (같은 연산자 목록으로 생성한 선택기에서 호출)
+        """
+        self.weights = list(state["weights"])
+        self.cum_weights = list(accumulate(self.weights))
+        self.segment_tried = list(state["segment_tried"])
+        self.segment_improved = list(state["segment_improved"])
+        self.tried = list(state["tried"])
+        self.improved = list(state["improved"])
+        self.uses = state["uses"]
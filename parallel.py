@@ -0,0 +1,146 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from matching import evaluate_solution, initial_team_assignment, simulated_annealing
+from seeding import make_rng, spawn_seeds
+
+# 워커 프로세스마다 한 번만 전달받는 매칭 입력 데이터
+_worker_data = {}
+
+
+def _init_worker(participant_list: list[dict], waggings: list[dict], config=None):
+    _worker_data["participant_list"] = participant_list
+    _worker_data["waggings"] = waggings
+    _worker_data["config"] = config
+
+
+def _run_annealing(
+    run_id: int,
+    seed: int,
+    initial_method: str,
+    annealing_kwargs: dict,
+    data: dict = None,
+) -> dict:
+    """
+    워커 프로세스에서 초기 매칭 + simulated_annealing 한 번을 실행
+    매칭 입력 데이터는 data 로 전달받고, 생략하면 _init_worker 가 저장한 _worker_data 를 사용
+    (현재 프로세스에서 실행할 때는 data 를 직접 전달해서 모듈 전역 상태를 바꾸지 않음)
+
+    return:
+        - result = {
+            "run": 0,
+            "seed": 1234,
+            "initial_score": -80.5,
+            "score": -126.1,
+            "elapsed": 0.42,
+            "team_ids": [[1, 5, 9, ...], [], ...]  # 팀별 참가자 id
+        }
+    """
+    data = _worker_data if data is None else data
+    participant_list = data["participant_list"]
+    waggings = data["waggings"]
+    config = data["config"]
+
+    rng = make_rng(seed)
+    start = time.perf_counter()
+    initial_teams = initial_team_assignment(
+        participant_list, waggings, method=initial_method, config=config, seed=rng
+    )
+    initial_score = evaluate_solution(initial_teams, waggings, config)
+    best_teams, best_score = simulated_annealing(
+        initial_teams, waggings=waggings, config=config, seed=rng, **annealing_kwargs
+    )
+
+    return {
+        "run": run_id,
+        "seed": seed,
+        "initial_score": initial_score,
+        "score": best_score,
+        "elapsed": time.perf_counter() - start,
+        "team_ids": [[member["id"] for member in team] for team in best_teams],
+    }
+
+
+def multi_start_annealing(
+    participant_list: list[dict],
+    waggings: list[dict] = None,
+    n_runs: int = 4,
+    max_workers: int = None,
+    seed: int = None,
+    initial_method: str = "random",
+    config=None,
+    **annealing_kwargs,
+):
+    """
+    서로 다른 시드로 초기 매칭 + simulated_annealing 을 n_runs 번 독립적으로 실행하고
+    가장 점수가 낮은(좋은) 매칭을 반환
+    각 실행은 ProcessPoolExecutor 의 워커 프로세스에서 병렬로 진행됨
+
+    input:
+        - participant_list: 참가자 목록
+        - waggings: 꼬리흔들기 목록
+        - n_runs: 독립 실행 횟수
+        - max_workers: 워커 프로세스 수 (기본값: min(n_runs, CPU 수)), 1 이면 현재 프로세스에서 실행
+        - seed: 실행별 시드를 만들 기준 시드 (같은 값이면 같은 시드 목록, seeding.spawn_seeds 참고)
+        - initial_method: 초기 매칭 방법 ("random" | "greedy", matching.INITIALIZERS 참고)
+        - config: 매칭 설정 (MatchingConfig, 기본값: DEFAULT_CONFIG), 워커 프로세스마다 한 번만 전달
+        - annealing_kwargs: simulated_annealing 에 전달할 인자 (initial_temp, max_iterations 등)
+
+    return:
+        - best_solution: 가장 좋은 팀 매칭 (team_list 형식)
+        - best_score: 가장 좋은 점수
+        - run_stats = [
+            {"run": 0, "seed": 1234, "initial_score": -80.5, "score": -126.1, "elapsed": 0.42},
+            {run stats},
+            ...
+        ]
+    """
+    if n_runs < 1:
+        raise ValueError("실행 횟수는 1 이상이어야 합니다.")
+
+    seeds = spawn_seeds(seed, n_runs)
+
+    if max_workers is None:
+        max_workers = min(n_runs, os.cpu_count() or 1)
+
+    if max_workers == 1:
+        data = {
+            "participant_list": participant_list,
+            "waggings": waggings,
+            "config": config,
+        }
+        results = [
+            _run_annealing(run_id, run_seed, initial_method, annealing_kwargs, data)
+            for run_id, run_seed in enumerate(seeds)
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(participant_list, waggings, config),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _run_annealing, run_id, run_seed, initial_method, annealing_kwargs
+                )
+                for run_id, run_seed in enumerate(seeds)
+            ]
+            results = [future.result() for future in futures]
+
+    best = min(results, key=lambda result: result["score"])
+
+    # 워커에서는 참가자 id 만 돌려받고 원본 참가자 dict 로 복원
+    participant_by_id = {
+        participant["id"]: participant for participant in participant_list
+    }
+    best_solution = [
+        [participant_by_id[member_id] for member_id in team]
+        for team in best["team_ids"]
+    ]
+    run_stats = [
+        {key: value for key, value in result.items() if key != "team_ids"}
+        for result in results
+    ]
+
+    return best_solution, best["score"], run_stats
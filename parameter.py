@@ -7,3 +7,82 @@ CATEGORY = {
     "active_hours": ["day", "night"],
     "meeting_preference": ["online", "offline"],
 }
+
+MBTI = ["ei", "sn", "tf", "jp"]  # 성격 유형 특성 (0 ~ 1 사이의 값)
+
+
+class MatchingConfig:
+    """
+    팀 매칭 한 번(행사 하나)에 사용하는 설정값과, 설정값으로부터 미리 계산해 둔 인덱스
+    모듈 상수 대신 이 객체를 매칭 과정 전체에 전달하므로, 한 프로세스에서 설정이 서로 다른
+    여러 행사의 매칭을 동시에 실행할 수 있음 (생성 후에는 값을 바꾸지 않음)
+
+    - team_count: 생성할 팀의 개수
+    - part_min: 파트별 최소 인원수
+    - category: 카테고리 항목별 선택지
+    - mbti: 성격 유형 특성 이름 목록
+    - parts, part_index: 파트 목록과 파트 -> 코드 (part_min 의 순서)
+    - exact_scoring: True 이면 카테고리 점수의 중간값(선택 비율, 가중치, 팀 점수)을 반올림하지 않음
+      반올림한 점수는 교환 전후의 점수 차이가 0 인 경우가 많아 탐색이 평평한 구간을 헤매게 되므로,
+      탐색에는 정확한 점수를 사용하고 반올림은 화면에 표시할 때만 적용함
+    - together: 반드시 같은 팀이어야 하는 참가자 id 묶음 목록 (예: [[1, 2], [3, 4, 5]])
+    - apart: 반드시 서로 다른 팀이어야 하는 참가자 id 묶음 목록 (예: [[6, 7]], 묶음 안의 모든 쌍에 적용)
+      together / apart 는 점수가 아닌 제약으로 처리함 (constraints.ConstraintIndex 참고)
+    - category_keys, category_values, category_index: 카테고리 항목 / 선택지 목록과 선택지 -> 코드
+
+    input:
+        - 생략한 값은 모듈 상수(TEAM_COUNT, PART_MIN, CATEGORY, MBTI)를 사용
+    """
+
+    def __init__(
+        self,
+        team_count: int = None,
+        part_min: dict[str, int] = None,
+        category: dict[str, list[str]] = None,
+        mbti: list[str] = None,
+        exact_scoring: bool = False,
+        together: list[list[int]] = None,
+        apart: list[list[int]] = None,
+    ):
+        self.team_count = TEAM_COUNT if team_count is None else team_count
+        self.part_min = dict(PART_MIN if part_min is None else part_min)
+        self.category = {
+            key: list(values)
+            for key, values in (CATEGORY if category is None else category).items()
+        }
+        self.mbti = list(MBTI if mbti is None else mbti)
+        self.exact_scoring = exact_scoring
+        self.together = [list(id_list) for id_list in together or []]
+        self.apart = [list(id_list) for id_list in apart or []]
+
+        self.parts = list(self.part_min.keys())
+        self.part_index = {part: code for code, part in enumerate(self.parts)}
+        self.category_keys = list(self.category.keys())
+        self.category_values = [self.category[key] for key in self.category_keys]
+        self.category_index = [
+            {value: code for code, value in enumerate(values)}
+            for values in self.category_values
+        ]
+
+    def as_dict(self) -> dict:
+        """
+        설정값만 담은 dict (미리 계산한 인덱스 제외, 결과 캐시의 키 계산 등에 사용)
+        """
+        return {
+            "team_count": self.team_count,
+            "part_min": self.part_min,
+            "category": self.category,
+            "mbti": self.mbti,
+            "exact_scoring": self.exact_scoring,
+            "together": self.together,
+            "apart": self.apart,
+        }
+
+    def replace(self, **changes) -> "MatchingConfig":
+        """
+        일부 값만 바꾼 새 설정을 반환 (예: config.replace(team_count=12))
+        """
+        return MatchingConfig(**{**self.as_dict(), **changes})
+
+
+DEFAULT_CONFIG = MatchingConfig()  # 설정을 생략했을 때 사용하는 기본 설정
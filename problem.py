@@ -0,0 +1,166 @@
+from math import log
+
+import numpy as np
+
+from constraints import compile_constraints
+from parameter import DEFAULT_CONFIG, MatchingConfig
+from wagging import compile_wagging_index
+
+
+class MatchingProblem:
+    """
+    참가자 목록을 한 번만 변환해 둔 배열 기반 문제 표현
+    알고리즘 내부에서는 참가자 dict 대신 참가자 번호(0 ~ N-1)와 정수 코드 배열을 사용하고,
+    팀 매칭 결과는 참가자 번호 순서의 팀 번호 배열(assignment) 하나로 표현함
+
+    - config: 매칭 설정 (MatchingConfig)
+    - participants: 원본 참가자 dict 목록 (team_list 로 되돌릴 때만 사용)
+    - ids: 참가자 id 배열, shape (N,)
+    - part_code: 파트 코드 배열 (config.parts 의 순서, 알 수 없는 파트는 -1), shape (N,)
+    - category_code: 카테고리 값 코드 행렬 (config.category_keys 의 순서), shape (N, 카테고리 수)
+    - mbti: 성격 유형 특성 행렬 (config.mbti 의 순서), shape (N, 특성 수)
+    - category_weight: 카테고리 값별 가중치 표, shape (카테고리 수, 값의 최대 개수)
+      (생성 시 전달하면 그 표를 사용, 예: 전체 참가자의 일부만으로 만든 문제를 전체 기준 가중치로 평가)
+    - max_weight: 가장 큰 카테고리 가중치
+    - wagging: 참가자 번호 기준의 꼬리흔들기 인덱스 (WaggingIndex)
+    - constraints: 참가자 번호 기준의 같은 팀 / 다른 팀 제약 (ConstraintIndex, 제약이 없으면 False 로 평가됨)
+    """
+
+    def __init__(
+        self,
+        participant_list: list[dict],
+        waggings: list[dict] = None,
+        config: MatchingConfig = None,
+        category_weight: np.ndarray = None,
+    ):
+        self.config = config or DEFAULT_CONFIG
+        self.participants = list(participant_list)
+        self.index = {
+            participant["id"]: idx for idx, participant in enumerate(self.participants)
+        }
+
+        self.parts = self.config.parts
+        self.category_keys = self.config.category_keys
+        self.category_values = self.config.category_values
+
+        part_index = self.config.part_index
+        category_index = self.config.category_index
+
+        participant_count = len(self.participants)
+        self.ids = np.array([p["id"] for p in self.participants], dtype=np.int64)
+        self.part_code = np.array(
+            [part_index.get(p.get("part"), -1) for p in self.participants],
+            dtype=np.int8,
+        )
+        self.category_code = np.zeros(
+            (participant_count, len(self.category_keys)), dtype=np.int8
+        )
+        self.mbti = np.zeros(
+            (participant_count, len(self.config.mbti)), dtype=np.float64
+        )
+
+        for idx, participant in enumerate(self.participants):
+            for col, key in enumerate(self.category_keys):
+                value = participant[key]
+                if value not in category_index[col]:
+                    raise ValueError(
+                        f"id: {participant['id']} 참가자의 {key} 값({value})을 구분할 수 없습니다."
+                    )
+                self.category_code[idx, col] = category_index[col][value]
+            self.mbti[idx] = [
+                participant.get(trait, np.nan) for trait in self.config.mbti
+            ]
+
+        # 카테고리 가중치는 참가자 구성에만 의존하므로 문제 생성 시 한 번만 계산
+        if category_weight is None:
+            category_weight = _get_category_weight_table(
+                self.category_code, self.category_values, self.config.exact_scoring
+            )
+        self.category_weight = category_weight
+        self.max_weight = float(self.category_weight.max())
+
+        # 꼬리흔들기 인접 인덱스 (참가자 번호 기준 CSR)
+        self.wagging = compile_wagging_index(waggings, self.ids.tolist())
+
+        # 같은 팀 / 다른 팀 제약
+        self.constraints = compile_constraints(self.ids.tolist(), self.config)
+
+    def __len__(self) -> int:
+        return len(self.participants)
+
+    def assignment_from_team_list(self, team_list: list[list[dict]]) -> np.ndarray:
+        """
+        team_list 를 참가자 번호 순서의 팀 번호 배열로 변환
+
+        return:
+            - assignment = [2, 0, 1, 1, ...] (assignment[i]: i 번 참가자의 팀 번호)
+        """
+        assignment = np.full(len(self.participants), -1, dtype=np.int32)
+        for team_idx, team in enumerate(team_list):
+            for member in team:
+                assignment[self.index[member["id"]]] = team_idx
+        if (assignment < 0).any():
+            raise ValueError("팀에 배정되지 않은 참가자가 있습니다.")
+        return assignment
+
+    def to_team_list(
+        self, assignment: np.ndarray, team_count: int = None
+    ) -> list[list[dict]]:
+        """
+        팀 번호 배열을 team_list 형식으로 변환 (팀 내 순서는 참가자 번호 순서)
+        """
+        if team_count is None:
+            team_count = int(np.max(assignment)) + 1
+        team_list = [[] for _ in range(team_count)]
+        for participant, team_idx in zip(self.participants, assignment.tolist()):
+            team_list[team_idx].append(participant)
+        return team_list
+
+
+def compile_problem(
+    team_list: list[list[dict]],
+    waggings: list[dict] = None,
+    config: MatchingConfig = None,
+    category_weight: np.ndarray = None,
+):
+    """
+    team_list 로부터 문제 표현과 현재 팀 번호 배열을 함께 생성 (config 를 생략하면 DEFAULT_CONFIG)
+    category_weight 를 전달하면 team_list 의 참가자로 다시 계산하지 않고 그 가중치 표를 사용
+
+    return:
+        - problem: MatchingProblem
+        - assignment: 참가자 번호 순서의 팀 번호 배열
+    """
+    problem = MatchingProblem(
+        [member for team in team_list for member in team],
+        waggings,
+        config,
+        category_weight,
+    )
+    return problem, problem.assignment_from_team_list(team_list)
+
+
+def _get_category_weight_table(
+    category_code: np.ndarray, category_values: list[list[str]], exact: bool = False
+) -> np.ndarray:
+    """
+    category._get_category_weight 와 같은 규칙의 가중치 표를 반환
+    shape (카테고리 수, 값의 최대 개수), 아무도 선택하지 않은 값의 가중치는 0
+
+    - 모든 참가자가 같은 값을 선택한 경우에는 가중치를 1 (만점처리)
+    - 그 외에는 -log(선택 비율) (exact 가 False 이면 소수점 둘째 자리로 반올림)
+    """
+    participant_count = len(category_code)
+    value_count = max(len(values) for values in category_values)
+    weight = np.zeros((len(category_values), value_count))
+
+    for col, values in enumerate(category_values):
+        count = np.bincount(category_code[:, col], minlength=len(values))
+        for code in range(len(values)):
+            if count[code] == participant_count:
+                weight[col, code] = 1
+            elif count[code] > 0:
+                value = -log(count[code] / participant_count)
+                weight[col, code] = value if exact else round(value, 2)
+
+    return weight
@@ -0,0 +1,344 @@
+import numpy as np
+
+from budget import SearchBudget
+from constraints import compile_constraints
+from evaluator import IncrementalEvaluator
+from hungarian import linear_sum_assignment
+from matching import _get_team_template
+from moves import SwapMove, SwapSampler
+from parameter import DEFAULT_CONFIG, MatchingConfig
+from problem import compile_problem
+from seeding import make_rng
+
+
+def _get_links(waggings: list[dict]) -> dict[int, set]:
+    """
+    참가자 id -> 꼬리흔들기 관계(양방향)가 있는 참가자 id 집합
+    """
+    links = {}
+    for wagging in waggings or []:
+        links.setdefault(wagging["wagger"], set()).add(wagging["waggee"])
+        links.setdefault(wagging["waggee"], set()).add(wagging["wagger"])
+    return links
+
+
+def _match_template(
+    team_list: list[list[dict]], team_template: list[dict], parts: list[str]
+):
+    """
+    새 팀 템플릿의 각 행을 기존 팀에 대응시켜 팀별 목표 파트 인원수를 반환
+    (파트별 인원수 차이의 합이 최소가 되도록 배정해서 옮겨야 하는 인원을 줄임)
+    """
+    current = np.array(
+        [
+            [sum(member.get("part") == part for member in team) for part in parts]
+            for team in team_list
+        ]
+    )
+    target = np.array([[row[part] for part in parts] for row in team_template])
+    cost = np.abs(current[:, None, :] - target[None, :, :]).sum(axis=2)
+    _, template_ind = linear_sum_assignment(cost)
+    return [team_template[row] for row in template_ind]
+
+
+def repair_matching(
+    team_list: list[list[dict]],
+    waggings: list[dict] = None,
+    joined: list[dict] = None,
+    left: list[int] = None,
+    changed: list[dict] = None,
+    max_iterations: int = 2000,
+    time_limit: float = None,
+    config: MatchingConfig = None,
+    seed=None,
+):
+    """
+    기존 팀 매칭에 참가자 변경(합류 / 이탈 / 파트 변경)을 반영해서, 대부분의 참가자를 기존 팀에 둔 채로 고침
+    처음부터 다시 매칭하지 않고 다음 순서로 진행함
+
+    1) 이탈한 참가자를 빼고, 정보가 바뀐 참가자는 일단 팀에서 뺌
+    2) 바뀐 참가자 구성으로 _get_team_template 의 팀별 파트 인원수를 다시 구하고,
+       기존 팀과 차이가 가장 적도록 템플릿을 팀에 대응시킴
+    3) 파트 인원이 넘치는 팀에서는 팀 안의 꼬리흔들기 관계가 가장 적은 사람부터 내보내고,
+       빈 자리에는 대기 인원(합류 / 변경 / 내보낸 사람)을 꼬리흔들기 관계와 카테고리가 맞는 팀에 배정
+       같은 팀 / 다른 팀 제약(config.together, config.apart)이 있으면 제약을 어기는 참가자도 내보내고,
+       같은 팀 묶음은 한 단위로 함께 배정함 (제약을 지키는 자리가 없으면 ValueError)
+    4) 구성이 바뀐 팀과 옮겨진 사람의 꼬리흔들기 상대가 있는 팀 안에서만 점수가 좋아지는 교환을 시도
+
+    input:
+        - team_list: 기존 팀 매칭 (team_list 형식)
+        - waggings: 꼬리흔들기 목록 (새로운 참가자의 꼬리흔들기 포함)
+        - joined: 새로 합류한 참가자 dict 목록
+        - left: 이탈한 참가자 id 목록
+        - changed: 정보(파트 등)가 바뀐 참가자 dict 목록 (id 는 기존과 같음)
+        - max_iterations: 4) 의 교환 시도 횟수
+        - time_limit: 4) 의 최대 실행 시간 (초)
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG, team_count 는 기존 팀 개수를 사용)
+        - seed: 4) 의 교환 후보를 뽑는 난수 시드 (정수 | random.Random, seeding.make_rng 참고)
+
+    return:
+        - new_team_list: 고친 팀 매칭 (team_list 형식, 팀 순서는 기존과 같음)
+        - score: 고친 팀 매칭의 점수
+        - stats = {
+            "moved": 3,               # 기존 참가자 중 팀이 바뀐 인원
+            "placed": 2,              # 새로 배정한 인원 (합류 + 변경 + 내보낸 사람)
+            "affected_teams": [0, 4], # 구성이 바뀐 팀 번호
+            "initial_score": -120.3,  # 4) 이전 점수
+        }
+    """
+    config = config or DEFAULT_CONFIG
+    left_ids = set(left or [])
+    changed_by_id = {participant["id"]: participant for participant in changed or []}
+    original_team = {
+        member["id"]: team_idx
+        for team_idx, team in enumerate(team_list)
+        for member in team
+    }
+
+    # 1) 이탈 / 변경 인원 제외
+    teams = [
+        [
+            member
+            for member in team
+            if member["id"] not in left_ids and member["id"] not in changed_by_id
+        ]
+        for team in team_list
+    ]
+    waiting = [
+        participant
+        for participant in list(changed_by_id.values()) + list(joined or [])
+        if participant["id"] not in left_ids
+    ]
+
+    # 2) 팀별 목표 파트 인원수
+    participant_list = [member for team in teams for member in team] + waiting
+    team_template = _get_team_template(participant_list, len(team_list), config)
+    if not team_template:
+        raise ValueError("변경된 참가자 구성으로는 기존 팀 개수를 유지할 수 없습니다.")
+    target = _match_template(teams, team_template, config.parts)
+
+    links = _get_links(waggings)
+
+    # 같은 팀 / 다른 팀 제약 (참가자 id 기준)
+    constraints = compile_constraints(
+        [participant["id"] for participant in participant_list], config
+    )
+    group_of_id = {
+        constraints.ids[idx]: group_id
+        for idx, group_id in enumerate(constraints.group_of)
+        if group_id >= 0
+    }
+    apart_ids = {
+        constraints.ids[idx]: {constraints.ids[other] for other in others}
+        for idx, others in enumerate(constraints.apart_of)
+        if others
+    }
+
+    def attachment(member, team):
+        team_ids = {other["id"] for other in team if other is not member}
+        return len(links.get(member["id"], set()) & team_ids)
+
+    # 3) 넘치는 인원 내보내기 (팀 안의 꼬리흔들기 관계가 적은 사람부터)
+    for team_idx, team in enumerate(teams):
+        for part in config.parts:
+            members = [member for member in team if member.get("part") == part]
+            overflow = len(members) - target[team_idx][part]
+            if overflow > 0:
+                members.sort(key=lambda member: attachment(member, team))
+                for member in members[:overflow]:
+                    team.remove(member)
+                    waiting.append(member)
+
+    # 제약을 어기는 참가자 내보내기
+    # (같은 팀의 떨어뜨려야 하는 쌍은 한 명만, 흩어졌거나 일부가 대기 중인 같은 팀 묶음은 팀에 남은 전원)
+    if constraints:
+        team_of_id = {
+            member["id"]: team_idx
+            for team_idx, team in enumerate(teams)
+            for member in team
+        }
+        release = set()
+        for participant_id, others in apart_ids.items():
+            team_idx = team_of_id.get(participant_id)
+            if team_idx is not None and any(
+                team_of_id.get(other) == team_idx and other not in release
+                for other in others
+            ):
+                release.add(participant_id)
+        for members in constraints.groups:
+            member_ids = [constraints.ids[idx] for idx in members]
+            # 대기 중이거나 내보낸 참가자는 팀 번호 None
+            member_teams = {
+                None if pid in release else team_of_id.get(pid) for pid in member_ids
+            }
+            if len(member_teams) > 1:
+                release.update(pid for pid in member_ids if pid in team_of_id)
+        for team in teams:
+            waiting.extend(member for member in team if member["id"] in release)
+            team[:] = [member for member in team if member["id"] not in release]
+
+    # 파트를 알 수 없는 참가자는 템플릿에서 제외되므로 배정하지 않음
+    waiting = [member for member in waiting if member.get("part") in config.part_index]
+
+    # 빈 자리 채우기 (관계가 많은 사람부터, 관계 + 카테고리가 가장 잘 맞는 팀으로)
+    def gain(member, team):
+        team_ids = {other["id"] for other in team}
+        wag_links = len(links.get(member["id"], set()) & team_ids)
+        category_match = sum(
+            other[key] == member[key] for other in team for key in config.category_keys
+        ) / max(len(team), 1)
+        return 10 * wag_links + category_match
+
+    # 같은 팀 묶음은 하나의 단위로 배정 (큰 단위부터, 같은 크기면 관계가 많은 단위부터)
+    units = {}
+    for member in waiting:
+        key = group_of_id.get(member["id"], ("single", member["id"]))
+        units.setdefault(key, []).append(member)
+    units = sorted(
+        units.values(),
+        key=lambda unit: (
+            -len(unit),
+            -sum(len(links.get(member["id"], ())) for member in unit),
+        ),
+    )
+
+    def free_slots(team_idx, part, evictable):
+        team = teams[team_idx]
+        slots = target[team_idx][part] - sum(
+            other.get("part") == part for other in team
+        )
+        if evictable:
+            slots += sum(
+                other.get("part") == part
+                and other["id"] not in group_of_id
+                and other["id"] not in apart_ids
+                for other in team
+            )
+        return slots
+
+    # 빈 자리가 모자라면 제약이 없는 팀원을 내보내서 자리를 만들고, 내보낸 사람은 뒤에 다시 배정
+    # (파트별 빈 자리 수는 항상 남은 대기 인원 수와 같으므로 제약이 없는 사람은 어디든 들어갈 수 있음)
+    position = 0
+    while position < len(units):
+        unit = units[position]
+        position += 1
+        need = {}
+        for member in unit:
+            need[member["part"]] = need.get(member["part"], 0) + 1
+        unit_apart = set().union(*(apart_ids.get(member["id"], ()) for member in unit))
+        allowed = [
+            team_idx
+            for team_idx, team in enumerate(teams)
+            if not unit_apart & {other["id"] for other in team}
+        ]
+        for evictable in (False, True):
+            open_teams = [
+                team_idx
+                for team_idx in allowed
+                if all(
+                    free_slots(team_idx, part, evictable) >= count
+                    for part, count in need.items()
+                )
+            ]
+            if open_teams:
+                break
+        else:
+            raise ValueError(
+                f"제약 조건을 지키는 팀 매칭을 만들 수 없습니다.\n참가자: {[member['id'] for member in unit]}"
+            )
+        team_idx = max(
+            open_teams,
+            key=lambda team_idx: sum(gain(member, teams[team_idx]) for member in unit),
+        )
+        team = teams[team_idx]
+
+        if evictable:
+            for part, count in need.items():
+                overflow = count - free_slots(team_idx, part, False)
+                members = [
+                    other
+                    for other in team
+                    if other.get("part") == part
+                    and other["id"] not in group_of_id
+                    and other["id"] not in apart_ids
+                ]
+                members.sort(key=lambda member: attachment(member, team))
+                for member in members[: max(overflow, 0)]:
+                    team.remove(member)
+                    waiting.append(member)
+                    units.append([member])
+        team.extend(unit)
+
+    # 4) 구성이 바뀐 팀 주변에서만 지역 탐색
+    new_team = {
+        member["id"]: team_idx for team_idx, team in enumerate(teams) for member in team
+    }
+    affected = sorted(
+        {
+            team_idx
+            for team_idx, team in enumerate(teams)
+            if {member["id"] for member in team}
+            != {member["id"] for member in team_list[team_idx]}
+        }
+    )
+    region = set(affected)
+    for member in waiting:
+        region.update(
+            new_team[other_id]
+            for other_id in links.get(member["id"], ())
+            if other_id in new_team
+        )
+
+    problem, assignment = compile_problem(teams, waggings, config)
+    # 교환 샘플러의 팀 마스크는 제약을 지키는 상태에서만 올바르므로 먼저 확인
+    problem.constraints.check(assignment)
+    evaluator = IncrementalEvaluator(problem, assignment, len(teams))
+    initial_score = evaluator.score
+
+    # 탐색 범위 밖의 참가자는 각자 고유한 파트로 취급해서 교환 대상에서 제외
+    part_of = [
+        part if team_idx in region else ("fixed", idx)
+        for idx, (part, team_idx) in enumerate(
+            zip(problem.part_code.tolist(), evaluator.team_of)
+        )
+    ]
+    sampler = SwapSampler(
+        part_of, evaluator.team_of, make_rng(seed), problem.constraints
+    )
+    budget = SearchBudget(time_limit)
+    for iteration in range(max_iterations):
+        if budget.exhausted(iteration):
+            break
+        swap = sampler.sample()
+        if swap is None:
+            # 다른 팀 제약이 있으면 제약을 어기는 쌍만 연속으로 뽑힌 경우일 수 있으므로 계속 진행
+            if sampler.apart_mask is None:
+                break
+            continue
+        current_score = evaluator.score
+        move = SwapMove(
+            evaluator,
+            evaluator.position(swap[0]),
+            evaluator.position(swap[1]),
+            sampler,
+        )
+        if move.apply() >= current_score:
+            move.undo()
+
+    new_team_list = problem.to_team_list(evaluator.snapshot(), len(teams))
+    final_team = {
+        member["id"]: team_idx
+        for team_idx, team in enumerate(new_team_list)
+        for member in team
+    }
+    stats = {
+        "moved": sum(
+            final_team.get(member_id, team_idx) != team_idx
+            for member_id, team_idx in original_team.items()
+            if member_id not in left_ids and member_id not in changed_by_id
+        ),
+        "placed": len(waiting),
+        "affected_teams": affected,
+        "initial_score": initial_score,
+    }
+    return new_team_list, evaluator.score, stats
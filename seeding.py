@@ -0,0 +1,54 @@
+import random
+
+import numpy as np
+
+
+def stream_seed(seed_sequence: np.random.SeedSequence) -> int:
+    """
+    SeedSequence 로부터 random.Random 에 사용할 128비트 정수 시드를 생성
+    """
+    return int.from_bytes(seed_sequence.generate_state(4).tobytes(), "little")
+
+
+def make_rng(seed=None) -> random.Random:
+    """
+    탐색 한 번이 전용으로 사용할 난수 생성기를 반환
+    전역 random 모듈을 사용하지 않으므로, 한 프로세스에서 동시에 실행되는 탐색끼리 서로 영향을 주지 않음
+
+    input:
+        - seed: 정수 시드 | SeedSequence | random.Random (그대로 반환해서 이어서 사용) | None (OS 엔트로피)
+
+    return:
+        - rng: random.Random
+    """
+    if isinstance(seed, random.Random):
+        return seed
+    if isinstance(seed, np.random.SeedSequence):
+        return random.Random(stream_seed(seed))
+    return random.Random(seed)
+
+
+def spawn_seeds(seed, count: int) -> list[int]:
+    """
+    seed 로부터 서로 독립적인 count 개의 정수 시드를 생성 (SeedSequence.spawn)
+    병렬 워커마다 하나씩 전달하며, 각 시드만으로 해당 실행을 그대로 재현할 수 있음
+
+    input:
+        - seed: 정수 시드 | SeedSequence | random.Random (다음 난수로 기준 시드를 정함) | None
+        - count: 생성할 시드 수
+
+    return:
+        - seeds = [int, ...]
+    """
+    if isinstance(seed, random.Random):
+        seed = seed.getrandbits(128)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [stream_seed(child) for child in seed.spawn(count)]
+
+
+def numpy_rng(rng: random.Random) -> np.random.Generator:
+    """
+    rng 에서 시드를 받은 numpy 난수 생성기 (배열 단위 난수가 필요한 탐색에서 함께 사용)
+    """
+    return np.random.default_rng(rng.getrandbits(128))
@@ -0,0 +1,177 @@
+import json
+import random
+
+from parameter import DEFAULT_CONFIG, MatchingConfig
+
+
+def _get_devti_by_mbti(devti_path: str) -> dict[str, str]:
+    """
+    MBTI -> devti(견종) 이름 매핑을 반환 (파일이 없으면 빈 dict)
+    """
+    try:
+        with open(devti_path, "r", encoding="utf-8") as f:
+            devti_list = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return {devti["mbti"]: devti["breed"] for devti in devti_list}
+
+
+def _get_part_counts(n_participants: int, part_ratio: dict[str, float]):
+    """
+    파트 비율에 맞게 n_participants 명을 파트별로 나눈 인원수를 반환 (최대 나머지 방식)
+    """
+    total = sum(part_ratio.values())
+    if total <= 0:
+        raise ValueError("파트 비율의 합은 0보다 커야 합니다.")
+
+    quotas = {
+        part: n_participants * ratio / total for part, ratio in part_ratio.items()
+    }
+    counts = {part: int(quota) for part, quota in quotas.items()}
+    leftover = n_participants - sum(counts.values())
+    for part in sorted(quotas, key=lambda part: counts[part] - quotas[part])[:leftover]:
+        counts[part] += 1
+    return counts
+
+
+def generate_participants(
+    n_participants: int,
+    seed: int = 0,
+    part_ratio: dict[str, float] = None,
+    devti_path: str = "sample_data/devti_list.json",
+    config: MatchingConfig = None,
+) -> list[dict]:
+    """
+    sample_data/participant.json 과 같은 형식의 가상 참가자 목록을 생성
+    같은 seed 로 호출하면 항상 같은 목록을 반환함 (외부 API 호출 없음)
+
+    input:
+        - n_participants: 생성할 참가자 수
+        - seed: 난수 시드
+        - part_ratio: 파트별 비율 (기본값: config.part_min 에 0.5 씩 더한 비율, pm : de : fe : be = 0.5 : 1.5 : 2.5 : 2.5)
+          최소 인원수가 0 인 파트(pm)도 팀의 일부에는 들어가도록 모든 파트를 생성함
+        - devti_path: MBTI 별 devti 정보 파일 (MBTI 특성값으로 devti 를 정할 때 사용)
+        - config: 카테고리 선택지와 성격 유형 특성을 정할 매칭 설정 (기본값: DEFAULT_CONFIG)
+
+    return:
+        - participant_list = [
+            {
+                "id": 1,
+                "part": "de",
+                "team_vibe": "learning",
+                "active_hours": "day",
+                "meeting_preference": "offline",
+                "ei": 0.72,
+                "sn": 0.81,
+                "tf": 0.63,
+                "jp": 0.77,
+                "devti": "골든 리트리버"
+            },
+            {participant},
+            ...
+        ]
+    """
+    config = config or DEFAULT_CONFIG
+    if part_ratio is None:
+        part_ratio = {part: min_cnt + 0.5 for part, min_cnt in config.part_min.items()}
+
+    rng = random.Random(seed)
+    devti_by_mbti = _get_devti_by_mbti(devti_path)
+
+    parts = [
+        part
+        for part, count in _get_part_counts(n_participants, part_ratio).items()
+        for _ in range(count)
+    ]
+    rng.shuffle(parts)
+
+    participant_list = []
+    for idx, part in enumerate(parts):
+        participant = {"id": idx + 1, "part": part}
+        for element, values in config.category.items():
+            participant[element] = rng.choice(values)
+        for trait in config.mbti:
+            participant[trait] = round(rng.random(), 2)
+
+        # 특성값이 0.5 이상이면 E / N / F / P
+        mbti = "".join(
+            letters[participant[trait] >= 0.5]
+            for trait, letters in zip(config.mbti, ["IE", "SN", "TF", "JP"])
+        )
+        if mbti in devti_by_mbti:
+            participant["devti"] = devti_by_mbti[mbti]
+
+        participant_list.append(participant)
+
+    return participant_list
+
+
+def generate_waggings(
+    participant_list: list[dict],
+    seed: int = 0,
+    min_wags: int = 3,
+    max_wags: int = 6,
+    reciprocity: float = 0.1,
+) -> list[dict]:
+    """
+    sample_data/wagging.json 과 같은 형식의 가상 꼬리흔들기 목록을 생성
+    모든 참가자가 min_wags ~ max_wags 명에게 꼬리를 흔들고 (같은 사람에게 두 번은 불가),
+    꼬리흔들기를 받은 사람은 reciprocity 확률로 상대에게 꼬리를 흔들어 맞꼬리흔들기가 생김
+
+    input:
+        - participant_list: 참가자 목록
+        - seed: 난수 시드
+        - min_wags, max_wags: 한 사람이 꼬리를 흔드는 인원수의 범위 (꼬리흔들기 밀도)
+        - reciprocity: 꼬리흔들기를 받은 사람이 되돌려줄 확률
+
+    return:
+        - waggings = [
+            {"id": 1, "wagger": 1, "waggee": 33},
+            {"id": 2, "wagger": 1, "waggee": 7},
+            ...
+        ]
+    """
+    if not 0 <= min_wags <= max_wags:
+        raise ValueError("꼬리흔들기 인원수 범위가 올바르지 않습니다.")
+
+    rng = random.Random(seed)
+    ids = [participant["id"] for participant in participant_list]
+    max_wags = min(max_wags, len(ids) - 1)
+    min_wags = min(min_wags, max_wags)
+
+    waggee_sets = {wagger: set() for wagger in ids}
+    for position, wagger in enumerate(ids):
+        wag_count = rng.randint(min_wags, max_wags)
+        # 자기 자신을 제외하고 선택 (자기 위치 이후의 번호를 한 칸씩 밀어서 사용)
+        for other in rng.sample(range(len(ids) - 1), wag_count):
+            waggee_sets[wagger].add(ids[other + (other >= position)])
+
+    for wagger in ids:
+        for waggee in list(waggee_sets[wagger]):
+            if wagger not in waggee_sets[waggee] and rng.random() < reciprocity:
+                waggee_sets[waggee].add(wagger)
+
+    waggings = []
+    for wagger in ids:
+        for waggee in sorted(waggee_sets[wagger]):
+            waggings.append(
+                {"id": len(waggings) + 1, "wagger": wagger, "waggee": waggee}
+            )
+    return waggings
+
+
+def generate_cohort(
+    n_participants: int,
+    seed: int = 0,
+    config: MatchingConfig = None,
+    **wagging_kwargs,
+):
+    """
+    가상 참가자 목록과 꼬리흔들기 목록을 함께 생성 (config 는 generate_participants 에 전달)
+
+    return:
+        - participant_list, waggings
+    """
+    participant_list = generate_participants(n_participants, seed=seed, config=config)
+    waggings = generate_waggings(participant_list, seed=seed, **wagging_kwargs)
+    return participant_list, waggings
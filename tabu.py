@@ -0,0 +1,121 @@
+import numpy as np
+
+from budget import SearchBudget
+from evaluator import IncrementalEvaluator
+from moves import SwapMove, SwapSampler
+from problem import MatchingProblem
+
+
+def tabu_search(
+    problem: MatchingProblem,
+    assignment: np.ndarray,
+    team_count: int,
+    budget: SearchBudget,
+    max_iterations=5000,
+    candidate_count=32,
+    tenure=10,
+    rng=None,
+):
+    """
+    같은 파트끼리의 교환을 이웃으로 하는 타부 탐색 (matching.SOLVERS 에 "tabu" 로 등록되는 solver)
+
+    반복마다 교환 후보 candidate_count 개의 점수를 배열 연산으로 한 번에 계산하고,
+    금지되지 않은 후보 중 가장 좋은 후보로 이동함 (점수가 나빠지더라도 이동)
+    이동한 참가자가 떠난 팀으로 tenure 반복 동안 돌아가지 못하게 해서 같은 해를 맴도는 것을 막고,
+    금지된 이동이라도 지금까지의 best 보다 좋아지면 허용함 (aspiration)
+
+    input:
+        - problem: MatchingProblem
+        - assignment: 초기 팀 번호 배열
+        - team_count: 팀의 개수
+        - budget: 종료 조건 (SearchBudget)
+        - max_iterations: 최대 반복 횟수
+        - candidate_count: 반복마다 평가할 교환 후보 수
+        - tenure: 떠난 팀으로 돌아가는 이동을 금지하는 반복 횟수
+        - rng: 이 탐색 전용 난수 생성기 (seeding.make_rng 참고)
+
+    return:
+        - best_assignment: 가장 좋은 팀 번호 배열
+        - best_score: 가장 좋은 점수
+        - stats = {"iterations": 5000, "aspirations": 12, "evaluations": 160000}
+    """
+    evaluator = IncrementalEvaluator(problem, assignment, team_count)
+    sampler = SwapSampler(
+        problem.part_code.tolist(), evaluator.team_of, rng, problem.constraints
+    )
+    team_of = evaluator.team_of
+
+    best_assignment = evaluator.snapshot()
+    best_score = evaluator.score
+
+    # (참가자 번호, 팀 번호) -> 그 팀으로 돌아가는 이동이 금지되는 마지막 반복
+    tabu_until = {}
+
+    def is_tabu(idx, team_idx, iteration):
+        return tabu_until.get((idx, team_idx), -1) >= iteration
+
+    iteration = 0
+    aspirations = 0
+    evaluations = 0
+    while iteration < max_iterations:
+        if budget.exhausted(iteration):
+            break
+
+        # 제약을 어기는 쌍만 뽑힌 후보(None)는 제외
+        pairs = [sampler.sample() for _ in range(candidate_count)]
+        if pairs[0] is None and sampler.apart_mask is None:
+            break
+        pairs = [pair for pair in pairs if pair is not None]
+        if not pairs:
+            iteration += 1
+            continue
+        idx_a = np.array([a for a, _ in pairs])
+        idx_b = np.array([b for _, b in pairs])
+        scores = evaluator.swap_scores(idx_a, idx_b)
+        evaluations += len(pairs)
+
+        # 점수가 좋은 순서로 금지되지 않은 후보 선택
+        chosen = None
+        for candidate in np.argsort(scores, kind="stable"):
+            a, b = pairs[candidate]
+            tabu = is_tabu(a, team_of[b], iteration) or is_tabu(
+                b, team_of[a], iteration
+            )
+            if not tabu:
+                chosen = a, b
+                break
+            if scores[candidate] < best_score:
+                chosen = a, b
+                aspirations += 1
+                break
+
+        if chosen is not None:
+            a, b = chosen
+            tabu_until[(a, team_of[a])] = iteration + tenure
+            tabu_until[(b, team_of[b])] = iteration + tenure
+            SwapMove(
+                evaluator, evaluator.position(a), evaluator.position(b), sampler
+            ).apply()
+
+            if evaluator.score < best_score:
+                best_assignment = evaluator.snapshot()
+                best_score = evaluator.score
+                budget.improved(iteration, best_score)
+
+        # 만료된 금지 기록 정리
+        if iteration % (tenure * 100 + 1) == 0:
+            tabu_until = {
+                key: until for key, until in tabu_until.items() if until >= iteration
+            }
+
+        iteration += 1
+
+    return (
+        best_assignment,
+        best_score,
+        {
+            "iterations": iteration,
+            "aspirations": aspirations,
+            "evaluations": evaluations,
+        },
+    )
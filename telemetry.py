@@ -0,0 +1,124 @@
+import time
+
+
+class SolverTelemetry:
+    """
+    탐색 진행 상황을 report_interval 반복마다 callback 으로 전달하는 기록기
+    솔버는 telemetry 가 None 이면 시간 측정을 포함한 모든 기록을 건너뛰므로 비활성 시 비용이 거의 없음
+
+    callback 이 받는 snapshot = {
+        "iteration": 3000,              # 지금까지 수행한 반복 횟수
+        "temperature": 0.22,            # 현재 온도
+        "current_score": -110.3,
+        "best_score": -126.1,
+        "acceptance_rate": 0.31,        # 직전 구간(report_interval 반복)의 채택 비율
+        "evals_per_sec": 84000.0,       # 직전 구간의 초당 점수 계산 횟수
+        "neighbor_time": 0.012,         # 누적 이웃 생성 시간 (초)
+        "scoring_time": 0.028,          # 누적 점수 계산 시간 (초)
+        "elapsed": 0.05,                # 탐색 시작 후 경과 시간 (초)
+        "final": False,                 # 탐색이 끝난 뒤 마지막으로 보내는 snapshot 이면 True
+    }
+
+    input:
+        - callback: snapshot dict 를 받는 함수
+        - report_interval: snapshot 을 보내는 반복 간격
+    """
+
+    def __init__(self, callback, report_interval: int = 1000):
+        if report_interval < 1:
+            raise ValueError("report_interval 은 1 이상이어야 합니다.")
+
+        self.callback = callback
+        self.report_interval = report_interval
+
+        self.start = time.perf_counter()
+        self.neighbor_time = 0.0
+        self.scoring_time = 0.0
+        self.evaluations = 0
+
+        # 직전 snapshot 이후 구간의 통계
+        self._window_start = self.start
+        self._window_iterations = 0
+        self._window_accepted = 0
+        self._window_evaluations = 0
+
+    def record(
+        self,
+        iteration: int,
+        temperature: float,
+        current_score: float,
+        best_score: float,
+        accepted: bool,
+        neighbor_time: float = 0.0,
+        scoring_time: float = 0.0,
+        evaluations: int = 1,
+    ):
+        """
+        한 번의 반복 결과를 기록하고, report_interval 마다 snapshot 을 전달
+        iteration 은 이번 반복을 포함해 지금까지 수행한 반복 횟수
+        """
+        self.neighbor_time += neighbor_time
+        self.scoring_time += scoring_time
+        self.evaluations += evaluations
+        self._window_iterations += 1
+        self._window_accepted += accepted
+        self._window_evaluations += evaluations
+
+        if self._window_iterations >= self.report_interval:
+            self._report(iteration, temperature, current_score, best_score, False)
+
+    def finish(
+        self,
+        iteration: int,
+        temperature: float,
+        current_score: float,
+        best_score: float,
+    ):
+        """
+        탐색 종료 시점의 snapshot 을 전달
+        """
+        self._report(iteration, temperature, current_score, best_score, True)
+
+    def _report(self, iteration, temperature, current_score, best_score, final):
+        now = time.perf_counter()
+        window_time = now - self._window_start
+
+        self.callback(
+            {
+                "iteration": iteration,
+                "temperature": temperature,
+                "current_score": current_score,
+                "best_score": best_score,
+                "acceptance_rate": (
+                    self._window_accepted / self._window_iterations
+                    if self._window_iterations
+                    else 0.0
+                ),
+                "evals_per_sec": (
+                    self._window_evaluations / window_time if window_time > 0 else 0.0
+                ),
+                "neighbor_time": self.neighbor_time,
+                "scoring_time": self.scoring_time,
+                "elapsed": now - self.start,
+                "final": final,
+            }
+        )
+
+        self._window_start = now
+        self._window_iterations = 0
+        self._window_accepted = 0
+        self._window_evaluations = 0
+
+
+class ScoreTrace(list):
+    """
+    전달받은 snapshot 을 순서대로 쌓아두는 callback (수렴 여부 확인/튜닝용)
+
+    example:
+        trace = ScoreTrace()
+        simulated_annealing(initial_teams, waggings, callback=trace)
+        [snapshot["best_score"] for snapshot in trace]
+    """
+
+    def __call__(self, snapshot: dict):
+        self.append(snapshot)
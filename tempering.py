@@ -0,0 +1,200 @@
+import math
+
+import numpy as np
+
+from budget import SearchBudget
+from evaluator import IncrementalEvaluator, ReplicaScorer
+from moves import SwapMove, SwapSampler
+from problem import MatchingProblem, compile_problem
+from seeding import make_rng
+
+
+def _get_temperature_ladder(min_temp: float, max_temp: float, n_replicas: int):
+    """
+    min_temp 부터 max_temp 까지 등비로 증가하는 온도 목록을 반환
+    """
+    if n_replicas == 1:
+        return [min_temp]
+    ratio = (max_temp / min_temp) ** (1 / (n_replicas - 1))
+    return [min_temp * ratio**k for k in range(n_replicas)]
+
+
+def parallel_tempering(
+    initial_solution,
+    waggings=None,
+    min_temp=0.001,
+    max_temp=1.0,
+    n_replicas=8,
+    swap_interval=10,
+    candidates=4,
+    max_iterations=10000,
+    time_limit=None,
+    patience=None,
+    config=None,
+    seed=None,
+):
+    """
+    여러 온도의 복제본(replica)을 동시에 탐색하고, 이웃한 온도의 복제본끼리 주기적으로
+    상태를 교환하는 병렬 템퍼링(replica exchange) 탐색
+    simulated_annealing 과 입력/출력 형식이 같음
+
+    - 낮은 온도의 복제본은 좋은 해 주변을 세밀하게 탐색하고
+    - 높은 온도의 복제본은 나쁜 해도 채택하면서 지역 최적해에서 빠져나옴
+    - 교환을 통해 높은 온도에서 찾은 새로운 영역이 낮은 온도로 내려옴
+
+    모든 복제본은 하나의 문제 표현(MatchingProblem)을 공유하는 평가기로 한 프로세스에서 실행하고,
+    교환은 평가기를 복사하지 않고 온도 순서만 바꿔서 처리함
+    반복마다 모든 복제본의 교환 후보(복제본마다 candidates 개)를 ReplicaScorer 로 한 번에 계산하고,
+    복제본마다 가장 좋은 후보를 Metropolis 기준으로 채택함 (채택한 교환만 평가기에 적용)
+
+    input:
+        - initial_solution: 초기 팀 매칭 (team_list 형식)
+        - waggings: 꼬리흔들기 목록
+        - min_temp, max_temp: 가장 낮은/높은 복제본의 온도 (사이의 온도는 등비로 배치)
+        - n_replicas: 복제본 수
+        - swap_interval: 이웃 온도 간 교환을 시도하는 반복 간격 (1 이상)
+        - candidates: 반복마다 복제본 하나에서 평가할 교환 후보 수 (1 이면 일반적인 Metropolis 이동)
+        - max_iterations: 복제본마다 수행할 이동 횟수
+        - time_limit: 최대 실행 시간 (초), 넘으면 그때까지의 best 를 반환
+        - patience: best 가 이 횟수의 반복 동안 개선되지 않으면 조기 종료
+        - config: 매칭 설정 (MatchingConfig, 기본값: DEFAULT_CONFIG)
+        - seed: 난수 시드 (정수 | random.Random, seeding.make_rng 참고)
+
+    return:
+        - best_solution: 가장 좋은 팀 매칭 (team_list 형식)
+        - best_score: 가장 좋은 점수
+    """
+    budget = SearchBudget(time_limit, patience)
+
+    problem, assignment = compile_problem(initial_solution, waggings, config)
+    problem.constraints.check(assignment)
+    team_count = len(initial_solution)
+
+    best_assignment, best_score, _ = tempering_search(
+        problem,
+        assignment,
+        team_count,
+        budget,
+        min_temp=min_temp,
+        max_temp=max_temp,
+        n_replicas=n_replicas,
+        swap_interval=swap_interval,
+        candidates=candidates,
+        max_iterations=max_iterations,
+        rng=make_rng(seed),
+    )
+    return problem.to_team_list(best_assignment, team_count), best_score
+
+
+def tempering_search(
+    problem: MatchingProblem,
+    assignment: np.ndarray,
+    team_count: int,
+    budget: SearchBudget,
+    min_temp=0.001,
+    max_temp=1.0,
+    n_replicas=8,
+    swap_interval=10,
+    candidates=4,
+    max_iterations=10000,
+    rng=None,
+):
+    """
+    parallel_tempering 의 탐색 본체 (matching.SOLVERS 에 "tempering" 으로 등록되는 solver)
+    인자는 parallel_tempering 과 같고, 시드 대신 이 탐색 전용 난수 생성기 rng 를 받음
+
+    return:
+        - best_assignment: 가장 좋은 팀 번호 배열
+        - best_score: 가장 좋은 점수
+        - stats = {
+            "iterations": 10000,
+            "exchanges": 3120,
+            "evaluations": 320000,  # 점수를 계산한 교환 후보 수 (모든 복제본 합계)
+        }
+    """
+    if n_replicas < 1:
+        raise ValueError("복제본 수는 1 이상이어야 합니다.")
+    if swap_interval < 1:
+        raise ValueError("swap_interval 은 1 이상이어야 합니다.")
+    if candidates < 1:
+        raise ValueError("candidates 는 1 이상이어야 합니다.")
+
+    rng = make_rng(rng)
+    part_of = problem.part_code.tolist()
+
+    temperatures = _get_temperature_ladder(min_temp, max_temp, n_replicas)
+    # replicas[k] 는 temperatures[k] 온도에서 탐색 중인 평가기
+    replicas = [
+        IncrementalEvaluator(problem, assignment, team_count) for _ in range(n_replicas)
+    ]
+    # 복제본마다 팀 번호 목록을 공유하는 교환 샘플러 (교환 시 평가기와 함께 이동, 난수 생성기는 모두 공유)
+    samplers = {
+        id(evaluator): SwapSampler(part_of, evaluator.team_of, rng, problem.constraints)
+        for evaluator in replicas
+    }
+    # 복제본의 교환 후보를 한 번에 계산 (평가기의 배열 사본을 이어 붙인 배열로 공유)
+    scorer = ReplicaScorer(replicas)
+
+    best_assignment = replicas[0].snapshot()
+    best_score = replicas[0].score
+
+    iteration = 0
+    exchanges = 0
+    evaluations = 0
+    while iteration < max_iterations:
+        if budget.exhausted(iteration):
+            break
+
+        # 1) 모든 복제본의 교환 후보를 뽑아서 점수를 한 번에 계산
+        replica, idx_a, idx_b = [], [], []
+        blocks = []  # (평가기, 온도, 후보 구간)
+        for evaluator, T in zip(replicas, temperatures):
+            sampler = samplers[id(evaluator)]
+            start = len(idx_a)
+            for _ in range(candidates):
+                swap = sampler.sample()
+                if swap is not None:
+                    replica.append(scorer.replica_of[id(evaluator)])
+                    idx_a.append(swap[0])
+                    idx_b.append(swap[1])
+            if len(idx_a) > start:
+                blocks.append((evaluator, T, start, len(idx_a)))
+
+        # 2) 온도마다 가장 좋은 후보를 Metropolis 기준으로 채택
+        if blocks:
+            scores = scorer.swap_scores(replica, idx_a, idx_b).tolist()
+            evaluations += len(scores)
+        for evaluator, T, start, end in blocks:
+            best = min(range(start, end), key=scores.__getitem__)
+            delta = scores[best] - evaluator.score
+            if delta < 0 or rng.random() < math.exp(-delta / T):
+                SwapMove(
+                    evaluator,
+                    evaluator.position(idx_a[best]),
+                    evaluator.position(idx_b[best]),
+                    samplers[id(evaluator)],
+                ).apply()
+                if evaluator.score < best_score:
+                    best_assignment = evaluator.snapshot()
+                    best_score = evaluator.score
+                    budget.improved(iteration, best_score)
+
+        # 3) 이웃한 온도끼리 상태 교환 (짝수/홀수 쌍을 번갈아 시도)
+        if (iteration + 1) % swap_interval == 0:
+            start = (iteration // swap_interval) % 2
+            for k in range(start, n_replicas - 1, 2):
+                cold, hot = replicas[k], replicas[k + 1]
+                exponent = (1 / temperatures[k] - 1 / temperatures[k + 1]) * (
+                    cold.score - hot.score
+                )
+                if exponent >= 0 or rng.random() < math.exp(exponent):
+                    replicas[k], replicas[k + 1] = hot, cold
+                    exchanges += 1
+
+        iteration += 1
+
+    return (
+        best_assignment,
+        best_score,
+        {"iterations": iteration, "exchanges": exchanges, "evaluations": evaluations},
+    )
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from matching import (
+    initial_team_assignment,
+    resume_simulated_annealing,
+    simulated_annealing,
+)
+from parameter import DEFAULT_CONFIG
+from synthetic import generate_cohort
+
+
+def _team_ids(team_list):
+    return [[member["id"] for member in team] for team in team_list]
+
+
+@pytest.mark.parametrize("lns_interval", [0, 50])
+def test_resume_matches_uninterrupted_run(tmp_path, lns_interval):
+    participant_list, waggings = generate_cohort(300, seed=2)
+    config = DEFAULT_CONFIG.replace(team_count=50)
+    initial_teams = initial_team_assignment(
+        participant_list, waggings, method="random", config=config, seed=5
+    )
+    options = dict(
+        cooling_rate=0.9995,
+        lns_interval=lns_interval,
+        lns_teams=4,
+        lns_size=20,
+        patience=2500,
+        config=config,
+        seed=7,
+    )
+    full_teams, full_score = simulated_annealing(
+        initial_teams, waggings, max_iterations=6000, **options
+    )
+
+    # 중간에 멈춘 실행의 체크포인트에서 이어서 실행하면 중단 없이 실행한 결과와 같아야 함
+    path = tmp_path / "run.ckpt"
+    simulated_annealing(
+        initial_teams,
+        waggings,
+        max_iterations=3500,
+        checkpoint_path=str(path),
+        checkpoint_interval=700,
+        **options,
+    )
+    random.seed(123)  # 전역 난수 상태와 참가자 순서에 영향을 받지 않아야 함
+    resumed_teams, resumed_score = resume_simulated_annealing(
+        str(path),
+        list(reversed(participant_list)),
+        waggings,
+        max_iterations=6000,
+        patience=2500,
+        config=config,
+    )
+
+    assert resumed_score == full_score
+    assert _team_ids(resumed_teams) == _team_ids(full_teams)
+
+
+def test_resume_rejects_unknown_participants(tmp_path):
+    participant_list, waggings = generate_cohort(60, seed=1)
+    config = DEFAULT_CONFIG.replace(team_count=10)
+    initial_teams = initial_team_assignment(
+        participant_list, waggings, config=config, seed=1
+    )
+    path = tmp_path / "run.ckpt"
+    simulated_annealing(
+        initial_teams,
+        waggings,
+        max_iterations=200,
+        checkpoint_path=str(path),
+        checkpoint_interval=100,
+        config=config,
+        seed=1,
+    )
+
+    with pytest.raises(ValueError):
+        resume_simulated_annealing(
+            str(path), participant_list[1:], waggings, config=config
+        )
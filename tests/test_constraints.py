@@ -0,0 +1,200 @@
+import random
+
+import pytest
+
+from constraints import ConstraintIndex
+from decomposition import decomposed_solve
+from evaluator import IncrementalEvaluator
+from matching import evaluate_solution, initial_team_assignment, solve
+from moves import MOVE_OPERATORS, SwapSampler
+from parameter import DEFAULT_CONFIG
+from problem import compile_problem
+from repair import repair_matching
+from synthetic import generate_cohort
+
+
+@pytest.fixture(scope="module")
+def cohort():
+    participant_list, waggings = generate_cohort(300, seed=3)
+    ids = [participant["id"] for participant in participant_list]
+    random.Random(5).shuffle(ids)
+    together = [ids[0:2], ids[2:5], ids[5:7], ids[7:9]]
+    apart = [ids[9:13], [ids[0], ids[20]], [ids[2], ids[21], ids[22]]] + [
+        [ids[k], ids[k + 1]] for k in range(30, 90, 2)
+    ]
+    config = DEFAULT_CONFIG.replace(team_count=50, together=together, apart=apart)
+    return participant_list, waggings, config
+
+
+def _violations(team_list, waggings, config):
+    problem, assignment = compile_problem(team_list, waggings, config)
+    return problem.constraints.violations(assignment.tolist())
+
+
+def test_conflicting_constraints_are_rejected():
+    with pytest.raises(ValueError):
+        ConstraintIndex([[1, 2], [2, 3]], [[1, 3]], [1, 2, 3, 4])
+
+
+@pytest.mark.parametrize("method", ["random", "greedy"])
+def test_initial_assignment_respects_constraints(cohort, method):
+    participant_list, waggings, config = cohort
+    for seed in range(3):
+        team_list = initial_team_assignment(
+            participant_list, waggings, method=method, config=config, seed=seed
+        )
+        assert sorted(member["id"] for team in team_list for member in team) == sorted(
+            participant["id"] for participant in participant_list
+        )
+        assert _violations(team_list, waggings, config) == []
+
+
+def test_feasible_swap_matches_brute_force(cohort):
+    participant_list, waggings, config = cohort
+    team_list = initial_team_assignment(
+        participant_list, waggings, method="greedy", config=config, seed=1
+    )
+    problem, assignment = compile_problem(team_list, waggings, config)
+    evaluator = IncrementalEvaluator(problem, assignment, len(team_list))
+    sampler = SwapSampler(
+        problem.part_code.tolist(), evaluator.team_of, 1, problem.constraints
+    )
+
+    rng = random.Random(0)
+    for _ in range(2000):
+        a, b = rng.randrange(len(problem)), rng.randrange(len(problem))
+        if evaluator.team_of[a] == evaluator.team_of[b]:
+            continue
+        team_of = list(evaluator.team_of)
+        team_of[a], team_of[b] = team_of[b], team_of[a]
+        expected = not [
+            violation
+            for violation in problem.constraints.violations(team_of)
+            if violation[0] == "apart"
+        ]
+        assert sampler.feasible_swap(a, b) == expected
+
+
+def test_move_operators_keep_constraints_and_masks(cohort):
+    participant_list, waggings, config = cohort
+    team_list = initial_team_assignment(
+        participant_list, waggings, method="greedy", config=config, seed=1
+    )
+    problem, assignment = compile_problem(team_list, waggings, config)
+    evaluator = IncrementalEvaluator(problem, assignment, len(team_list))
+    sampler = SwapSampler(
+        problem.part_code.tolist(), evaluator.team_of, 1, problem.constraints
+    )
+
+    for name, operator in MOVE_OPERATORS.items():
+        for iteration in range(500):
+            move = operator(evaluator, sampler)
+            if move is None:
+                continue
+            move.apply()
+            if iteration % 2:
+                move.undo()
+            assert problem.constraints.violations(evaluator.team_of) == [], name
+            assert sampler.team_mask == problem.constraints.team_masks(
+                evaluator.team_of, len(team_list)
+            ), name
+
+
+@pytest.mark.parametrize(
+    "solver, options",
+    [
+        ("annealing", {"max_iterations": 3000}),
+        ("annealing", {"max_iterations": 3000, "lns_interval": 100}),
+        ("annealing", {"max_iterations": 3000, "move_operators": list(MOVE_OPERATORS)}),
+        ("batched_annealing", {"max_iterations": 500}),
+        ("tempering", {"max_iterations": 500}),
+        ("tabu", {"max_iterations": 300}),
+    ],
+)
+def test_solvers_respect_constraints(cohort, solver, options):
+    participant_list, waggings, config = cohort
+    team_list = initial_team_assignment(
+        participant_list, waggings, method="greedy", config=config, seed=1
+    )
+    best_teams, best_score, _ = solve(
+        team_list, waggings, solver=solver, config=config, seed=2, **options
+    )
+    assert _violations(best_teams, waggings, config) == []
+    assert best_score == pytest.approx(
+        evaluate_solution(best_teams, waggings, config), abs=1e-6
+    )
+
+
+def test_genetic_rejects_constraints(cohort):
+    participant_list, waggings, config = cohort
+    team_list = initial_team_assignment(
+        participant_list, waggings, method="greedy", config=config, seed=1
+    )
+    with pytest.raises(ValueError):
+        solve(team_list, waggings, solver="genetic", config=config, seed=2)
+
+
+def test_solve_rejects_infeasible_initial_solution(cohort):
+    participant_list, waggings, config = cohort
+    team_list = initial_team_assignment(
+        participant_list, waggings, config=config.replace(together=None, apart=None)
+    )
+    with pytest.raises(ValueError):
+        solve(team_list, waggings, config=config, max_iterations=10)
+
+
+def test_decomposed_solve_respects_apart(cohort):
+    participant_list, waggings, config = cohort
+    config = config.replace(together=None)
+    team_list, _, _ = decomposed_solve(
+        participant_list,
+        waggings,
+        cluster_teams=10,
+        config=config,
+        seed=1,
+        max_workers=1,
+        max_iterations=1000,
+    )
+    assert _violations(team_list, waggings, config) == []
+
+    with pytest.raises(ValueError):
+        decomposed_solve(
+            participant_list,
+            waggings,
+            config=config.replace(together=[[1, 2]]),
+            max_workers=1,
+        )
+
+
+def test_repair_respects_constraints(cohort):
+    participant_list, waggings, config = cohort
+    base_config = config.replace(together=None, apart=None)
+    team_list = initial_team_assignment(
+        participant_list, waggings, method="greedy", config=base_config, seed=1
+    )
+
+    # 기존 매칭이 어기는 제약 (다른 팀의 묶음, 같은 팀의 쌍) + 합류한 참가자가 포함된 묶음
+    ids = [participant["id"] for participant in participant_list]
+    random.Random(2).shuffle(ids)
+    joined = [
+        dict(participant_list[0], id=10001),
+        dict(participant_list[5], id=10002),
+    ]
+    config = base_config.replace(
+        together=[ids[0:3], ids[3:5], [10001, ids[3]]],
+        apart=[[team[0]["id"], team[1]["id"]] for team in team_list[:5]]
+        + [[ids[0], ids[10]]],
+    )
+    for seed in range(3):
+        new_team_list, score, _ = repair_matching(
+            team_list,
+            waggings,
+            joined=joined,
+            left=ids[50:52],
+            config=config,
+            seed=seed,
+        )
+        assert _violations(new_team_list, waggings, config) == []
+        assert score == pytest.approx(
+            evaluate_solution(new_team_list, waggings, config), abs=1e-6
+        )
@@ -0,0 +1,93 @@
+import pytest
+
+from decomposition import _solve_cluster, partition_participants
+from matching import _get_team_template, evaluate_solution
+from parameter import DEFAULT_CONFIG
+from problem import MatchingProblem, compile_problem
+from synthetic import generate_cohort
+
+
+@pytest.fixture(scope="module")
+def cohort():
+    participant_list, waggings = generate_cohort(2000, seed=4)
+    return participant_list, waggings, 330
+
+
+def _cut(clusters, waggings):
+    cluster_of_id = {
+        member["id"]: cluster_id
+        for cluster_id, (members, _) in enumerate(clusters)
+        for member in members
+    }
+    return sum(
+        cluster_of_id[wagging["wagger"]] != cluster_of_id[wagging["waggee"]]
+        for wagging in waggings
+    )
+
+
+def test_partition_keeps_part_quotas(cohort):
+    participant_list, waggings, team_count = cohort
+    clusters = partition_participants(
+        participant_list, waggings, team_count, cluster_teams=16
+    )
+
+    assert sum(len(members) for members, _ in clusters) == len(participant_list)
+    assert sum(cluster_team_count for _, cluster_team_count in clusters) == team_count
+    for members, cluster_team_count in clusters:
+        # 클러스터 안에서 다시 팀을 나누어도 파트별 최소 인원수를 만족해야 함
+        assert _get_team_template(members, cluster_team_count, DEFAULT_CONFIG)
+
+
+def test_partition_refinement_reduces_cut(cohort):
+    participant_list, waggings, team_count = cohort
+    unrefined = partition_participants(
+        participant_list, waggings, team_count, cluster_teams=16, refine_rounds=0
+    )
+    refined = partition_participants(
+        participant_list, waggings, team_count, cluster_teams=16
+    )
+
+    for (before, count_before), (after, count_after) in zip(unrefined, refined):
+        assert count_before == count_after
+        assert sorted(member["part"] for member in before) == sorted(
+            member["part"] for member in after
+        )
+    assert _cut(refined, waggings) < 0.9 * _cut(unrefined, waggings)
+
+
+def test_cluster_score_uses_global_category_weight(cohort):
+    participant_list, waggings, team_count = cohort
+    members, cluster_team_count = partition_participants(
+        participant_list, waggings, team_count, cluster_teams=16
+    )[0]
+    member_ids = {member["id"] for member in members}
+    cluster_waggings = [
+        wagging
+        for wagging in waggings
+        if wagging["wagger"] in member_ids and wagging["waggee"] in member_ids
+    ]
+    category_weight = MatchingProblem(participant_list).category_weight
+
+    result = _solve_cluster(
+        0,
+        1,
+        members,
+        cluster_waggings,
+        cluster_team_count,
+        "greedy",
+        "annealing",
+        {"max_iterations": 500},
+        DEFAULT_CONFIG,
+        category_weight,
+    )
+
+    by_id = {member["id"]: member for member in members}
+    team_list = [
+        [by_id[member_id] for member_id in team] for team in result["team_ids"]
+    ]
+    problem, _ = compile_problem(
+        team_list, cluster_waggings, category_weight=category_weight
+    )
+    assert result["score"] == pytest.approx(
+        evaluate_solution(team_list, problem=problem)
+    )
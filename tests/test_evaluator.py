@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+
+from category import get_category_score
+from evaluator import (
+    IncrementalEvaluator,
+    ReplicaScorer,
+    _combine_score,
+    evaluate_assignment,
+)
+from matching import evaluate_solution, initial_team_assignment
+from parameter import DEFAULT_CONFIG
+from problem import compile_problem
+from synthetic import generate_cohort
+from wagging import get_wagging_score
+
+
+def _baseline_score(team_list, waggings, config):
+    """
+    category.py / wagging.py 의 기존 함수로 계산한 점수 (배열 연산을 사용하지 않는 기준 구현)
+    """
+    category_scores = get_category_score(team_list, config=config)
+    category_mean = sum(category_scores) / len(category_scores)
+    category_variance = sum(
+        (score - category_mean) ** 2 for score in category_scores
+    ) / len(category_scores)
+
+    wagging_scores, _ = get_wagging_score(team_list, waggings)
+    wagging_mean = sum(wagging_scores) / len(wagging_scores)
+    wagging_variance = sum(
+        (score - wagging_mean) ** 2 for score in wagging_scores
+    ) / len(wagging_scores)
+
+    return _combine_score(
+        category_mean,
+        category_variance,
+        wagging_mean,
+        wagging_variance,
+        wagging_scores.count(0),
+    )
+
+
+@pytest.fixture(scope="module")
+def large_cohort():
+    participant_list, waggings = generate_cohort(2000, seed=2)
+    config = DEFAULT_CONFIG.replace(team_count=300)
+    team_list = initial_team_assignment(
+        participant_list, waggings, method="greedy", config=config, seed=2
+    )
+    return team_list, waggings, config
+
+
+@pytest.mark.parametrize("exact_scoring", [False, True])
+def test_evaluator_paths_agree_on_large_cohort(large_cohort, exact_scoring):
+    team_list, waggings, config = large_cohort
+    config = config.replace(exact_scoring=exact_scoring)
+    problem, assignment = compile_problem(team_list, waggings, config)
+    evaluator = IncrementalEvaluator(problem, assignment, len(team_list))
+
+    # 팀별 카테고리 점수는 반올림까지 같아야 함
+    category_scores = get_category_score(team_list, config=config)
+    assert evaluator.category_scores == pytest.approx(category_scores, abs=1e-9)
+
+    baseline = _baseline_score(team_list, waggings, config)
+    assert evaluator.score == pytest.approx(baseline, abs=1e-6)
+    assert evaluate_assignment(problem, assignment, len(team_list)) == pytest.approx(
+        baseline, abs=1e-6
+    )
+
+
+@pytest.mark.parametrize("exact_scoring", [False, True])
+def test_swap_scores_match_apply_swap(large_cohort, exact_scoring):
+    team_list, waggings, config = large_cohort
+    config = config.replace(exact_scoring=exact_scoring)
+    problem, assignment = compile_problem(team_list, waggings, config)
+    evaluator = IncrementalEvaluator(problem, assignment, len(team_list))
+
+    # 같은 파트끼리의 교환 후보 (같은 팀 쌍 포함)
+    rng = np.random.default_rng(0)
+    part_code = problem.part_code
+    idx_a = rng.integers(len(problem), size=400)
+    idx_b = np.array(
+        [rng.choice(np.flatnonzero(part_code == part_code[idx])) for idx in idx_a]
+    )
+    scores = evaluator.swap_scores(idx_a, idx_b)
+
+    for k, (a, b) in enumerate(zip(idx_a.tolist(), idx_b.tolist())):
+        if evaluator.team_of[a] == evaluator.team_of[b]:
+            assert scores[k] == np.inf
+            continue
+        undo = evaluator.apply_swap(evaluator.position(a), evaluator.position(b))
+        assert scores[k] == pytest.approx(evaluator.score, abs=1e-6)
+        evaluator.revert(undo)
+
+
+@pytest.mark.parametrize("exact_scoring", [False, True])
+def test_evaluate_solution_matches_baseline(large_cohort, exact_scoring):
+    team_list, waggings, config = large_cohort
+    config = config.replace(exact_scoring=exact_scoring)
+    baseline = _baseline_score(team_list, waggings, config)
+
+    assert evaluate_solution(team_list, waggings, config) == pytest.approx(
+        baseline, abs=1e-6
+    )
+    # 미리 만든 문제 표현을 전달해도 같은 점수
+    problem, _ = compile_problem(team_list, waggings, config)
+    assert evaluate_solution(team_list, problem=problem) == pytest.approx(
+        baseline, abs=1e-6
+    )
+
+
+def test_replica_scorer_matches_each_evaluator(large_cohort):
+    team_list, waggings, config = large_cohort
+    problem, assignment = compile_problem(team_list, waggings, config)
+    evaluators = [
+        IncrementalEvaluator(problem, assignment, len(team_list)) for _ in range(3)
+    ]
+    scorer = ReplicaScorer(evaluators)
+
+    # 복제본마다 다른 교환을 적용해서 서로 다른 상태로 만든 뒤 비교 (교환은 이어 붙인 배열에도 반영됨)
+    rng = np.random.default_rng(1)
+    part_code = problem.part_code
+
+    def sample(count):
+        idx_a = rng.integers(len(problem), size=count)
+        idx_b = np.array(
+            [rng.choice(np.flatnonzero(part_code == part_code[idx])) for idx in idx_a]
+        )
+        return idx_a, idx_b
+
+    for replica, evaluator in enumerate(evaluators):
+        for a, b in zip(*sample(50 * (replica + 1))):
+            if evaluator.team_of[a] != evaluator.team_of[b]:
+                evaluator.apply_swap(evaluator.position(a), evaluator.position(b))
+
+    idx_a, idx_b = sample(300)
+    replica = rng.integers(len(evaluators), size=300)
+    scores = scorer.swap_scores(replica, idx_a, idx_b)
+    for r, evaluator in enumerate(evaluators):
+        mask = replica == r
+        np.testing.assert_allclose(
+            scores[mask], evaluator.swap_scores(idx_a[mask], idx_b[mask]), atol=1e-9
+        )
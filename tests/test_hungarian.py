@@ -0,0 +1,41 @@
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from hungarian import linear_sum_assignment
+
+
+def _brute_force(cost):
+    # 행이 열보다 적거나 같은 경우, 행마다 서로 다른 열을 고르는 모든 경우 중 최소 비용
+    n, m = cost.shape
+    return min(
+        cost[np.arange(n), list(cols)].sum() for cols in permutations(range(m), n)
+    )
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (3, 3), (4, 6), (6, 4), (6, 6), (5, 7)])
+def test_matches_brute_force(shape):
+    rng = np.random.default_rng(sum(shape))
+    for trial in range(20):
+        # 정수 비용(동점이 많은 경우)과 실수 비용을 번갈아 확인
+        if trial % 2:
+            cost = rng.random(shape) * 10 - 5
+        else:
+            cost = rng.integers(0, 4, size=shape).astype(float)
+
+        row_ind, col_ind = linear_sum_assignment(cost)
+
+        assert len(row_ind) == min(shape)
+        assert list(row_ind) == sorted(row_ind)
+        assert len(set(row_ind)) == len(row_ind)
+        assert len(set(col_ind)) == len(col_ind)
+        expected = _brute_force(cost if shape[0] <= shape[1] else cost.T)
+        assert cost[row_ind, col_ind].sum() == pytest.approx(expected)
+
+
+def test_rejects_invalid_cost():
+    with pytest.raises(ValueError):
+        linear_sum_assignment(np.zeros(3))
+    with pytest.raises(ValueError):
+        linear_sum_assignment(np.array([[0.0, np.inf], [1.0, 2.0]]))
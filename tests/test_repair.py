@@ -0,0 +1,79 @@
+import pytest
+
+from matching import _get_team_template, evaluate_solution, initial_team_assignment
+from parameter import DEFAULT_CONFIG
+from repair import repair_matching
+from synthetic import generate_cohort
+
+
+@pytest.fixture(scope="module")
+def cohort():
+    participant_list, waggings = generate_cohort(420, seed=6)
+    config = DEFAULT_CONFIG.replace(team_count=70)
+    team_list = initial_team_assignment(
+        participant_list, waggings, method="greedy", config=config, seed=1
+    )
+    return participant_list, waggings, config, team_list
+
+
+def _part_rows(team_list, parts):
+    return sorted(
+        tuple(sum(member["part"] == part for member in team) for part in parts)
+        for team in team_list
+    )
+
+
+def _template_rows(team_template, parts):
+    return sorted(tuple(row[part] for part in parts) for row in team_template)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_repair_keeps_template_quotas(cohort, seed):
+    participant_list, waggings, config, team_list = cohort
+    by_part = {part: [] for part in config.parts}
+    for participant in participant_list:
+        by_part[participant["part"]].append(participant)
+
+    # 파트별 인원이 바뀌는 변경: be / fe 이탈, de / pm 합류, fe -> be 파트 변경
+    left = [member["id"] for member in by_part["be"][:4] + by_part["fe"][:3]]
+    joined = [dict(by_part["de"][k], id=10000 + k) for k in range(3)] + [
+        dict(by_part["pm"][0], id=10100)
+    ]
+    changed = [dict(member, part="be") for member in by_part["fe"][10:13]]
+
+    new_team_list, score, stats = repair_matching(
+        team_list,
+        waggings,
+        joined=joined,
+        left=left,
+        changed=changed,
+        config=config,
+        seed=seed,
+    )
+
+    remaining = [
+        participant
+        for participant in participant_list
+        if participant["id"] not in set(left)
+    ]
+    changed_by_id = {member["id"]: member for member in changed}
+    expected = [changed_by_id.get(p["id"], p) for p in remaining] + joined
+    team_template = _get_team_template(expected, len(team_list), config)
+
+    # 모든 참가자가 정확히 한 번씩 배정되고, 팀별 파트 인원수는 새 템플릿과 같음
+    assert sorted(member["id"] for team in new_team_list for member in team) == sorted(
+        participant["id"] for participant in expected
+    )
+    assert _part_rows(new_team_list, config.parts) == _template_rows(
+        team_template, config.parts
+    )
+    assert all(
+        sum(member["part"] == part for member in team) >= min_cnt
+        for team in new_team_list
+        for part, min_cnt in config.part_min.items()
+    )
+    assert score == pytest.approx(
+        evaluate_solution(new_team_list, waggings, config), abs=1e-6
+    )
+    # 변경과 관계없는 참가자는 대부분 기존 팀에 남음
+    assert stats["moved"] < len(expected) // 10
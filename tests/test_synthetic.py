@@ -0,0 +1,20 @@
+from benchmark import _get_team_count
+from parameter import DEFAULT_CONFIG
+from synthetic import generate_participants
+
+
+def test_default_part_ratio_generates_every_part():
+    participant_list = generate_participants(700, seed=0)
+    part_count = {part: 0 for part in DEFAULT_CONFIG.parts}
+    for participant in participant_list:
+        part_count[participant["part"]] += 1
+
+    # 최소 인원수가 0 인 pm 도 생성되고, 파트별 최소 인원수 비율로는 모든 팀을 채울 수 있음
+    assert all(count > 0 for count in part_count.values())
+    assert _get_team_count(participant_list, 6) == 700 // 6
+
+
+def test_team_count_without_part_minimum():
+    config = DEFAULT_CONFIG.replace(part_min={"pm": 0, "de": 0, "fe": 0, "be": 0})
+    participant_list = generate_participants(100, seed=0, config=config)
+    assert _get_team_count(participant_list, 6, config) == 100 // 6
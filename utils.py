@@ -1,16 +1,20 @@
 import random
 import math
 
+from parameter import DEFAULT_CONFIG, MatchingConfig
 
-# 향후 변수로 입력받을 값 (현재는 상수)
-TEAM_COUNT = 5  # 생성할 팀의 개수
-PART_MIN = {"pm": 0, "de": 1, "fe": 2, "be": 2}  # 파트별 최소 인원수
 
-
-def get_team_size(participant_list: list[dict]) -> dict[str, int] | dict:
-    """ """
+def get_team_size(
+    participant_list: list[dict], config: MatchingConfig = None
+) -> dict[str, int] | dict:
+    """
+    팀 개수(config.team_count)와 파트별 최소 인원수(config.part_min)로 팀별 파트 인원수를 반환
+    (설정값은 parameter.MatchingConfig 를 사용, 기본값: DEFAULT_CONFIG)
+    """
+    config = config or DEFAULT_CONFIG
+    team_count = config.team_count
     part_total = {
-        role: 0 for role in PART_MIN.keys()
+        role: 0 for role in config.part_min.keys()
     }  # 팀 매칭 참여자들의 파트별 인원수 통계값
     for participant in participant_list:
         if participant.get("part") not in part_total:
@@ -20,28 +24,28 @@ def get_team_size(participant_list: list[dict]) -> dict[str, int] | dict:
             continue
         part_total[participant["part"]] += 1
 
-    # TEAM_COUNT 만큼의 팀을 생성할 수 있는지 여부 판단
+    # team_count 만큼의 팀을 생성할 수 있는지 여부 판단
     team_max = min(
         (part_total[part] // min_cnt) if min_cnt > 0 else float("inf")
-        for part, min_cnt in PART_MIN.items()
+        for part, min_cnt in config.part_min.items()
     )
-    if TEAM_COUNT > team_max:
+    if team_count > team_max:
         print("설정한 팀의 개수만큼 팀을 생성할 수 없습니다.")
         return {}
 
     team_size = [
-        {part: part_total[part] // TEAM_COUNT for part in part_total.keys()}
-        for _ in range(TEAM_COUNT)
+        {part: part_total[part] // team_count for part in part_total.keys()}
+        for _ in range(team_count)
     ]
 
     # 파트별로 남은 인원 분배
-    leftovers = {part: part_total[part] % TEAM_COUNT for part in part_total.keys()}
+    leftovers = {part: part_total[part] % team_count for part in part_total.keys()}
     team_idx = 0
 
     for part, left_count in leftovers.items():
         for _ in range(left_count):
             team_size[team_idx][part] += 1
-            team_idx = (team_idx + 1) % TEAM_COUNT
+            team_idx = (team_idx + 1) % team_count
 
     return team_size
 
@@ -103,6 +107,7 @@ def evaluate_solution(
     w_e=1.0,
     w_c=2.0,
     w_wagging=3.0,
+    config: MatchingConfig = None,
 ):
     """
     최종적으로 반환해야 하는 값:
@@ -114,6 +119,7 @@ def evaluate_solution(
     - 각 팀의 성격 유형 통계를 정리한 뒤, LLM에게 설명을 맡김
     """
 
+    config = config or DEFAULT_CONFIG
     wagging_dict: dict[int, set] = _get_wagging_dict(waggings)
 
     for team in teams:
@@ -122,7 +128,7 @@ def evaluate_solution(
         n_list = []
         e_list = []
         c_list = []
-        for part in PART_MIN.keys():
+        for part in config.parts:
             team_members.extend(team[part])
 
         team_members_id = set([member["id"] for member in team_members])
@@ -183,17 +189,19 @@ def evaluate_solution(
     return score
 
 
-def neighbor_solution(teams):
+def neighbor_solution(teams, config: MatchingConfig = None):
+    config = config or DEFAULT_CONFIG
+
     # 깊은 복사로 원본 teams 훼손 방지
     new_teams = []
     for team in teams:
         copied_team = {"id": team["id"]}
-        for part in PART_MIN.keys():
+        for part in config.parts:
             copied_team[part] = [p.copy() for p in team[part]]
         new_teams.append(copied_team)
 
     # 랜덤 파트 선택
-    part = random.choice(list(PART_MIN.keys()))
+    part = random.choice(config.parts)
 
     # 선택한 파트의 전체 사람 목록과 그들의 팀 인덱스 수집
     people = []
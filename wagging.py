@@ -1,35 +1,132 @@
-def _get_wagging_dict(waggings: list[dict]) -> dict[set]:
+import numpy as np
+
+from parameter import DEFAULT_CONFIG, MatchingConfig
+
+
+class WaggingIndex:
     """
-    Wagging 테이블 데이터를 받아서 {꼬리 흔들기 주체: [꼬리를 흔든 대상 리스트]} 형식으로 변환
+    꼬리흔들기 테이블을 참가자 번호 기준의 CSR 인접 구조로 한 번만 변환해 둔 인덱스
+    평가할 때마다 wagging_dict 를 다시 만들지 않고 배열 조회로 적중 횟수를 계산함
+
+    - ids: 참가자 번호 순서의 참가자 id 배열
+    - index: 참가자 id -> 참가자 번호
+    - indptr, indices: i 번 참가자가 꼬리를 흔든 대상은 indices[indptr[i]:indptr[i + 1]]
+    - edge_src: 간선별 꼬리흔들기 주체 (indices 와 같은 순서)
+    - mutual: 간선별 상호 꼬리흔들기 여부 (대상도 주체에게 꼬리를 흔든 경우 True)
+    - out_degree: 참가자별 꼬리를 흔든 대상의 수
+    - in_indptr, in_indices: 반대 방향 CSR (i 번 참가자에게 꼬리를 흔든 참가자 목록)
 
     input:
-    - waggings = [
-        {
-            "id": 1,
-            "wagger": 1,
-            "waggee": 3
-        },
-        {wagging info},
-        {wagging info}
-    ]
+        - waggings = [
+            {
+                "id": 1,
+                "wagger": 1,
+                "waggee": 3
+            },
+            {wagging info},
+            {wagging info}
+        ]
 
-    return:
-        - wagging_dict = {
-            wagger_id1: {1, 3, 4, },
-            wagger_id2: {2, 5, 7, }
+        - participant_ids = [1, 2, 3, ...] 참가자 번호 순서의 참가자 id 목록
+    """
+
+    def __init__(self, waggings: list[dict], participant_ids: list[int]):
+        self.ids = np.asarray(participant_ids)
+        self.index = {
+            participant_id: idx for idx, participant_id in enumerate(participant_ids)
         }
+        participant_count = len(self.index)
+
+        # 참가자 목록에 없는 id 와 중복된 꼬리흔들기는 제외
+        edges = {
+            (self.index[wagging["wagger"]], self.index[wagging["waggee"]])
+            for wagging in waggings or []
+            if wagging["wagger"] in self.index and wagging["waggee"] in self.index
+        }
+        edges = np.array(sorted(edges), dtype=np.int64).reshape(-1, 2)
+        src, dst = edges[:, 0], edges[:, 1]
+
+        self.out_degree = np.bincount(src, minlength=participant_count)
+        self.indptr = np.zeros(participant_count + 1, dtype=np.int64)
+        np.cumsum(self.out_degree, out=self.indptr[1:])
+        self.indices = dst
+        self.edge_src = src
+
+        # 간선 (a, b) 가 상호 꼬리흔들기인지는 (b, a) 간선의 존재 여부로 판단
+        keys = src * participant_count + dst  # 정렬된 상태
+        reverse_keys = dst * participant_count + src
+        found = np.searchsorted(keys, reverse_keys)
+        found[found == len(keys)] = 0
+        self.mutual = (
+            keys[found] == reverse_keys if len(keys) else np.zeros(0, dtype=bool)
+        )
+
+        order = np.argsort(dst, kind="stable")
+        self.in_indptr = np.zeros(participant_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(dst, minlength=participant_count), out=self.in_indptr[1:])
+        self.in_indices = src[order]
+        self._adjacency_lists = None
+
+    def __len__(self) -> int:
+        return len(self.out_degree)
+
+    def waggees(self, idx: int) -> np.ndarray:
+        """
+        idx 번 참가자가 꼬리를 흔든 대상의 참가자 번호 배열
+        """
+        return self.indices[self.indptr[idx] : self.indptr[idx + 1]]
+
+    def waggers(self, idx: int) -> np.ndarray:
+        """
+        idx 번 참가자에게 꼬리를 흔든 참가자 번호 배열
+        """
+        return self.in_indices[self.in_indptr[idx] : self.in_indptr[idx + 1]]
+
+    def adjacency_lists(self) -> tuple[list[list[int]]]:
+        """
+        참가자별 꼬리흔들기 대상/주체 목록을 파이썬 리스트로 반환 (처음 호출 시 한 번만 생성)
+        스왑 한 번에 몇 개의 값만 조회하는 경우 배열보다 리스트 조회가 빠름
+
+        return:
+            - waggees = [[3, 7], [], ...] (waggees[i]: i 번 참가자가 꼬리를 흔든 대상)
+            - waggers = [[5], [0, 2], ...] (waggers[i]: i 번 참가자에게 꼬리를 흔든 참가자)
+        """
+        if self._adjacency_lists is None:
+            indptr, indices = self.indptr.tolist(), self.indices.tolist()
+            in_indptr, in_indices = self.in_indptr.tolist(), self.in_indices.tolist()
+            self._adjacency_lists = (
+                [indices[indptr[i] : indptr[i + 1]] for i in range(len(self))],
+                [in_indices[in_indptr[i] : in_indptr[i + 1]] for i in range(len(self))],
+            )
+        return self._adjacency_lists
+
+    def count_hits(self, assignment: np.ndarray) -> np.ndarray:
+        """
+        참가자별로 같은 팀에 속한 꼬리흔들기 대상의 수를 반환
+
+        input:
+            - assignment: 참가자 번호 순서의 팀 번호 배열
+
+        return:
+            - hits = [2, 0, 1, ...] shape (N,)
+        """
+        assignment = np.asarray(assignment)
+        same_team = assignment[self.edge_src] == assignment[self.indices]
+        return np.bincount(self.edge_src[same_team], minlength=len(self))
+
+
+def compile_wagging_index(
+    waggings: list[dict], participant_ids: list[int]
+) -> WaggingIndex:
     """
-    wagging_dict: dict[int, set] = {}  # {wagger_id: (꼬리를 흔든 사람 목록)}
-    for wagging in waggings:
-        wagger, waggee = wagging["wagger"], wagging["waggee"]
-        if wagger not in wagging_dict:
-            wagging_dict[wagger] = set([waggee])
-        else:
-            wagging_dict[wagger].add(waggee)
-    return wagging_dict
+    꼬리흔들기 테이블로부터 WaggingIndex 를 생성 (매칭 한 번에 한 번만 호출)
+    """
+    return WaggingIndex(waggings, participant_ids)
 
 
-def get_wagging_score(team_list, waggings) -> tuple[list]:
+def get_wagging_score(
+    team_list, waggings, wagging_index=None, config: MatchingConfig = None
+) -> tuple[list]:
     """
     모든 팀의 꼬리흔들기 점수를 담은 리스트 반환
 
@@ -68,33 +165,43 @@ def get_wagging_score(team_list, waggings) -> tuple[list]:
 
         - weight: 꼬리흔들기가 팀 매칭에 반영되었을 경우 부여할 가중치 점수 (1 이상)
 
+        - wagging_index: 미리 생성한 WaggingIndex (없으면 waggings 로부터 생성)
+
+        - config: 매칭 설정 (기본값: DEFAULT_CONFIG, exact_scoring 이면 팀별 점수를 반올림하지 않음)
+
     return:
         - wagging_score = [0.34, 0.12, 0.56, ...] 모든 참가자들의 wagging 점수
         - wagging_score_per_team = [] 팀별 wagging 점수
     """
-    wagging_dict = _get_wagging_dict(waggings)
+    config = config or DEFAULT_CONFIG
+    if wagging_index is None:
+        wagging_index = compile_wagging_index(
+            waggings, [member["id"] for team in team_list for member in team]
+        )
+
+    # 참가자 번호 순서의 팀 번호 배열로 변환 후 인덱스 조회로 적중 횟수 계산
+    assignment = np.full(len(wagging_index), -1, dtype=np.int64)
+    for team_idx, team in enumerate(team_list):
+        for member in team:
+            assignment[wagging_index.index[member["id"]]] = team_idx
+    hits = wagging_index.count_hits(assignment)
+
     wagging_score = []  # 모든 참가자들의 꼬리 흔들기 점수를 저장
     wagging_score_per_team = []  # 팀 별로 꼬리흔들기 매칭 성공률을 저장
 
     for team in team_list:
 
-        # 팀 멤버마다 꼬리 흔들기가 적중된 횟수 저장
-        wagging_count = {member["id"]: 0 for member in team}
-
-        for id in wagging_count.keys():
-            waggees = wagging_dict.get(id, set())
-
-            for other_id in wagging_count.keys():
-                if id == waggees:
-                    continue
-                if other_id in waggees:
-                    wagging_count[id] += 1
+        # 팀 멤버마다 꼬리 흔들기가 적중된 횟수
+        wagging_count = [
+            int(hits[wagging_index.index[member["id"]]]) for member in team
+        ]
 
-        wagging_score.extend(wagging_count.values())
+        wagging_score.extend(wagging_count)
         team_size = len(team)
         pair_count = team_size * (team_size - 1) // 2
-        wagging_score_per_team.append(
-            round(sum(wagging_count.values()) / (pair_count * 2), 2) * 100
-        )
+        team_rate = sum(wagging_count) / (pair_count * 2)
+        if not config.exact_scoring:
+            team_rate = round(team_rate, 2)
+        wagging_score_per_team.append(team_rate * 100)
 
     return wagging_score, wagging_score_per_team